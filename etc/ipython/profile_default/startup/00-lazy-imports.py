@@ -0,0 +1,9 @@
+# Bind np, pd, plt, ... to lazily loaded modules so the prompt comes up without
+# paying for them; see IPYTHON_LAZY_MODULES and %lazyimports (lib/ipylazy.py)
+try:
+    import ipylazy as _ipylazy
+except ImportError:
+    pass
+else:
+    _ipylazy.load_ipython_extension(get_ipython())
+    del _ipylazy
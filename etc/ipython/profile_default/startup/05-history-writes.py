@@ -0,0 +1,9 @@
+# WAL mode and batched background writes for history.sqlite, plus periodic
+# compaction of old sessions (lib/ipyhistwriter.py)
+try:
+    import ipyhistwriter as _ipyhistwriter
+except ImportError:
+    pass
+else:
+    _ipyhistwriter.load_ipython_extension(get_ipython())
+    del _ipyhistwriter
@@ -0,0 +1,9 @@
+# Deduplicated, frecency-ranked full-text index of input history (lib/ipyhistory.py):
+# feeds auto-suggestions and the %hsearch magic
+try:
+    import ipyhistory as _ipyhistory
+except ImportError:
+    pass
+else:
+    _ipyhistory.load_ipython_extension(get_ipython())
+    del _ipyhistory
@@ -0,0 +1,9 @@
+# %chrono / %%chrono: repeated timing with percentiles, a latency histogram and
+# allocation counts, kept in chrono_timers for comparison (lib/ipychrono.py)
+try:
+    import ipychrono as _ipychrono
+except ImportError:
+    pass
+else:
+    _ipychrono.load_ipython_extension(get_ipython())
+    del _ipychrono
@@ -1,53 +1,692 @@
+import dis
+import gc
+import inspect
 import logging
+import os
+import sys
+import threading
 import time
-from collections import namedtuple
+import tracemalloc
+import weakref
+from array import array
+from collections import deque, namedtuple
+from operator import itemgetter
 from decimal import Decimal, getcontext
 
-logging.basicConfig(level=logging.DEBUG)
+try:
+    import resource
+except ImportError:  # not on Windows
+    resource = None
+
 logger = logging.getLogger(__name__)
 
 __all__ = [
     'Mark',
+    'MemorySample',
     'CHRONO_STARTED_MESSAGE',
     'CHRONO_STOPPED_MESSAGE',
     'CHRONO_RUNNING_MESSAGE',
     'CHRONO_STARTED_GLYPH',
     'CHRONO_STOPPED_GLYPH',
     'CHRONO_DEFAULT_PRECISION',
+    'CALIBRATION_SAMPLES',
+    'CALIBRATION_CHANNEL_SAMPLES',
+    'CALIBRATION_FLOOR_PERCENTILE',
+    'Calibration',
+    'calibrate',
+    'MEMORY_DEFAULT_FRAMES',
+    'MEMORY_DEFAULT_TOP',
+    'MEMORY_DEFAULT_SAMPLE_EVERY',
+    'MemoryChannel',
+    'ResourceSample',
+    'ResourceChannel',
+    'resource_delta',
+    'percentile',
+    'percentiles',
+    'HISTOGRAM_BUCKETS',
+    'TimingStats',
+    'MARK_DTYPE',
+    'mark_columns',
+    'mark_intervals',
+    'note_stats',
+    'SHARED_DEFAULT_SLOTS',
+    'SHARED_DEFAULT_NAMES',
+    'SHARED_NAME_BYTES',
+    'SharedStats',
     'Chronograph',
     "Timers",
     'timers',
+    'TRACER_MAX_FUNCTIONS',
+    'FunctionTracer',
+    'GC_TIMER_PREFIX',
+    'GCMonitor',
 ]
 
 Mark = namedtuple('Mark', ['time', 'note'])
+MemorySample = namedtuple('MemorySample', ['current', 'peak', 'top'])
+Calibration = namedtuple('Calibration', ['clock', 'overhead', 'floor', 'resolution', 'samples'])
+ResourceSample = namedtuple('ResourceSample', ['user', 'system', 'voluntary', 'involuntary',
+                                               'read_chars', 'write_chars', 'read_bytes', 'write_bytes'])
 
 CHRONO_STARTED_MESSAGE = "Started"
 CHRONO_STOPPED_MESSAGE = "Stopped"
 CHRONO_RUNNING_MESSAGE = "Running"
 
 CHRONO_STARTED_GLYPH = "\N{HOURGLASS WITH FLOWING SAND}"
-CHRONO_STOPPED_GLYPH = "\N{HOUEFT SIGN}"
+CHRONO_STOPPED_GLYPH = "\N{HOURGLASS}"
 
 CHRONO_DEFAULT_PRECISION = 5
 
+CALIBRATION_SAMPLES = 10_000
+# marks that sample memory or resources cost ~100x more; fewer of them do
+CALIBRATION_CHANNEL_SAMPLES = 1_000
+CALIBRATION_FLOOR_PERCENTILE = 99
+
+MEMORY_DEFAULT_FRAMES = 1
+MEMORY_DEFAULT_TOP = 5
+MEMORY_DEFAULT_SAMPLE_EVERY = 10
+MEMORY_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def format_bytes(size):
+    """Format a byte count (possibly negative) with a binary unit suffix."""
+    sign = "-" if size < 0 else ""
+    size = abs(size)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024 or unit == "GiB":
+            break
+        size /= 1024
+    return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+
+
+def percentile(sorted_values, q):
+    """Return the ``q``-th percentile (0-100) of already sorted values.
+
+    Uses linear interpolation between closest ranks; None for no values.
+    """
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def percentiles(values, qs=(50, 90, 99)):
+    """Return ``{q: value}`` for each percentile in ``qs``."""
+    ordered = sorted(values)
+    return {q: percentile(ordered, q) for q in qs}
+
+
+HISTOGRAM_BUCKETS = 48
+
+
+class TimingStats:
+    """Running count/total/min/max plus a log2 histogram of durations.
+
+    Bucket ``i`` counts durations in ``[2**i, 2**(i+1))`` nanoseconds (bucket
+    0 also takes anything shorter), so memory stays fixed however many
+    samples are added and percentiles are estimated to within a factor of 2.
+    """
+
+    __slots__ = ('count', 'total', 'min', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.buckets = [0] * HISTOGRAM_BUCKETS
+
+    @staticmethod
+    def bucket(seconds):
+        return min(max(int(seconds * 1e9), 1).bit_length() - 1, HISTOGRAM_BUCKETS - 1)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+        self.buckets[self.bucket(seconds)] += 1
+
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        for attr, pick in (('min', min), ('max', max)):
+            values = [v for v in (getattr(self, attr), getattr(other, attr)) if v is not None]
+            setattr(self, attr, pick(values) if values else None)
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        return self
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def percentile(self, q):
+        """Estimate the ``q``-th percentile from the histogram, clamped to min/max.
+
+        Interpolates linearly inside the bucket that holds the rank.
+        """
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            if n and seen + n >= rank:
+                low = 2 ** i / 1e9
+                estimate = low + low * (rank - seen) / n
+                return min(max(estimate, self.min), self.max)
+            seen += n
+        return self.max
+
+    def histogram(self):
+        """Return ``(low, high, count)`` in seconds for every non-empty bucket."""
+        return [(2 ** i / 1e9, 2 ** (i + 1) / 1e9, n) for i, n in enumerate(self.buckets) if n]
+
+    def summary(self, qs=(50, 90, 99)):
+        return {'count': self.count, 'total': self.total, 'mean': self.mean, 'min': self.min,
+                'max': self.max, **{f'p{q}': self.percentile(q) for q in qs}}
+
+
+# Columnar marks: int64 nanosecond times plus int32 codes into a list of notes
+MARK_DTYPE = [('time', '<i8'), ('note', '<i4')]
+
+
+def mark_columns(mark_list):
+    """Split marks into ``(seconds, codes, notes)`` column arrays.
+
+    ``seconds`` is an ``array('d')`` of mark times and ``codes`` an
+    ``array('i')`` of indexes into ``notes``, the distinct notes in order
+    of first appearance.  Both arrays expose the buffer protocol, so NumPy
+    and Arrow can wrap them without copying.
+    """
+    seconds = array('d', map(itemgetter(0), mark_list))
+    # dict.fromkeys keeps first-appearance order, and both passes stay in C
+    index = {note: code for code, note in enumerate(dict.fromkeys(map(itemgetter(1), mark_list)))}
+    codes = array('i', map(index.__getitem__, map(itemgetter(1), mark_list)))
+    return seconds, codes, list(index)
+
+
+def mark_intervals(marks):
+    """Nanoseconds between consecutive rows of a MARK_DTYPE array, as int64."""
+    import numpy as np
+    return np.diff(marks['time'])
+
+
+def note_stats(marks, notes, qs=(50, 90, 99)):
+    """Per-note statistics of the intervals ending at each mark, vectorized.
+
+    Takes a MARK_DTYPE array and its notes, as returned by
+    Chronograph.to_numpy.  Returns ``{note: summary}`` with the keys of
+    TimingStats.summary, in seconds, and exact percentiles.
+    """
+    import numpy as np
+    deltas = mark_intervals(marks) / 1e9
+    codes = marks['note'][1:]
+    # a stable sort of small ints is a radix sort: groups each note's intervals together
+    order = np.argsort(codes, kind='stable')
+    deltas, codes = deltas[order], codes[order]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else np.array([], int)
+    ends = np.r_[starts[1:], len(codes)]
+    stats = {}
+    for code, start, end in zip(codes[starts], starts, ends):
+        group = deltas[start:end]
+        count, total = int(end - start), float(group.sum())
+        stats[notes[code]] = {'count': count, 'total': total, 'mean': total / count,
+                              'min': float(group.min()), 'max': float(group.max()),
+                              **{f'p{q}': float(v) for q, v in zip(qs, np.percentile(group, qs))}}
+    return stats
+
+
+# tracemalloc is process-wide: channels share it, and the first one to find
+# it stopped starts it and the last one to close stops it again
+_tracing_lock = threading.Lock()
+_tracing_channels = weakref.WeakSet()
+_tracing_started = False
+
+
+def _read_traced_memory():
+    """Return the current traced size, folding the peak since the last read
+    into every channel's own peak.  Call with ``_tracing_lock`` held."""
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    for channel in _tracing_channels:
+        channel._peak = max(channel._peak, peak)
+    return current
+
+
+class MemoryChannel:
+    """tracemalloc-backed memory sampling for a Chronograph.
+
+    Every mark records the current traced size and the peak reached since
+    the previous mark.  The top allocation sites are only diffed every
+    ``sample_every`` marks, because taking a snapshot walks every traced
+    block and would otherwise dominate the cost of ``set_mark``.  The mark
+    time is taken before sampling, so snapshot cost lands in the following
+    section's duration.
+
+    Any number of channels can be open at once.  tracemalloc's own peak is
+    reset on every read and folded into each open channel's peak, so one
+    channel's marks don't hide a spike from another.  Channels are only
+    weakly registered; a Chronograph closes its own when it is collected.
+    """
+
+    def __init__(self, frames=MEMORY_DEFAULT_FRAMES, top=MEMORY_DEFAULT_TOP,
+                 sample_every=MEMORY_DEFAULT_SAMPLE_EVERY):
+        global _tracing_started
+        self.top = top
+        self.sample_every = max(1, sample_every)
+        self._count = 0
+        self._snapshot = None
+        self._peak = 0
+        with _tracing_lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(frames)
+                _tracing_started = True
+            self._peak = _read_traced_memory()
+            _tracing_channels.add(self)
+
+    def sample(self):
+        with _tracing_lock:
+            current = _read_traced_memory()
+            peak, self._peak = self._peak, current
+        top = None
+        if self.top and self._count % self.sample_every == 0:
+            snapshot = tracemalloc.take_snapshot().filter_traces(MEMORY_SNAPSHOT_FILTERS)
+            if self._snapshot is not None:
+                top = [(str(stat.traceback), stat.size_diff, stat.count_diff)
+                       for stat in snapshot.compare_to(self._snapshot, "lineno")[:self.top]]
+            self._snapshot = snapshot
+        self._count += 1
+        return MemorySample(current, peak, top)
+
+    def close(self):
+        global _tracing_started
+        self._snapshot = None
+        with _tracing_lock:
+            _tracing_channels.discard(self)
+            if not _tracing_channels and _tracing_started:
+                if tracemalloc.is_tracing():
+                    tracemalloc.stop()
+                _tracing_started = False
+
+
+_PROC_IO_FIELDS = {b'rchar': 'read_chars', b'wchar': 'write_chars',
+                   b'read_bytes': 'read_bytes', b'write_bytes': 'write_bytes'}
+
+
+class ResourceChannel:
+    """getrusage and /proc/<self>/io sampling for a Chronograph.
+
+    Each mark records cumulative user and system CPU seconds, voluntary and
+    involuntary context switches, and I/O counters.  Chronograph.resources
+    turns consecutive samples into per-section deltas.  ``read_chars`` and
+    ``write_chars`` count bytes through read/write syscalls, page cache
+    included.  ``read_bytes`` and ``write_bytes`` count what reached
+    storage.  The I/O fields are None where /proc isn't available.
+
+    ``scope`` is "process", or "thread" for the calling thread only
+    (Linux).  Use "thread" when other threads would blur the numbers.  The
+    /proc file stays open, so a sample costs one pread and one getrusage
+    call.
+    """
+
+    def __init__(self, scope="process"):
+        thread = scope == "thread"
+        self.who = getattr(resource, 'RUSAGE_THREAD', None) if thread else getattr(resource, 'RUSAGE_SELF', None)
+        if resource is None or self.who is None:
+            raise ValueError(f"resource usage for scope {scope!r} isn't available on this platform")
+        try:
+            self._io = os.open(f"/proc/{'thread-self' if thread else 'self'}/io", os.O_RDONLY)
+        except OSError:
+            self._io = None
+        self._finalizer = weakref.finalize(self, os.close, self._io) if self._io is not None else None
+        self._own_chars = 0
+
+    def _io_counters(self):
+        if self._io is None:
+            return {}
+        data = os.pread(self._io, 4096, 0)
+        counters = {}
+        for line in data.splitlines():
+            key, _, value = line.partition(b':')
+            if key in _PROC_IO_FIELDS:
+                counters[_PROC_IO_FIELDS[key]] = int(value)
+        # rchar includes our own earlier reads of this file; leave them out
+        counters['read_chars'] = counters.get('read_chars', 0) - self._own_chars
+        self._own_chars += len(data)
+        return counters
+
+    def sample(self):
+        usage = resource.getrusage(self.who)
+        io = self._io_counters()
+        return ResourceSample(usage.ru_utime, usage.ru_stime, usage.ru_nvcsw, usage.ru_nivcsw,
+                              io.get('read_chars'), io.get('write_chars'),
+                              io.get('read_bytes'), io.get('write_bytes'))
+
+    def close(self):
+        if self._finalizer is not None:
+            self._finalizer()
+        self._io = None
+
+
+def resource_delta(before, after):
+    """Field-by-field ``after - before`` of two ResourceSamples (None stays None)."""
+    return ResourceSample(*(None if a is None or b is None else b - a for a, b in zip(before, after)))
+
+
+SHARED_DEFAULT_SLOTS = 64
+SHARED_DEFAULT_NAMES = 64
+SHARED_NAME_BYTES = 64
+
+# Layout, in int64 words: a header, then one region per slot (owner pid,
+# registered name count, then the entries).  An entry is a nul-padded
+# name followed by count, total/min/max in ns and the histogram buckets.
+_SHARED_MAGIC = 0x6f6e6f726863  # "chrono"
+_SHARED_HEADER = 4
+_SLOT_HEADER = 2
+_NAME_WORDS = SHARED_NAME_BYTES // 8
+_COUNT, _TOTAL, _MIN, _MAX, _BUCKETS = range(_NAME_WORDS, _NAME_WORDS + 5)
+_ENTRY_WORDS = _BUCKETS + HISTOGRAM_BUCKETS
+_NO_MIN = 2 ** 63 - 1
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _close_shared(words, shm):
+    words.release()
+    shm.close()
+
+
+class SharedStats:
+    """TimingStats for many processes in one multiprocessing.shared_memory block.
+
+    The block has ``slots`` fixed-size regions.  The first time a process
+    records, it claims a free slot (or the slot of a process that has
+    exited, keeping its totals), and from then on it is the only writer
+    there.  Copies of the object in the same process share that slot.
+    Updates are plain stores into its own slot, with no locks or messages.
+    A claim is a store of the pid.  Two processes racing for the same free
+    slot within microseconds could both take it, so processes start their
+    search at different slots.  A name is published by writing it out and
+    only then bumping the slot's name count.
+
+    ``stats`` reads every slot and merges per name, at any time and from
+    any process.  Reads aren't synchronized with writers, so an entry
+    being updated right then may be off by that one sample.
+
+    Create the block in the parent (``SharedStats()``) and pass the object
+    to workers.  Forked children use the inherited mapping, and pickling
+    attaches by name.  The creator should ``unlink`` it when done.
+    """
+
+    def __init__(self, name=None, slots=SHARED_DEFAULT_SLOTS, names=SHARED_DEFAULT_NAMES, create=None):
+        from multiprocessing import shared_memory
+        self.owner = name is None if create is None else create
+        if self.owner:
+            size = 8 * (_SHARED_HEADER + slots * (_SLOT_HEADER + names * _ENTRY_WORDS))
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self.words = self.shm.buf.cast('q')
+            self.words[1], self.words[2] = slots, names
+            self.words[0] = _SHARED_MAGIC
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.words = self.shm.buf.cast('q')
+            if self.words[0] != _SHARED_MAGIC:
+                _close_shared(self.words, self.shm)
+                raise ValueError(f"shared memory {name!r} does not hold SharedStats")
+        self.slots, self.names = self.words[1], self.words[2]
+        # every copy (unpickled in a worker, inherited by a fork) has to let go
+        # of its view before SharedMemory.__del__ closes the mapping under it
+        self._finalizer = weakref.finalize(self, _close_shared, self.words, self.shm)
+        self._pid = None
+        self._base = None
+        self._index = {}
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def __reduce__(self):
+        return type(self), (self.shm.name, self.slots, self.names, False)
+
+    def _slot_base(self, slot):
+        return _SHARED_HEADER + slot * (_SLOT_HEADER + self.names * _ENTRY_WORDS)
+
+    def _entry(self, base, i):
+        return base + _SLOT_HEADER + i * _ENTRY_WORDS
+
+    def _entry_name(self, entry):
+        raw = bytes(self.shm.buf[8 * entry:8 * entry + SHARED_NAME_BYTES])
+        return raw.rstrip(b"\0").decode("utf-8", "replace")
+
+    def _claim(self):
+        pid = os.getpid()
+        words = self.words
+        bases = [self._slot_base((pid + k) % self.slots) for k in range(self.slots)]
+        # another copy in this process (one per unpickled task) may hold a slot already
+        own = [base for base in bases if words[base] == pid]
+        free = [base for base in bases if words[base] == 0]
+        stale = [base for base in bases if words[base] not in (0, pid) and not _pid_alive(words[base])]
+        if not own and not free and not stale:
+            raise RuntimeError(f"all {self.slots} SharedStats slots are taken")
+        base = (own + free + stale)[0]
+        words[base] = pid
+        self._pid, self._base = pid, base
+        self._load_index()
+        return base
+
+    def _load_index(self):
+        base = self._base
+        self._index = {self._entry_name(self._entry(base, i)): i
+                       for i in range(min(self.words[base + 1], self.names))}
+
+    def _register(self, name):
+        base, words = self._base, self.words
+        i = words[base + 1]
+        if i >= self.names:
+            raise RuntimeError(f"SharedStats slot is full ({self.names} names)")
+        entry = self._entry(base, i)
+        data = name.encode("utf-8")[:SHARED_NAME_BYTES]
+        self.shm.buf[8 * entry:8 * entry + SHARED_NAME_BYTES] = data.ljust(SHARED_NAME_BYTES, b"\0")
+        words[entry + _COUNT:entry + _ENTRY_WORDS] = array('q', [0] * (_ENTRY_WORDS - _COUNT))
+        words[entry + _MIN] = _NO_MIN
+        words[base + 1] = i + 1
+        self._index[name] = i
+        return i
+
+    def record(self, name, seconds):
+        if self._pid != os.getpid():
+            self._claim()
+        i = self._index.get(name)
+        if i is None:
+            self._load_index()
+            i = self._index.get(name)
+        if i is None:
+            i = self._register(name)
+        entry = self._entry(self._base, i)
+        words = self.words
+        ns = int(seconds * 1e9)
+        words[entry + _COUNT] += 1
+        words[entry + _TOTAL] += ns
+        if ns < words[entry + _MIN]:
+            words[entry + _MIN] = ns
+        if ns > words[entry + _MAX]:
+            words[entry + _MAX] = ns
+        words[entry + _BUCKETS + TimingStats.bucket(seconds)] += 1
+
+    def stats(self):
+        """Return ``{name: TimingStats}`` merged over every slot."""
+        merged = {}
+        words = self.words
+        for slot in range(self.slots):
+            base = self._slot_base(slot)
+            if not words[base]:
+                continue
+            for i in range(min(words[base + 1], self.names)):
+                entry = self._entry(base, i)
+                if not words[entry + _COUNT]:
+                    continue
+                stats = TimingStats()
+                stats.count = words[entry + _COUNT]
+                stats.total = words[entry + _TOTAL] / 1e9
+                stats.min = words[entry + _MIN] / 1e9
+                stats.max = words[entry + _MAX] / 1e9
+                stats.buckets = words[entry + _BUCKETS:entry + _ENTRY_WORDS].tolist()
+                name = self._entry_name(entry)
+                if name in merged:
+                    merged[name].merge(stats)
+                else:
+                    merged[name] = stats
+        return merged
+
+    def close(self):
+        self._finalizer()
+
+    def unlink(self):
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        if self.owner:
+            self.unlink()
+
+
+def _close_channels(channels):
+    for channel in channels:
+        channel.close()
+    channels.clear()
+
 
 class Chronograph:
     start_time: float = 0
     elapsed_tine: float = 0
     is_running: bool = False
     mark_list = []
+    memory_list = []
+    memory_channel = None
+    resource_list = []
+    resource_channel = None
+    calibration = None
+    correct_bias = False
+    memory_options = {}
+    resource_options = {}
+    clock = staticmethod(time.monotonic)
 
-    def __init__(self, start=True, description=CHRONO_STARTED_MESSAGE):
-        self.set_mark(description, time.monotonic())
+    def __init__(self, start=True, description=CHRONO_STARTED_MESSAGE, memory=False, clock=None,
+                 resources=False, calibrated=False):
+        if clock is not None:
+            self.clock = clock
+        self.mark_list = []
+        self.memory_list = []
+        self.resource_list = []
+        # channels hold process-wide state; close them when a Chronograph is dropped unclosed
+        self._channels = []
+        self._finalizer = weakref.finalize(self, _close_channels, self._channels)
+        if memory:
+            self.enable_memory(**(memory if isinstance(memory, dict) else {}))
+        if resources:
+            self.enable_resources(**(resources if isinstance(resources, dict) else {}))
+        if calibrated:
+            self.calibrate(correct_bias=calibrated == "correct")
+        self.set_mark(description, self.clock())
         if start:
             self.start_time = self.mark_list[-1].time
             self.is_running = True
         else:
             self.is_running = False
-            del self.mark_list[-1]
+            self._drop_last_mark()
+
+    def enable_memory(self, **kwargs):
+        """Record tracemalloc memory samples alongside every subsequent mark.
+
+        Keyword arguments are passed to MemoryChannel.  Marks set before the
+        channel was enabled have no memory sample.
+        """
+        if self.memory_channel is None:
+            self.memory_channel = MemoryChannel(**kwargs)
+            self._channels.append(self.memory_channel)
+            self.memory_options = kwargs
+            self.memory_list = [None] * len(self.mark_list)
+            self._recalibrate()
+        return self
+
+    def disable_memory(self):
+        if self.memory_channel is not None:
+            self.memory_channel.close()
+            self._channels.remove(self.memory_channel)
+            self.memory_channel = None
+            self._recalibrate()
+        return self
+
+    def calibrate(self, refresh=False, correct_bias=None):
+        """Attach the calibration for this Chronograph's clock and channels.
+
+        Measured once per clock and channel configuration, since memory and
+        resource sampling make up most of a mark's cost when enabled.
+        Enabling or disabling a channel later calibrates again.  With a
+        calibration, ``report`` flags sections under its noise floor.
+        With ``correct_bias`` also set, ``intervals`` and ``sections``
+        subtract the per-mark overhead, clamped at zero.  Passing
+        ``calibrated="correct"`` to the constructor does both.
+        """
+        self.calibration = calibrate(
+            self.clock, refresh=refresh,
+            memory=(self.memory_options or True) if self.memory_channel is not None else False,
+            resources=(self.resource_options or True) if self.resource_channel is not None else False)
+        if correct_bias is not None:
+            self.correct_bias = correct_bias
+        return self.calibration
+
+    def _recalibrate(self):
+        if self.calibration is not None:
+            self.calibrate()
+
+    def _bias(self):
+        return self.calibration.overhead if self.correct_bias and self.calibration is not None else 0.0
+
+    def enable_resources(self, **kwargs):
+        """Record CPU, context-switch and I/O counters alongside every subsequent mark.
+
+        Keyword arguments are passed to ResourceChannel.
+        """
+        if self.resource_channel is None:
+            self.resource_channel = ResourceChannel(**kwargs)
+            self._channels.append(self.resource_channel)
+            self.resource_options = kwargs
+            self.resource_list.extend([None] * (len(self.mark_list) - len(self.resource_list)))
+            self._recalibrate()
+        return self
+
+    def disable_resources(self):
+        if self.resource_channel is not None:
+            self.resource_channel.close()
+            self._channels.remove(self.resource_channel)
+            self.resource_channel = None
+            self._recalibrate()
+        return self
 
     def start(self):
-        self.set_mark("started", time.monotonic())
+        self.set_mark("started", self.clock())
         self.start_time = self.mark_list[-1].time
         self.is_running = True
         return self
@@ -56,48 +695,244 @@ class Chronograph:
         return self.is_running
 
     def elapsed(self, description=""):
-        self.set_mark("_elapsed_", time.monotonic())
+        self.set_mark("_elapsed_", self.clock())
         self.elapsed_tine = self.mark_list[-1].time - self.start_time
         if not description == "":
-            self.mark_list[-1].note = description
+            self.mark_list[-1] = self.mark_list[-1]._replace(note=description)
         if description == "":
-            del self.mark_list[-1]
+            self._drop_last_mark()
         return self.elapsed_tine
 
-    def set_mark(self, description, mark_time=time.monotonic()):
+    def set_mark(self, description, mark_time=None):
+        if mark_time is None:
+            mark_time = self.clock()
         self.mark_list.append(Mark(mark_time, description))
+        if self.resource_channel is not None:
+            self.resource_list.append(self.resource_channel.sample())
+        if self.memory_channel is not None:
+            self.memory_list.append(self.memory_channel.sample())
         return mark_time
 
+    def _drop_last_mark(self):
+        del self.mark_list[-1]
+        if len(self.memory_list) > len(self.mark_list):
+            del self.memory_list[-1]
+        if len(self.resource_list) > len(self.mark_list):
+            del self.resource_list[-1]
+
     def stop(self, description=CHRONO_STOPPED_MESSAGE):
-        _t = self.set_mark(description, time.monotonic())
+        _t = self.set_mark(description, self.clock())
         self.is_running = False
         return _t
 
     def reset(self):
-        self.elapsed_tine = time.monotonic() - self.start_time
+        self.elapsed_tine = self.clock() - self.start_time
         is_running = False
         return self
 
     def marks(self, precision=CHRONO_DEFAULT_PRECISION):
         getcontext().prec = precision
-        return [Mark(Decimal(m).time, m.note) for m in self.mark_list]
+        return [Mark(+Decimal(m.time), m.note) for m in self.mark_list]
+
+    def to_numpy(self):
+        """Return ``(marks, notes)``: a MARK_DTYPE structured array and its notes.
+
+        Times are int64 nanoseconds on the Chronograph's clock; the ``note``
+        field indexes ``notes``.
+        """
+        import numpy as np
+        seconds, codes, notes = mark_columns(self.mark_list)
+        marks = np.empty(len(codes), dtype=MARK_DTYPE)
+        marks['time'] = np.rint(np.frombuffer(seconds, dtype=np.float64) * 1e9)
+        marks['note'] = np.frombuffer(codes, dtype=np.int32)
+        return marks, notes
+
+    def to_arrow(self):
+        """Return the marks as a pyarrow Table.
+
+        ``time`` is int64 nanoseconds and ``note`` is dictionary-encoded, so
+        each distinct note is stored once.
+        """
+        import numpy as np
+        import pyarrow as pa
+        seconds, codes, notes = mark_columns(self.mark_list)
+        times = np.rint(np.frombuffer(seconds, dtype=np.float64) * 1e9).astype(np.int64)
+        note = pa.DictionaryArray.from_arrays(pa.array(np.frombuffer(codes, dtype=np.int32)),
+                                              pa.array(notes, pa.string()))
+        return pa.table({'time': pa.array(times), 'note': note})
+
+    def to_parquet(self, path, **kwargs):
+        """Write the marks to a Parquet file; keyword arguments go to pyarrow.parquet.write_table."""
+        import pyarrow.parquet as pq
+        pq.write_table(self.to_arrow(), path, **kwargs)
+
+    def intervals(self, last=None):
+        """Return the durations between consecutive marks, optionally only the ``last`` n."""
+        marks = self.mark_list
+        first = 1 if last is None else max(1, len(marks) - last)
+        bias = self._bias()
+        if bias:
+            return [max(0.0, marks[i].time - marks[i - 1].time - bias) for i in range(first, len(marks))]
+        return [marks[i].time - marks[i - 1].time for i in range(first, len(marks))]
+
+    def running_time(self):
+        """Elapsed seconds without adding a mark, safe to call from another thread."""
+        if self.is_running:
+            return self.clock() - self.start_time
+        marks = self.mark_list
+        return marks[-1].time - self.start_time if marks else 0
+
+    def sections(self):
+        """Yield (note, seconds, memory) for each interval between marks.
+
+        ``memory`` is the MemorySample taken at the closing mark of the
+        section, or None when memory tracking was off at that point.
+        ``seconds`` has the calibrated bias removed when ``correct_bias`` is set.
+        """
+        bias = self._bias()
+        for i in range(1, len(self.mark_list)):
+            memory = self.memory_list[i] if i < len(self.memory_list) else None
+            seconds = self.mark_list[i].time - self.mark_list[i - 1].time
+            yield self.mark_list[i].note, max(0.0, seconds - bias) if bias else seconds, memory
+
+    def resources(self):
+        """Return a ResourceSample delta per section (aligned with ``sections``).
+
+        A section gets None unless both of its marks have a sample.
+        """
+        samples = self.resource_list
+        return [resource_delta(samples[i - 1], samples[i])
+                if i < len(samples) and samples[i] is not None and samples[i - 1] is not None else None
+                for i in range(1, len(self.mark_list))]
+
+    def report(self, precision=CHRONO_DEFAULT_PRECISION):
+        """Return a text table of each section's duration, resource and memory use.
+
+        With resources on, CPU time is shown as user+system seconds and as a
+        share of the section's wall time.  Near 100% means CPU-bound (on one
+        core).  A low share with many voluntary context switches means the
+        section mostly waited, on I/O or locks.
+
+        When calibrated, sections shorter than the noise floor are starred:
+        their time is mostly the cost of setting the marks.
+        """
+        lines = []
+        indent = " " * (precision + 11)
+        usage = self.resources()
+        bias = self._bias()
+        floor = self.calibration.floor if self.calibration is not None else None
+        flagged = False
+        for (note, seconds, memory), delta in zip(self.sections(), usage):
+            below = floor is not None and seconds + bias < floor
+            flagged = flagged or below
+            columns = [f"{seconds:>{precision + 8}.{precision}f}s{'*' if below else ' '}"]
+            details = []
+            if delta is not None:
+                cpu = delta.user + delta.system
+                share = f"{cpu / seconds * 100:>4.0f}%" if seconds > 0 else "    -"
+                columns.append(f"cpu {delta.user:.3f}u+{delta.system:.3f}s {share}")
+                columns.append(f"ctx {delta.voluntary:>5}v {delta.involuntary:>4}i")
+                if delta.read_chars is not None:
+                    columns.append(f"io {format_bytes(delta.read_chars):>10} r {format_bytes(delta.write_chars):>10} w")
+            if memory is not None:
+                columns.append(f"{format_bytes(memory.current):>10}")
+                columns.append(f"peak {format_bytes(memory.peak):>10}")
+                details = [f"{indent}{format_bytes(size_diff):>10}  {count_diff:+d} blocks  {location}"
+                           for location, size_diff, count_diff in memory.top or ()]
+            columns.append(note)
+            lines.append("  ".join(columns))
+            lines.extend(details)
+        if flagged:
+            calibration = self.calibration
+            lines.append(f"* below the {calibration.floor * 1e9:.0f} ns noise floor"
+                         f" (one mark costs ~{calibration.overhead * 1e9:.0f} ns"
+                         f"{', subtracted' if bias else ''})")
+        return "\n".join(lines)
+
+
+_calibrations = {}
+
+
+def _options_key(options):
+    if not options:
+        return None
+    return tuple(sorted(options.items())) if isinstance(options, dict) else ()
+
+
+def calibrate(clock=time.monotonic, samples=None, refresh=False, memory=False, resources=False):
+    """Measure the cost of Chronograph.set_mark with ``clock`` on this machine.
+
+    Sets ``samples`` marks back to back, so every interval is pure
+    instrumentation: the clock call, the Mark tuple, the append and the
+    call itself, plus the memory and resource sampling when ``memory`` or
+    ``resources`` enable those channels (as the Chronograph arguments of
+    the same name).  The allocation-site snapshots a memory channel takes
+    every ``sample_every`` marks are left out: they cost in proportion to
+    the traced heap, not a fixed amount per mark.  ``samples`` defaults to
+    CALIBRATION_SAMPLES, or CALIBRATION_CHANNEL_SAMPLES with channels.
+    ``overhead`` is the median interval, the bias every measured section
+    carries.  ``floor`` is its CALIBRATION_FLOOR_PERCENTILE, below which a
+    section can't be told apart from the instrumentation.  ``resolution``
+    is the clock's own, from time.get_clock_info where known.  Results are
+    cached per clock and channel configuration; ``refresh`` measures again.
+    """
+    if memory:
+        # snapshots grow with the traced heap rather than adding a fixed bias
+        memory = {key: value for key, value in (memory if isinstance(memory, dict) else {}).items()
+                  if key not in ('top', 'sample_every')}
+        memory['top'] = 0
+    key = (clock, _options_key(memory), _options_key(resources))
+    calibration = _calibrations.get(key)
+    if calibration is not None and not refresh:
+        return calibration
+    if samples is None:
+        samples = CALIBRATION_CHANNEL_SAMPLES if memory or resources else CALIBRATION_SAMPLES
+    for count in (min(samples, 1000), samples):
+        chronograph = Chronograph(clock=clock, memory=memory, resources=resources)
+        set_mark = chronograph.set_mark
+        try:
+            for _ in range(count):
+                set_mark("")
+        finally:
+            chronograph.disable_memory()
+            chronograph.disable_resources()
+    intervals = sorted(chronograph.intervals())
+    name = getattr(clock, '__name__', repr(clock))
+    try:
+        resolution = time.get_clock_info(name).resolution
+    except ValueError:
+        resolution = min((i for i in intervals if i > 0), default=None)
+    calibration = _calibrations[key] = Calibration(
+        name, percentile(intervals, 50), percentile(intervals, CALIBRATION_FLOOR_PERCENTILE), resolution, samples)
+    return calibration
 
 
 class Timers:
     timer_list = {}
 
-    def __init__(self, name="", add_internal=True):
+    def __init__(self, name="", add_internal=True, memory=False, shared=None, resources=False):
+        self.memory = memory
+        self.resources = resources
+        self.shared = shared
+        self.timer_list = {}
+        self.stats_list = {}
         if add_internal:
             self.timer_list = {"_internal_": Chronograph()}
 
-    def add_timer(self, name):
-        self.timer_list[name] = Chronograph()
+    def add_timer(self, name, memory=None, resources=None):
+        self.timer_list[name] = Chronograph(memory=self.memory if memory is None else memory,
+                                            resources=self.resources if resources is None else resources)
 
     def start_timer(self, name):
         self.timer_list[name].start()
 
     def stop_timer(self, name):
-        self.timer_list[name].stop()
+        """Stop timer ``name`` and record the section since its start under the same name."""
+        timer = self.timer_list[name]
+        was_running = timer.is_running
+        timer.stop()
+        if was_running:
+            self.record(name, timer.mark_list[-1].time - timer.start_time)
 
     def reset_timer(self, name):
         self.timer_list[name].reset()
@@ -117,17 +952,420 @@ class Timers:
     def marks(self, name, precision=CHRONO_DEFAULT_PRECISION):
         return self.timer_list[name].marks(precision)
 
+    def report(self, name, precision=CHRONO_DEFAULT_PRECISION):
+        return self.timer_list[name].report(precision)
+
     def timers(self):
         return self.timer_list
 
+    def add_stats(self, name):
+        """Add an aggregate-only entry: TimingStats instead of a mark list."""
+        return self.stats_list.setdefault(name, TimingStats())
+
+    def record(self, name, seconds):
+        stats = self.stats_list.get(name)
+        if stats is None:
+            stats = self.add_stats(name)
+        stats.add(seconds)
+        if self.shared is not None:
+            self.shared.record(name, seconds)
+
+    def get_stats(self, name):
+        return self.stats_list[name]
+
+    def merged(self):
+        """Stats across processes when ``shared`` (a SharedStats) is set, else this process's."""
+        return self.shared.stats() if self.shared is not None else self.stats_list
+
+    def top(self, count=10, key='total'):
+        """Return the ``count`` entries of ``merged()`` with the largest ``key`` as (name, summary)."""
+        summaries = [(name, stats.summary()) for name, stats in self.merged().items()]
+        summaries.sort(key=lambda item: item[1][key] or 0, reverse=True)
+        return summaries[:count]
+
 
 timers = Timers()
 
+if os.environ.get("CHRONO_CALIBRATE"):
+    calibrate()
+
+
+TRACER_MAX_FUNCTIONS = 10_000
+TRACER_OTHER = "<other>"
+_RESUMABLE = inspect.CO_GENERATOR | inspect.CO_COROUTINE | inspect.CO_ASYNC_GENERATOR
+
+
+def _module_roots(modules):
+    """Return ``[(module name, path, is package)]`` for importable ``modules``."""
+    import importlib.util
+    roots = []
+    for name in modules:
+        module = sys.modules.get(name)
+        path = getattr(module, "__file__", None)
+        locations = getattr(module, "__path__", None)
+        if path is None and locations is None:
+            try:
+                spec = importlib.util.find_spec(name)
+            except (ImportError, ValueError):
+                spec = None
+            if spec is None:
+                continue
+            path, locations = spec.origin, spec.submodule_search_locations
+        if locations:
+            roots.extend((name, os.path.abspath(location), True) for location in locations)
+        elif path:
+            roots.append((name, os.path.abspath(path), False))
+    return roots
+
+
+class FunctionTracer:
+    """Deterministic per-function call counts and times for chosen modules.
+
+    On Python 3.12+ this uses ``sys.monitoring`` (PEP 669).  Code outside
+    ``modules`` returns DISABLE from its first event, so the interpreter
+    stops reporting it and untraced code runs at full speed.  Older
+    Pythons fall back to ``sys.setprofile`` (and ``threading.setprofile``
+    for new threads).  That fallback sees every call, and drops the
+    untraced ones after a dict lookup.
+
+    ``modules`` are module or package names.  A package includes its
+    submodules, and None traces everything.  Functions are keyed as
+    ``module:qualname``.  Per key the tracer keeps the call count, the
+    exclusive time (``exclusive``, in ns) and a TimingStats of inclusive
+    times in ``timers``.  Recursive calls add inclusive time only at the
+    outermost frame, so totals aren't counted twice.  A generator or
+    coroutine counts one call, but each resumption is timed separately.
+    Memory is bounded by ``max_functions`` keys.  Functions beyond that
+    are pooled under TRACER_OTHER.
+    """
+
+    def __init__(self, modules=None, timers=None, max_functions=TRACER_MAX_FUNCTIONS, use_monitoring=None):
+        self.roots = None if modules is None else _module_roots([modules] if isinstance(modules, str)
+                                                                else modules)
+        self.timers = Timers(add_internal=False) if timers is None else timers
+        self.max_functions = max_functions
+        self.use_monitoring = hasattr(sys, "monitoring") if use_monitoring is None else use_monitoring
+        self.calls = {}
+        self.exclusive = {}
+        self._keys = {}
+        self._threads = {}
+        self._offsets = {}
+        self._tool = None
+        self._previous_profile = None
+        self.active = False
+
+    def _key(self, code):
+        key = self._keys.get(code, False)
+        if key is not False:
+            return key
+        module = self._module(code.co_filename)
+        if module is None:
+            key = None
+        else:
+            key = f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+            if key not in self.calls and len(self.calls) >= self.max_functions:
+                key = TRACER_OTHER
+            self.calls.setdefault(key, 0)
+            self.exclusive.setdefault(key, 0)
+        self._keys[code] = key
+        return key
+
+    def _module(self, filename):
+        if filename == __file__:
+            return None
+        if self.roots is None:
+            return os.path.splitext(os.path.basename(filename))[0]
+        for name, path, package in self.roots:
+            if not package:
+                if filename == path:
+                    return name
+            elif filename.startswith(path + os.sep):
+                relative = os.path.splitext(filename[len(path) + 1:])[0].replace(os.sep, ".")
+                if relative == "__init__" or relative.endswith(".__init__"):
+                    relative = relative[:-len("__init__")].rstrip(".")
+                return f"{name}.{relative}" if relative else name
+        return None
+
+    def _thread(self):
+        state = self._threads.get(threading.get_ident())
+        if state is None:
+            state = self._threads[threading.get_ident()] = ([], {})
+        return state
+
+    def _enter(self, key, counted):
+        stack, depth = self._thread()
+        if counted:
+            self.calls[key] += 1
+        active = depth.get(key, 0)
+        depth[key] = active + 1
+        # [key, start ns, ns spent in traced callees, outermost activation of key]
+        stack.append([key, time.perf_counter_ns(), 0, not active])
+
+    def _exit(self, key):
+        now = time.perf_counter_ns()
+        stack, depth = self._thread()
+        if not depth.get(key):
+            return  # entered before tracing started
+        while True:
+            frame = stack.pop()
+            depth[frame[0]] -= 1
+            if frame[0] == key:
+                break
+        _, start, callees, outermost = frame
+        elapsed = now - start
+        self.exclusive[key] += elapsed - callees
+        if stack:
+            stack[-1][2] += elapsed
+        if outermost:
+            self.timers.record(key, elapsed / 1e9)
+
+    # sys.monitoring callbacks
+
+    def _on_start(self, code, offset):
+        key = self._key(code)
+        if key is None:
+            return sys.monitoring.DISABLE
+        self._enter(key, True)
+
+    def _on_resume(self, code, offset):
+        key = self._key(code)
+        if key is None:
+            return sys.monitoring.DISABLE
+        self._enter(key, False)
+
+    def _on_throw(self, code, offset, exception):
+        # PY_THROW can't be disabled: returning DISABLE would raise in the thrower
+        key = self._key(code)
+        if key is not None:
+            self._enter(key, False)
+
+    def _on_exit(self, code, offset, value):
+        key = self._key(code)
+        if key is None:
+            return sys.monitoring.DISABLE
+        self._exit(key)
+
+    def _on_unwind(self, code, offset, exception):
+        key = self._key(code)
+        if key is not None:
+            self._exit(key)
+
+    # sys.setprofile callback
+
+    def _first_offset(self, code):
+        # where a fresh generator or coroutine frame stands when first called:
+        # -1 before 3.11, the offset of its first RESUME after
+        offset = self._offsets.get(code)
+        if offset is None:
+            offset = self._offsets[code] = next(
+                (ins.offset for ins in dis.get_instructions(code) if ins.opname == "RESUME"), -1)
+        return offset
+
+    def _profile(self, frame, event, arg):
+        if event == "call":
+            code = frame.f_code
+            key = self._key(code)
+            if key is not None:
+                self._enter(key, not (code.co_flags & _RESUMABLE and frame.f_lasti > self._first_offset(code)))
+        elif event == "return":
+            key = self._key(frame.f_code)
+            if key is not None:
+                self._exit(key)
+
+    def start(self):
+        if self.active:
+            return self
+        if self.use_monitoring:
+            monitoring = sys.monitoring
+            for tool in [monitoring.PROFILER_ID] + [i for i in range(6) if i != monitoring.PROFILER_ID]:
+                try:
+                    monitoring.use_tool_id(tool, "chronograph")
+                except ValueError:
+                    continue
+                self._tool = tool
+                break
+            else:
+                raise RuntimeError("no free sys.monitoring tool id")
+            events = monitoring.events
+            for event, callback in ((events.PY_START, self._on_start), (events.PY_RESUME, self._on_resume),
+                                    (events.PY_THROW, self._on_throw), (events.PY_RETURN, self._on_exit),
+                                    (events.PY_YIELD, self._on_exit), (events.PY_UNWIND, self._on_unwind)):
+                monitoring.register_callback(self._tool, event, callback)
+            monitoring.set_events(self._tool, events.PY_START | events.PY_RESUME | events.PY_THROW
+                                  | events.PY_RETURN | events.PY_YIELD | events.PY_UNWIND)
+            # locations disabled by an earlier tracer may be wanted by this one
+            monitoring.restart_events()
+        else:
+            self._previous_profile = sys.getprofile()
+            threading.setprofile(self._profile)
+            sys.setprofile(self._profile)
+        self.active = True
+        return self
+
+    def stop(self):
+        if not self.active:
+            return self
+        if self._tool is not None:
+            monitoring = sys.monitoring
+            monitoring.set_events(self._tool, 0)
+            for event in (monitoring.events.PY_START, monitoring.events.PY_RESUME, monitoring.events.PY_THROW,
+                          monitoring.events.PY_RETURN, monitoring.events.PY_YIELD, monitoring.events.PY_UNWIND):
+                monitoring.register_callback(self._tool, event, None)
+            monitoring.free_tool_id(self._tool)
+            self._tool = None
+        else:
+            sys.setprofile(self._previous_profile)
+            threading.setprofile(None)
+        self._threads.clear()
+        self.active = False
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def stats(self):
+        """Return ``{key: summary}``: calls, exclusive seconds and the inclusive TimingStats summary."""
+        result = {}
+        for key, calls in self.calls.items():
+            if not calls:
+                continue
+            inclusive = self.timers.stats_list.get(key)
+            summary = inclusive.summary() if inclusive is not None else {}
+            summary.update(calls=calls, exclusive=self.exclusive[key] / 1e9)
+            result[key] = summary
+        return result
+
+    def report(self, count=20, key='exclusive'):
+        """Return the ``count`` functions with the largest ``key`` as a text table."""
+        rows = sorted(self.stats().items(), key=lambda item: item[1].get(key) or 0, reverse=True)[:count]
+        lines = [f"{'calls':>10} {'incl s':>10} {'excl s':>10} {'p99 incl':>10}  function"]
+        for name, summary in rows:
+            lines.append(f"{summary['calls']:>10} {summary.get('total', 0):>10.6f} {summary['exclusive']:>10.6f}"
+                         f" {summary.get('p99') or 0:>10.6f}  {name}")
+        return "\n".join(lines)
+
+
+GC_TIMER_PREFIX = "gc:gen"
+GC_LONG_PAUSES = 100
+
+
+class GCMonitor:
+    """Times every garbage collection through ``gc.callbacks``.
+
+    Each pause is recorded in ``timers`` (a Timers, the module's ``timers``
+    by default) as GC_TIMER_PREFIX plus the generation, so ``gc:gen2`` has
+    the count, total, extremes and histogram of full collections.  Objects
+    collected and left uncollectable are summed per generation in
+    ``collected`` and ``uncollectable``.
+
+    Pauses of at least ``warn_over`` seconds are kept, newest last, in
+    ``long_pauses`` as ``(monotonic time, generation, seconds)``.  They are
+    also reported as warnings on ``console``.  That defaults to dbg.py's
+    console, imported when monitoring starts, and falls back to this
+    module's logger if it can't be loaded.
+    """
+
+    def __init__(self, timers=None, warn_over=None, console=None):
+        self.timers = timers
+        self.warn_over = warn_over
+        self.console = console
+        self.collected = [0] * 3
+        self.uncollectable = [0] * 3
+        self.long_pauses = deque(maxlen=GC_LONG_PAUSES)
+        self.active = False
+        self._started = None
+        self._warning = False
+
+    def _timers(self):
+        return self.timers if self.timers is not None else timers
+
+    def _callback(self, phase, info):
+        if phase == "start":
+            self._started = time.perf_counter()
+            return
+        if self._started is None:
+            return
+        seconds = time.perf_counter() - self._started
+        self._started = None
+        generation = info.get("generation", 2)
+        self._timers().record(f"{GC_TIMER_PREFIX}{generation}", seconds)
+        self.collected[generation] += info.get("collected", 0)
+        self.uncollectable[generation] += info.get("uncollectable", 0)
+        if self.warn_over is not None and seconds >= self.warn_over:
+            self.long_pauses.append((time.monotonic(), generation, seconds))
+            self._warn(generation, seconds, info)
+
+    def _warn(self, generation, seconds, info):
+        if self._warning:
+            return
+        self._warning = True
+        try:
+            message = (f"gc generation {generation} paused for {seconds * 1e3:.1f} ms"
+                       f" ({info.get('collected', 0)} collected, {info.get('uncollectable', 0)} uncollectable)")
+            if self.console is not None:
+                self.console.warning(message)
+            else:
+                logger.warning(message)
+        finally:
+            self._warning = False
+
+    def start(self):
+        if not self.active:
+            if self.warn_over is not None and self.console is None:
+                try:
+                    from dbg import console
+                    self.console = console
+                except ImportError:
+                    pass
+            gc.callbacks.append(self._callback)
+            self.active = True
+        return self
+
+    def stop(self):
+        if self.active:
+            gc.callbacks.remove(self._callback)
+            self._started = None
+            self.active = False
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def summary(self):
+        """Return ``{generation: summary}`` with pause statistics and object counts."""
+        stats_list = self._timers().stats_list
+        result = {}
+        for generation in range(3):
+            stats = stats_list.get(f"{GC_TIMER_PREFIX}{generation}")
+            if stats is not None and stats.count:
+                result[generation] = {**stats.summary(), 'collected': self.collected[generation],
+                                      'uncollectable': self.uncollectable[generation]}
+        return result
+
+    def report(self):
+        lines = [f"{'gen':>3} {'pauses':>8} {'total ms':>10} {'p99 ms':>9} {'max ms':>9} {'collected':>10} {'uncollectable':>13}"]
+        for generation, summary in self.summary().items():
+            lines.append(f"{generation:>3} {summary['count']:>8} {summary['total'] * 1e3:>10.2f}"
+                         f" {summary['p99'] * 1e3:>9.3f} {summary['max'] * 1e3:>9.3f}"
+                         f" {summary['collected']:>10} {summary['uncollectable']:>13}")
+        return "\n".join(lines)
+
+
 if __name__ == '__main__':
+    import contextlib
+    import json
     from time import sleep
     from pprint import pprint
     from random import randint
 
+    logging.basicConfig(level=logging.DEBUG)
+
 
     def pause(seconds=10):
         _p = (randint(0, seconds))
@@ -144,4 +1382,22 @@ if __name__ == '__main__':
     logger.info(f"Added a mark at {timer.set_mark('Pause 4')}")
     pause()
     logger.info(f"Chronograph stopped at {timer.stop()}")
-    pprint(timer.mark_list)
\ No newline at end of file
+    pprint(timer.mark_list)
+
+    logger.info("Testing FunctionTracer")
+
+
+    @contextlib.contextmanager
+    def untraced():
+        yield
+
+
+    with FunctionTracer("json") as tracer:
+        # throwing into a generator outside the traced modules must not raise
+        try:
+            with untraced():
+                raise KeyError("thrown into an untraced generator")
+        except KeyError:
+            pass
+        json.dumps(timer.mark_list)
+    logger.info(f"FunctionTracer report:\n{tracer.report()}")
@@ -0,0 +1,207 @@
+import sys
+import time
+import timeit
+
+from IPython.core.magic import Magics, line_cell_magic, magics_class
+
+from chronograph import Chronograph, TimingStats, Timers, percentiles
+
+__all__ = [
+    "CHRONO_TIME_BUDGET",
+    "CHRONO_SAMPLE_TARGET",
+    "CHRONO_MIN_SAMPLES",
+    "CHRONO_MAX_SAMPLES",
+    "CHRONO_PERCENTILES",
+    "ChronoMagics",
+    "registry",
+    "load_ipython_extension",
+]
+
+CHRONO_TIME_BUDGET = 1.0
+CHRONO_SAMPLE_TARGET = 20e-6
+CHRONO_MIN_SAMPLES = 7
+CHRONO_MAX_SAMPLES = 100_000
+CHRONO_PERCENTILES = (50, 90, 99, 99.9)
+CHRONO_ALLOC_TOP = 3
+CHRONO_HISTOGRAM_WIDTH = 40
+CHRONO_NAME_WIDTH = 40
+
+# Results of every %chrono run, by name, for comparing across cells
+registry = Timers("chrono", add_internal=False)
+
+
+def format_duration(seconds):
+    if seconds is None:
+        return "-"
+    if seconds < 1e-6:
+        return f"{seconds * 1e9:.1f} ns"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.2f} \N{MICRO SIGN}s"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.3f} s"
+
+
+def format_histogram(stats, width=CHRONO_HISTOGRAM_WIDTH):
+    """Return a text bar chart of a TimingStats histogram, one line per bucket."""
+    buckets = stats.histogram()
+    if not buckets:
+        return []
+    most = max(n for _, _, n in buckets)
+    return [f"  {format_duration(low):>10} - {format_duration(high):<10}"
+            f" {'#' * max(1, round(n * width / most)):<{width}} {n}"
+            for low, high, n in buckets]
+
+
+def calibrate(timer, target=CHRONO_SAMPLE_TARGET):
+    """Return the loop count whose batch takes at least ``target`` seconds."""
+    number = 1
+    while True:
+        if timer.timeit(number) >= target or number >= 1 << 30:
+            return number
+        number *= 2
+
+
+def run(timer, number, budget=CHRONO_TIME_BUDGET, samples=None):
+    """Time batches of ``number`` loops; return the per-loop seconds of each batch.
+
+    Stops after ``samples`` batches, or when ``budget`` seconds are used up
+    (but not before CHRONO_MIN_SAMPLES), and never takes more than
+    CHRONO_MAX_SAMPLES.
+    """
+    results = []
+    limit = samples or CHRONO_MAX_SAMPLES
+    deadline = time.perf_counter() + budget
+    while len(results) < limit:
+        results.append(timer.timeit(number) / number)
+        if samples is None and len(results) >= CHRONO_MIN_SAMPLES and time.perf_counter() >= deadline:
+            break
+    return results
+
+
+def allocations(timer, number, chronograph):
+    """Run one batch under tracemalloc, marking ``chronograph`` around it.
+
+    Returns ``(net blocks per loop, bytes of traced peak over the baseline,
+    MemorySample)``.
+    """
+    chronograph.enable_memory(top=CHRONO_ALLOC_TOP, sample_every=1)
+    try:
+        # the first snapshot compiles its filters; keep that out of the diff
+        chronograph.set_mark("start tracing")
+        chronograph.set_mark("allocation baseline")
+        blocks = sys.getallocatedblocks()
+        timer.timeit(number)
+        blocks = sys.getallocatedblocks() - blocks
+        chronograph.set_mark("allocations")
+    finally:
+        chronograph.disable_memory()
+    baseline, sample = chronograph.memory_list[-2:]
+    return blocks / number, sample.peak - baseline.current, sample
+
+
+def comparison(names=None):
+    """Return a text table of registry entries, in the order they were first run."""
+    names = names or list(registry.stats_list)
+    width = max([len(name) for name in names] + [4])
+    lines = [f"{'name':<{width}} {'samples':>8} {'mean':>10} {'p50':>10} {'p99':>10} {'max':>10}"]
+    for name in names:
+        summary = registry.get_stats(name).summary()
+        lines.append(f"{name:<{width}} {summary['count']:>8} {format_duration(summary['mean']):>10}"
+                     f" {format_duration(summary['p50']):>10} {format_duration(summary['p99']):>10}"
+                     f" {format_duration(summary['max']):>10}")
+    return "\n".join(lines)
+
+
+@magics_class
+class ChronoMagics(Magics):
+    """``%chrono`` and ``%%chrono``: %timeit with a latency distribution.
+
+    Every batch of loops is one sample, timed with ``time.perf_counter``
+    (nanosecond resolution), and the loop count is calibrated so a batch
+    takes about CHRONO_SAMPLE_TARGET.  The output shows exact percentiles of
+    the samples, a log2 histogram and, with ``-m``, allocations per loop.
+    Each run's TimingStats is kept in ``registry`` under its name
+    (``chrono_timers`` in the user namespace), and ``%chrono -c`` compares
+    them.
+    """
+
+    @line_cell_magic
+    def chrono(self, line, cell=None):
+        """Time a statement and show its latency distribution.
+
+        Usage, in line and cell mode::
+
+          %chrono [-n LOOPS] [-r SAMPLES] [-t SECONDS] [-N NAME] [-a] [-m] statement
+          %%chrono [options] [setup]
+          statement
+
+          %chrono -c [NAME ...]   compare stored results (all of them by default)
+
+        -n: loops per sample (calibrated by default)
+        -r: number of samples (by default, as many as fit in -t)
+        -t: time budget in seconds (default CHRONO_TIME_BUDGET)
+        -N: name to store the result under (default: the statement)
+        -a: add to the stored result of the same name instead of replacing it
+        -m: also count allocations, over one extra traced batch
+        -c: compare the stored results named instead of timing anything
+        """
+        opts, stmt = self.parse_options(line, "n:r:t:N:amc", posix=False, strict=False,
+                                        preserve_non_opts=True)
+        if cell is None and ("c" in opts or not stmt.strip()):
+            names = stmt.split()
+            unknown = [name for name in names if name not in registry.stats_list]
+            if unknown:
+                print(f"no %chrono results named {', '.join(unknown)}")
+            elif not registry.stats_list:
+                print("no %chrono results yet")
+            else:
+                print(comparison(names))
+            return
+        setup = "pass"
+        if cell is not None:
+            setup, stmt = stmt.strip() or "pass", cell
+        transform = self.shell.transform_cell
+        timer = timeit.Timer(transform(stmt), transform(setup), timer=time.perf_counter,
+                             globals=self.shell.user_ns)
+        name = opts.get("N") or " ".join(stmt.split())[:CHRONO_NAME_WIDTH]
+
+        chronograph = Chronograph(clock=time.perf_counter)
+        number = int(opts["n"]) if "n" in opts else calibrate(timer)
+        chronograph.set_mark("calibrate")
+        samples = run(timer, number, float(opts.get("t", CHRONO_TIME_BUDGET)),
+                      int(opts["r"]) if "r" in opts else None)
+        chronograph.set_mark("measure")
+        memory = allocations(timer, number, chronograph) if "m" in opts else None
+        chronograph.stop()
+
+        stats = TimingStats()
+        for seconds in samples:
+            stats.add(seconds)
+        if "a" in opts and name in registry.stats_list:
+            registry.get_stats(name).merge(stats)
+        else:
+            registry.stats_list[name] = stats
+        self.show(name, number, samples, stats, chronograph, memory)
+
+    @staticmethod
+    def show(name, number, samples, stats, chronograph, memory):
+        sections = {note: seconds for note, seconds, _ in chronograph.sections()}
+        print(f"{name}: {len(samples)} samples of {number} loop{'s' if number > 1 else ''}"
+              f" in {format_duration(sections['measure'])}"
+              f" (calibrated in {format_duration(sections['calibrate'])})")
+        print(f"  mean {format_duration(stats.mean)}  min {format_duration(stats.min)}"
+              f"  max {format_duration(stats.max)}")
+        print("  " + "  ".join(f"p{q:g} {format_duration(value)}"
+                               for q, value in percentiles(samples, CHRONO_PERCENTILES).items()))
+        print("\n".join(format_histogram(stats)))
+        if memory is not None:
+            blocks, peak, sample = memory
+            print(f"  allocations: {blocks:+.1f} blocks/loop net, traced peak {peak:+,d} bytes over the batch")
+            for location, size_diff, count_diff in sample.top or ():
+                print(f"    {size_diff:+,d} bytes  {count_diff:+d} blocks  {location}")
+
+
+def load_ipython_extension(ipython):
+    ipython.register_magics(ChronoMagics)
+    ipython.push({"chrono_timers": registry}, interactive=False)
@@ -0,0 +1,280 @@
+import math
+import os
+import sqlite3
+import time
+
+__all__ = [
+    "HISTORY_INDEX_FILE",
+    "FRECENCY_HALF_LIFE_DAYS",
+    "HistoryIndex",
+    "IndexedAutoSuggest",
+    "load_ipython_extension",
+    "unload_ipython_extension",
+]
+
+HISTORY_INDEX_FILE = "history_index.sqlite"
+FRECENCY_HALF_LIFE_DAYS = 14
+SUGGEST_BATCH = 50
+SEARCH_SCAN = 2000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL UNIQUE,
+    count INTEGER NOT NULL DEFAULT 1,
+    last_used REAL NOT NULL,
+    score REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_score ON entries (score);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    source, content='entries', content_rowid='id', tokenize='{tokenizer}'
+);
+CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
+    INSERT INTO entries_fts(rowid, source) VALUES (new.id, new.source);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, source) VALUES ('delete', old.id, old.source);
+END;
+"""
+
+UPSERT = """
+INSERT INTO entries (source, count, last_used, score) VALUES (:source, :count, :when, :score)
+ON CONFLICT (source) DO UPDATE SET count = count + excluded.count,
+                                   last_used = max(last_used, excluded.last_used),
+                                   score = logaddexp(score, excluded.score)
+"""
+
+# Frecency is a sum of exponentially decaying weights, one per use.  Kept as
+# log(sum(exp(t_i / tau))) its ordering doesn't change as time passes, so it
+# can be stored and indexed instead of recomputed at query time.
+FRECENCY_TAU = FRECENCY_HALF_LIFE_DAYS * 86400 / math.log(2)
+
+
+def frecency(when, count=1):
+    return when / FRECENCY_TAU + math.log(count)
+
+
+def logaddexp(a, b):
+    high, low = max(a, b), min(a, b)
+    return high + math.log1p(math.exp(low - high))
+
+
+class HistoryIndex:
+    """Deduplicated, frecency-ranked full-text index of IPython input history.
+
+    Lives in its own SQLite file next to IPython's ``history.sqlite``, so the
+    index never takes locks on IPython's own database or changes its schema.
+    Every distinct input is one row with a use count and last-use time.  An
+    FTS5 table (trigram tokenizer where SQLite has it, so any substring of
+    three or more characters is indexed) is kept in sync by triggers.
+    ``sync`` catches up from IPython's database incrementally, and
+    ``add`` records new cells as they run.
+
+    Each entry carries an indexed frecency ``score``.  Searches first walk
+    the best-scored entries, which answers common terms after a few rows,
+    and only go to FTS5 when that finds too little.  A term with few
+    matches is exactly the case where FTS5 is cheap.
+    """
+
+    def __init__(self, path, history_file=None):
+        self.path = path
+        self.history_file = history_file
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.db.create_function("logaddexp", 2, logaddexp, deterministic=True)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        self.fts = self._create_fts()
+
+    def _create_fts(self):
+        for tokenizer in ("trigram", "unicode61"):
+            try:
+                self.db.executescript(FTS_SCHEMA.format(tokenizer=tokenizer))
+                return tokenizer
+            except sqlite3.OperationalError:
+                continue
+        return None
+
+    def close(self):
+        self.db.close()
+
+    def __len__(self):
+        return self.db.execute("SELECT count(*) FROM entries").fetchone()[0]
+
+    def add(self, source, when=None, count=1):
+        source = source.strip() if source else ""
+        if source:
+            when = time.time() if when is None else when
+            self.db.execute(UPSERT, {"source": source, "count": count, "when": when,
+                                     "score": frecency(when, count)})
+
+    def sync(self):
+        """Import history rows added since the last sync; return how many."""
+        if not self.history_file or not os.path.exists(self.history_file):
+            return 0
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'synced'").fetchone()
+        session, line = row[0].split(":") if row else (-1, -1)
+        history = sqlite3.connect(f"file:{self.history_file}?mode=ro", uri=True)
+        try:
+            rows = history.execute(
+                "SELECT h.session, h.line, h.source_raw, strftime('%s', s.start)"
+                " FROM history h LEFT JOIN sessions s ON s.session = h.session"
+                " WHERE (h.session, h.line) > (?, ?) ORDER BY h.session, h.line",
+                (int(session), int(line))).fetchall()
+        except sqlite3.OperationalError:
+            return 0
+        finally:
+            history.close()
+        if not rows:
+            return 0
+        with self.db:
+            self.db.execute("BEGIN")
+            for _, _, source, started in rows:
+                self.add(source, float(started) if started else time.time())
+            last = rows[-1]
+            self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('synced', ?)",
+                            (f"{last[0]}:{last[1]}",))
+        return len(rows)
+
+    def mark_synced(self, session, line):
+        """Record that history up to ``(session, line)`` is in the index already."""
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'synced'").fetchone()
+        if row is None or tuple(map(int, row[0].split(":"))) < (session, line):
+            self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('synced', ?)",
+                            (f"{session}:{line}",))
+
+    def rebuild(self):
+        with self.db:
+            self.db.execute("BEGIN")
+            self.db.execute("DELETE FROM entries")
+            self.db.execute("DELETE FROM meta WHERE key = 'synced'")
+        if self.fts:
+            self.db.execute("INSERT INTO entries_fts(entries_fts) VALUES ('rebuild')")
+        return self.sync()
+
+    def search(self, text, limit=20):
+        """Return ``(source, count)`` for inputs containing ``text``, best first."""
+        rows = self.db.execute(
+            "SELECT source, count FROM (SELECT source, count, score FROM entries ORDER BY score DESC"
+            " LIMIT :scan) WHERE instr(source, :text) ORDER BY score DESC LIMIT :limit",
+            {"text": text, "scan": SEARCH_SCAN, "limit": limit}).fetchall()
+        if len(rows) == limit or len(self) <= SEARCH_SCAN:
+            return rows
+        if self.fts == "trigram" and len(text) >= 3 or self.fts == "unicode61":
+            return self.db.execute(
+                "SELECT source, count FROM entries WHERE id IN"
+                " (SELECT rowid FROM entries_fts WHERE entries_fts MATCH :query)"
+                " ORDER BY score DESC LIMIT :limit",
+                {"query": '"' + text.replace('"', '""') + '"', "limit": limit}).fetchall()
+        return self.db.execute(
+            "SELECT source, count FROM entries WHERE instr(source, :text) ORDER BY score DESC LIMIT :limit",
+            {"text": text, "limit": limit}).fetchall()
+
+    def prefixed(self, prefix, limit=SUGGEST_BATCH, offset=0):
+        """Return inputs starting with ``prefix``, best first.
+
+        Uses a range scan on the unique index rather than a pattern match, so
+        it works for prefixes of any length.
+        """
+        return [row[0] for row in self.db.execute(
+            "SELECT source FROM entries WHERE source >= :low AND source < :high"
+            " ORDER BY score DESC LIMIT :limit OFFSET :offset",
+            {"low": prefix, "high": prefix + "\U0010ffff", "limit": limit, "offset": offset})]
+
+
+def _auto_suggest_base():
+    try:
+        from IPython.terminal.shortcuts.auto_suggest import NavigableAutoSuggestFromHistory
+        return NavigableAutoSuggestFromHistory
+    except ImportError:
+        return object
+
+
+class IndexedAutoSuggest(_auto_suggest_base()):
+    """IPython's navigable auto-suggestion, answered from a HistoryIndex.
+
+    The stock provider walks every history string on each keystroke.  This
+    one asks the index for inputs starting with the typed text, best ranked
+    first, and suggests the rest of the first line.  Up/down navigation
+    still works, stepping through the ranking.
+    """
+
+    def __init__(self, index):
+        super().__init__()
+        self.index = index
+
+    def _find_match(self, text, skip_lines, history, previous):
+        rank = -1
+        offset = 0
+        while True:
+            sources = self.index.prefixed(text, SUGGEST_BATCH, offset)
+            for source in sources:
+                rank += 1
+                if not previous and rank < skip_lines:
+                    continue
+                line = source.splitlines()[0] if source else ""
+                if len(line) > len(text):
+                    yield line[len(text):], rank
+                if previous and rank >= skip_lines:
+                    return
+            if len(sources) < SUGGEST_BATCH:
+                return
+            offset += SUGGEST_BATCH
+
+
+_state = {}
+
+
+def _record(result):
+    index = _state.get("index")
+    source = getattr(getattr(result, "info", None), "raw_cell", None)
+    if index is not None and source:
+        try:
+            index.add(source)
+            # the same row reaches history.sqlite; keep the next sync from counting it again
+            line = getattr(result, "execution_count", None)
+            if line is not None:
+                index.mark_synced(_state["session"](), line)
+        except sqlite3.Error:
+            pass
+
+
+def load_ipython_extension(ipython):
+    if "index" in _state:
+        return
+    history_file = str(ipython.history_manager.hist_file)
+    index_file = os.path.join(ipython.profile_dir.location, HISTORY_INDEX_FILE)
+    if history_file == ":memory:":
+        return
+    index = _state["index"] = HistoryIndex(index_file, history_file)
+    _state["session"] = lambda: ipython.history_manager.session_number
+    index.sync()
+    ipython.events.register("post_run_cell", _record)
+
+    if hasattr(ipython, "pt_app") and ipython.auto_suggest is not None:
+        if hasattr(ipython.auto_suggest, "disconnect"):
+            ipython.auto_suggest.disconnect()
+        ipython.auto_suggest = IndexedAutoSuggest(index)
+        if ipython.pt_app:
+            ipython.pt_app.auto_suggest = ipython.auto_suggest
+            ipython.auto_suggest.connect(ipython.pt_app)
+
+    def hsearch(line):
+        """Search input history (substring, frecency ranked): %hsearch TEXT"""
+        for source, count in index.search(line.strip()):
+            first, _, rest = source.partition("\n")
+            print(f"{count:>5}  {first}{' ...' if rest else ''}")
+
+    ipython.register_magic_function(hsearch, "line")
+
+
+def unload_ipython_extension(ipython):
+    index = _state.pop("index", None)
+    _state.pop("session", None)
+    if index is not None:
+        ipython.events.unregister("post_run_cell", _record)
+        index.close()
@@ -0,0 +1,194 @@
+import atexit
+import datetime
+import os
+import sqlite3
+import threading
+import time
+
+from IPython.core.history import HistorySavingThread
+
+__all__ = [
+    "HISTORY_BATCH_SIZE",
+    "HISTORY_FLUSH_INTERVAL",
+    "HISTORY_KEEP_DAYS",
+    "HISTORY_COMPACT_INTERVAL_DAYS",
+    "BatchedSavingThread",
+    "compact_history",
+    "load_ipython_extension",
+    "unload_ipython_extension",
+]
+
+HISTORY_BATCH_SIZE = 20
+HISTORY_FLUSH_INTERVAL = 2.0
+HISTORY_KEEP_DAYS = 30
+HISTORY_COMPACT_INTERVAL_DAYS = 7
+HISTORY_COMPACT_STAMP = "history.compact.stamp"
+HISTORY_BUSY_TIMEOUT = 30.0
+
+PRAGMAS = ("PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL")
+
+
+def _tune(db):
+    for pragma in PRAGMAS:
+        db.execute(pragma)
+
+
+class BatchedSavingThread(HistorySavingThread):
+    """Drop-in replacement for IPython's history saving thread.
+
+    The stock thread writes every cell in its own transaction, holding the
+    input cache lock for the whole write, so the next ``store_inputs`` on
+    the main thread waits for the disk.  This one swaps the caches out under
+    the locks and writes outside them.  It writes a batch when the cache
+    fills (``db_cache_size``) or every ``interval`` seconds, whichever is
+    first.  The connection runs in WAL mode with ``synchronous=NORMAL``, so
+    a commit appends to the log without an fsync.  The log is synced at
+    checkpoints.  A batch that can't be written because the database is
+    busy (for instance during compaction) goes back in the queue.
+    """
+
+    def __init__(self, history_manager, interval=HISTORY_FLUSH_INTERVAL):
+        super().__init__(history_manager)
+        self.name = "IPythonBatchedHistorySavingThread"
+        self.interval = interval
+
+    def run(self):
+        hm = self.history_manager
+        try:
+            self.db = sqlite3.connect(str(hm.hist_file), timeout=HISTORY_BUSY_TIMEOUT, **hm.connection_options)
+            _tune(self.db)
+            while True:
+                hm.save_flag.wait(self.interval)
+                hm.save_flag.clear()
+                self.flush()
+                if self.stop_now:
+                    self.db.close()
+                    return
+        except Exception as e:
+            print(f"The history saving thread hit an unexpected error ({e!r}). "
+                  "History will not be written to the database.")
+
+    def flush(self):
+        hm = self.history_manager
+        with hm.db_input_cache_lock:
+            inputs, hm.db_input_cache = hm.db_input_cache, []
+        with hm.db_output_cache_lock:
+            outputs, hm.db_output_cache = hm.db_output_cache, []
+        if not inputs and not outputs:
+            return
+        try:
+            self._write(inputs, outputs)
+        except sqlite3.IntegrityError:
+            # same recovery as HistoryManager.writeout_cache: move to a new session
+            hm.new_session(self.db)
+            print("ERROR! Session/line number was not unique in database."
+                  f" History logging moved to new session {hm.session_number}")
+            try:
+                self._write(inputs, [])
+            except sqlite3.IntegrityError:
+                pass
+        except sqlite3.OperationalError:
+            with hm.db_input_cache_lock:
+                hm.db_input_cache[:0] = inputs
+            with hm.db_output_cache_lock:
+                hm.db_output_cache[:0] = outputs
+
+    def _write(self, inputs, outputs):
+        session = self.history_manager.session_number
+        with self.db:
+            self.db.executemany("INSERT INTO history VALUES (?, ?, ?, ?)",
+                                [(session, *line) for line in inputs])
+            self.db.executemany("INSERT INTO output_history VALUES (?, ?, ?)",
+                                [(session, *line) for line in outputs])
+
+
+def compact_history(path, keep_days=HISTORY_KEEP_DAYS, current_session=None):
+    """Deduplicate and vacuum sessions older than ``keep_days``.
+
+    Of identical inputs, only the most recent one survives.  Output rows of
+    dropped inputs go with them, and so do old sessions left with no input.
+    Recent sessions are never touched, so ``%history`` line numbers there
+    stay valid.  Returns the number of history rows removed.
+    """
+    cutoff = (datetime.datetime.now() - datetime.timedelta(days=keep_days)).isoformat(" ")
+    db = sqlite3.connect(path, timeout=HISTORY_BUSY_TIMEOUT, isolation_level=None)
+    try:
+        _tune(db)
+        row = db.execute("SELECT max(session) FROM sessions WHERE start < ?", (cutoff,)).fetchone()
+        last_old = row[0] if row and row[0] is not None else None
+        if last_old is None:
+            return 0
+        if current_session is not None:
+            last_old = min(last_old, current_session - 1)
+        with db:
+            db.execute("BEGIN IMMEDIATE")
+            removed = db.execute(
+                "DELETE FROM history WHERE rowid IN (SELECT rowid FROM"
+                " (SELECT rowid, session, row_number() OVER"
+                "  (PARTITION BY source_raw ORDER BY session DESC, line DESC) AS newer FROM history)"
+                " WHERE newer > 1 AND session <= ?)", (last_old,)).rowcount
+            db.execute(
+                "DELETE FROM output_history WHERE session <= ? AND NOT EXISTS"
+                " (SELECT 1 FROM history h WHERE h.session = output_history.session"
+                "  AND h.line = output_history.line)", (last_old,))
+            db.execute(
+                "DELETE FROM sessions WHERE session <= ? AND NOT EXISTS"
+                " (SELECT 1 FROM history h WHERE h.session = sessions.session)", (last_old,))
+        if removed:
+            db.execute("VACUUM")
+        db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return removed
+    finally:
+        db.close()
+
+
+def _compact_due(stamp, interval_days):
+    try:
+        return time.time() - os.path.getmtime(stamp) > interval_days * 86400
+    except OSError:
+        return True
+
+
+def _compact_in_background(path, stamp, current_session):
+    def work():
+        try:
+            compact_history(path, current_session=current_session)
+        except sqlite3.Error:
+            return
+        with open(stamp, "w"):
+            pass
+
+    thread = threading.Thread(target=work, name="IPythonHistoryCompaction", daemon=True)
+    thread.start()
+    return thread
+
+
+_state = {}
+
+
+def load_ipython_extension(ipython, batch_size=HISTORY_BATCH_SIZE, interval=HISTORY_FLUSH_INTERVAL,
+                           compact_every_days=HISTORY_COMPACT_INTERVAL_DAYS):
+    hm = ipython.history_manager
+    if "thread" in _state or not hm.enabled or str(hm.hist_file) == ":memory:":
+        return
+    _tune(hm.db)
+    if hm.save_thread is not None:
+        hm.save_thread.stop()
+        atexit.unregister(hm.save_thread.stop)
+    hm.db_cache_size = max(hm.db_cache_size, batch_size)
+    thread = _state["thread"] = hm.save_thread = BatchedSavingThread(hm, interval)
+    thread.start()
+
+    stamp = os.path.join(ipython.profile_dir.location, HISTORY_COMPACT_STAMP)
+    if compact_every_days is not None and _compact_due(stamp, compact_every_days):
+        _compact_in_background(str(hm.hist_file), stamp, hm.session_number)
+
+
+def unload_ipython_extension(ipython):
+    thread = _state.pop("thread", None)
+    if thread is not None:
+        thread.stop()
+        atexit.unregister(thread.stop)
+        hm = ipython.history_manager
+        hm.save_thread = HistorySavingThread(hm)
+        hm.save_thread.start()
@@ -0,0 +1,169 @@
+import atexit
+import importlib.util
+import json
+import os
+import sys
+import time
+
+__all__ = [
+    "LAZY_MODULES",
+    "LAZY_TIMES_FILE",
+    "lazy_import",
+    "LazyImports",
+    "load_ipython_extension",
+]
+
+# alias=module pairs; a bare module name binds under its own name
+LAZY_MODULES = os.environ.get(
+    "IPYTHON_LAZY_MODULES",
+    "np=numpy,pd=pandas,plt=matplotlib.pyplot,rich,scipy,sympy,requests",
+)
+LAZY_TIMES_FILE = "lazy_imports.json"
+
+
+def _parse(spec):
+    modules = {}
+    for item in spec.split(","):
+        alias, _, name = item.strip().rpartition("=")
+        if name:
+            modules[alias or name.rpartition(".")[2]] = name
+    return modules
+
+
+class _TimedLoader:
+    """Wraps a module's loader and records how long executing it takes."""
+
+    def __init__(self, loader, times):
+        self.loader = loader
+        self.times = times
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        start = time.perf_counter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.times[module.__name__] = time.perf_counter() - start
+            module.__spec__.loader = module.__loader__ = self.loader
+
+
+def lazy_import(name, times=None):
+    """Return ``name`` as a module whose body runs on first attribute access.
+
+    Returns an already imported module as is, and None when the module isn't
+    installed.  For a dotted name the parent packages are imported now,
+    which is usually cheap next to the module itself (``matplotlib`` vs
+    ``matplotlib.pyplot``).  Load times land in ``times`` by module name.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.loader is None or not hasattr(spec.loader, "exec_module"):
+        return None
+    loader = _TimedLoader(spec.loader, {} if times is None else times)
+    spec.loader = importlib.util.LazyLoader(loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    parent, _, child = name.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+class LazyImports:
+    """Pre-bound, lazily loaded modules for an interactive namespace.
+
+    Each alias is bound to a module proxy (``importlib.util.LazyLoader``),
+    so the name exists from the first prompt but the import is paid only
+    when the module is first used, and not at all if it never is.  A later
+    ``import numpy`` gets the same proxy from ``sys.modules``.
+
+    Load times measured in this session are merged into ``times_file``,
+    so the report can say what startup saved on modules that weren't
+    touched, using what they cost last time they were.  Modules something
+    else imported first are bound as they are and reported as preloaded.
+    """
+
+    def __init__(self, modules=LAZY_MODULES, times_file=None):
+        self.modules = _parse(modules) if isinstance(modules, str) else dict(modules)
+        self.times_file = times_file
+        self.times = {}
+        self.known = self._load_known()
+        self.bound = {}
+        self.preloaded = set()
+        self.setup_time = 0.0
+
+    def _load_known(self):
+        try:
+            with open(self.times_file) as f:
+                return json.load(f)
+        except (OSError, TypeError, ValueError):
+            return {}
+
+    def install(self):
+        """Create the proxies; return ``{alias: module}`` for the installed ones."""
+        start = time.perf_counter()
+        for alias, name in self.modules.items():
+            if name in sys.modules:
+                self.preloaded.add(name)
+            module = lazy_import(name, self.times)
+            if module is not None:
+                self.bound[alias] = module
+        self.setup_time = time.perf_counter() - start
+        return self.bound
+
+    def save(self):
+        if self.times_file and self.times:
+            self.known.update(self.times)
+            with open(self.times_file, "w") as f:
+                json.dump(self.known, f, indent=1, sort_keys=True)
+
+    def report(self):
+        """Return a per-module table of load state and import time as text."""
+        # any attribute access on a proxy (even __name__) would load it
+        width = max([len(self.modules[alias]) for alias in self.bound] + [6])
+        lines = [f"{'alias':<8} {'module':<{width}} {'state':<9} {'ms':>9}"]
+        saved = later = 0.0
+        for alias in self.bound:
+            name = self.modules[alias]
+            if name in self.preloaded:
+                state, seconds = "preloaded", None
+            elif name in self.times:
+                state, seconds = "loaded", self.times[name]
+                saved += seconds
+                later += seconds
+            else:
+                state, seconds = "deferred", self.known.get(name)
+                saved += seconds or 0.0
+            ms = f"{seconds * 1e3:9.1f}" if seconds is not None else f"{'-':>9}"
+            lines.append(f"{alias:<8} {name:<{width}} {state:<9} {ms}")
+        missing = sorted(set(self.modules) - set(self.bound))
+        if missing:
+            lines.append(f"not installed: {', '.join(missing)}")
+        lines.append(f"setup {self.setup_time * 1e3:.1f} ms; kept ~{saved * 1e3:.0f} ms of imports off startup,"
+                     f" {later * 1e3:.0f} ms of it paid since on first use")
+        return "\n".join(lines)
+
+
+_state = {}
+
+
+def load_ipython_extension(ipython, modules=LAZY_MODULES):
+    if "lazy" in _state:
+        return
+    times_file = os.path.join(ipython.profile_dir.location, LAZY_TIMES_FILE)
+    lazy = _state["lazy"] = LazyImports(modules, times_file)
+    ipython.push(lazy.install(), interactive=False)
+    atexit.register(lazy.save)
+
+    def lazyimports(line):
+        """Show lazily imported modules and their import times: %lazyimports"""
+        print(lazy.report())
+
+    ipython.register_magic_function(lazyimports, "line")
@@ -1,3 +1,35 @@
+import zlib
+from collections import deque
+
+from chronograph import percentiles, timers
+
+try:
+    from PySide6.QtCore import QAbstractListModel, QEvent, QModelIndex, QObject, QPoint, QRect, Qt, QTimer
+    from PySide6.QtGui import QBrush, QColor, QKeySequence, QPainter, QPen, QShortcut
+    from PySide6.QtWidgets import (QAbstractItemView, QHeaderView, QListView, QSizePolicy, QTableWidget,
+                                   QTableWidgetItem, QVBoxLayout, QWidget)
+except ImportError:
+    from PyQt5.QtCore import QAbstractListModel, QEvent, QModelIndex, QObject, QPoint, QRect, Qt, QTimer
+    from PyQt5.QtGui import QBrush, QColor, QKeySequence, QPainter, QPen
+    from PyQt5.QtWidgets import (QAbstractItemView, QHeaderView, QListView, QShortcut, QSizePolicy,
+                                 QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget)
+
+CONSOLE_DEFAULT_MAX_LINES = 10000
+CONSOLE_SINK_INTERVAL_MS = 50
+CONSOLE_SINK_MAX_BATCH = 2000
+
+DASHBOARD_DEFAULT_FPS = 10
+DASHBOARD_WINDOW = 1000
+DASHBOARD_SPARK_WIDTH = 24
+DASHBOARD_COLUMNS = ("Timer", "State", "Elapsed", "Marks", "p50", "p90", "p99", "Recent")
+SPARK_GLYPHS = "\N{LOWER ONE EIGHTH BLOCK}\N{LOWER ONE QUARTER BLOCK}\N{LOWER THREE EIGHTHS BLOCK}" \
+               "\N{LOWER HALF BLOCK}\N{LOWER FIVE EIGHTHS BLOCK}\N{LOWER THREE QUARTERS BLOCK}" \
+               "\N{LOWER SEVEN EIGHTHS BLOCK}\N{FULL BLOCK}"
+
+DEBUG_OVERLAY_SHORTCUT = "Ctrl+Shift+D"
+DEBUG_OVERLAY_OUTLINE_ALPHA = 200
+DEBUG_OVERLAY_FILL_ALPHA = 24
+
 DEBUG_FILL_STYLE = "background-color: rgba(255, 0, 255, 0.2);"
 DEBUG_STYLESHEET = """
     QMainWindow {
@@ -17,37 +49,447 @@ DEBUG_STYLESHEET = """
     }
 """
 
+class LineBuffer:
+    """Fixed-capacity ring buffer of lines with O(1) append and indexing."""
+
+    def __init__(self, capacity=CONSOLE_DEFAULT_MAX_LINES):
+        self.capacity = max(1, capacity)
+        self._lines = [None] * self.capacity
+        self._start = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, row):
+        if not 0 <= row < self._count:
+            raise IndexError(row)
+        return self._lines[(self._start + row) % self.capacity]
+
+    def append(self, line):
+        """Append a line; return True if the oldest line was dropped to make room."""
+        end = (self._start + self._count) % self.capacity
+        self._lines[end] = line
+        if self._count == self.capacity:
+            self._start = (self._start + 1) % self.capacity
+            return True
+        self._count += 1
+        return False
+
+    def drop_front(self, count):
+        """Forget the ``count`` oldest lines."""
+        count = min(count, self._count)
+        for i in range(count):
+            self._lines[(self._start + i) % self.capacity] = None
+        self._start = (self._start + count) % self.capacity
+        self._count -= count
+
+    def clear(self):
+        self._lines = [None] * self.capacity
+        self._start = 0
+        self._count = 0
+
+
+class ConsoleModel(QAbstractListModel):
+    """List model over a LineBuffer; appends only notify about changed rows."""
+
+    def __init__(self, max_lines=CONSOLE_DEFAULT_MAX_LINES, parent=None):
+        super().__init__(parent)
+        self.lines = LineBuffer(max_lines)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.lines)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self.lines[index.row()]
+        return None
+
+    def append_lines(self, lines):
+        """Append several lines with one insert (and at most one remove) notification."""
+        lines = lines[-self.lines.capacity:]
+        if not lines:
+            return
+        overflow = len(self.lines) + len(lines) - self.lines.capacity
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            self.lines.drop_front(overflow)
+            self.endRemoveRows()
+        first = len(self.lines)
+        self.beginInsertRows(QModelIndex(), first, first + len(lines) - 1)
+        for line in lines:
+            self.lines.append(line)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.lines.clear()
+        self.endResetModel()
+
+
 class Console(QWidget):
-    def __init__(self, parent=None):
+    """Scrolling output console.
+
+    Lines live in a bounded ring buffer shown through a QListView with
+    uniform row heights, so only the visible rows are laid out and an append
+    costs the same with ten lines or ten thousand.  The view follows new
+    output while it is scrolled to the bottom.
+    """
+
+    def __init__(self, parent=None, max_lines=CONSOLE_DEFAULT_MAX_LINES):
         super().__init__(parent)
         # Create layout
         layout = QVBoxLayout(self)
-        
-        # Create scroll area for console output
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        
-        # Create widget to hold text
-        self.text_widget = QWidget()
-        self.text_layout = QVBoxLayout(self.text_widget)
-        
-        # Set up text display using label
-        self.text_display = QLabel()
-        self.text_display.setWordWrap(True)
-        self.text_display.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        self.text_layout.addWidget(self.text_display)
-        
-        # Add text widget to scroll area
-        self.scroll_area.setWidget(self.text_widget)
-        
-        # Add scroll area to main layout
-        layout.addWidget(self.scroll_area)
-        
+
+        # Create the model holding the console output
+        self.model = ConsoleModel(max_lines, self)
+
+        # Set up a virtualized view over the model
+        self.view = QListView()
+        self.view.setModel(self.model)
+        self.view.setUniformItemSizes(True)
+        self.view.setLayoutMode(QListView.Batched)
+        self.view.setWordWrap(False)
+        self.view.setSelectionMode(QListView.ExtendedSelection)
+        self.view.setEditTriggers(QListView.NoEditTriggers)
+
+        # Add view to main layout
+        layout.addWidget(self.view)
+
         # Set size policy
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        
+
+    def at_bottom(self):
+        scroll_bar = self.view.verticalScrollBar()
+        return scroll_bar.value() >= scroll_bar.maximum()
+
+    def append(self, text):
+        self.append_lines(text.splitlines() or [""])
+
+    def append_lines(self, lines):
+        follow = self.at_bottom()
+        self.model.append_lines(list(lines))
+        if follow:
+            self.view.scrollToBottom()
+
+    def clear(self):
+        self.model.clear()
+
+    def set_max_lines(self, max_lines):
+        lines = [self.model.lines[i] for i in range(len(self.model.lines))]
+        self.model.beginResetModel()
+        self.model.lines = LineBuffer(max_lines)
+        for line in lines[-self.model.lines.capacity:]:
+            self.model.lines.append(line)
+        self.model.endResetModel()
+
+
+class ConsoleSink(QObject):
+    """Thread-safe bridge from ConsoleMessages (or any writer) into a Console.
+
+    Any thread may call ``print`` or ``write``; those only append to a deque,
+    which is atomic and takes no lock.  A timer on the GUI thread drains the
+    deque every ``interval`` ms and hands the lines to the console as one
+    batch.  The batch is capped at ``max_batch`` lines so a flood can't
+    starve the event loop, and backlog that the console's ring buffer would
+    drop anyway is skipped and replaced by one summary line.  The deque
+    itself holds at most as many writes as the console holds lines, so a
+    producer that outruns the drain loses its oldest writes, counted in one
+    "dropped" line, instead of growing memory and lag without bound.
+
+    Create the sink on the GUI thread, then route a ConsoleMessages through
+    it with ``attach``.
+    """
+
+    def __init__(self, console, interval=CONSOLE_SINK_INTERVAL_MS, max_batch=CONSOLE_SINK_MAX_BATCH,
+                 parent=None):
+        super().__init__(parent or console)
+        self.console = console
+        self.max_batch = max_batch
+        self.pending = deque(maxlen=console.model.lines.capacity)
+        self.dropped = 0
+        self._partial = ""
+        self._attached = {}
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.drain)
+        self.timer.start(interval)
+
+    def write(self, text):
+        """File-like entry point; text may hold partial or multiple lines."""
+        if text:
+            self._append(text)
+        return len(text)
+
+    def _append(self, text):
+        pending = self.pending
+        if len(pending) == pending.maxlen:
+            self.dropped += 1
+        pending.append(text)
+
+    def flush(self):
+        pass
+
+    def print(self, *objects, sep=" ", end="\n", style=None, **kwargs):
+        """Duck-types ``rich.console.Console.print`` for ConsoleMessages."""
+        self._append(sep.join(str(o) for o in objects) + end)
+
+    def attach(self, messages):
+        """Send ``messages.console`` output (a ConsoleMessages) to this sink."""
+        if messages not in self._attached:
+            self._attached[messages] = messages.console
+            messages.console = self
+        return messages
+
+    def detach(self, messages):
+        if messages in self._attached:
+            messages.console = self._attached.pop(messages)
+
+    def drain(self):
+        """Move pending text into the console; runs on the GUI thread."""
+        if not self.pending:
+            return
+        chunks = []
+        pending = self.pending
+        dropped, self.dropped = self.dropped, 0
+        if dropped:
+            chunks.append(f"... {dropped} writes dropped ...\n")
+        for _ in range(min(len(pending), self.max_batch)):
+            chunks.append(pending.popleft())
+        lines = (self._partial + "".join(chunks)).split("\n")
+        self._partial = lines.pop()
+        limit = self.console.model.lines.capacity
+        if len(lines) > limit:
+            skipped = len(lines) - limit + 1
+            lines = [f"... {skipped} lines skipped ..."] + lines[skipped:]
+        if lines:
+            self.console.append_lines(lines)
+
+    def close(self):
+        self.timer.stop()
+        for messages in list(self._attached):
+            self.detach(messages)
+        while self.pending:
+            self.drain()
+        if self._partial:
+            self.console.append_lines([self._partial])
+            self._partial = ""
+
+
+def sparkline(values, width=DASHBOARD_SPARK_WIDTH):
+    """Render the last ``width`` values as a row of block glyphs."""
+    values = values[-width:]
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    scale = (len(SPARK_GLYPHS) - 1) / (high - low) if high > low else 0
+    return "".join(SPARK_GLYPHS[int((v - low) * scale)] for v in values)
+
+
+def format_seconds(seconds):
+    if seconds is None:
+        return ""
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} \N{MICRO SIGN}s"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.3f} s"
+
+
+class TimerDashboard(QWidget):
+    """Live table of the timers in a chronograph.Timers.
+
+    A QTimer refreshes the table at most ``fps`` times a second.  Each
+    refresh takes a cheap snapshot of every timer (running flag, mark count,
+    start time) and only rewrites rows whose snapshot changed, apart from
+    the elapsed cell of running timers.  Percentiles and the sparkline cover
+    the last DASHBOARD_WINDOW intervals between marks.
+    """
+
+    def __init__(self, parent=None, timer_registry=None, fps=DASHBOARD_DEFAULT_FPS):
+        super().__init__(parent)
+        self.timer_registry = timers if timer_registry is None else timer_registry
+        self._rows = {}
+        self._snapshots = {}
+
+        layout = QVBoxLayout(self)
+        self.table = QTableWidget(0, len(DASHBOARD_COLUMNS))
+        self.table.setHorizontalHeaderLabels(DASHBOARD_COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.table)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.set_fps(fps)
+
+    def set_fps(self, fps):
+        self.refresh_timer.start(max(1, int(1000 / max(fps, 0.1))))
+
+    def _set(self, row, column, text):
+        item = self.table.item(row, column)
+        if item is None:
+            item = QTableWidgetItem(text)
+            if column:
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            self.table.setItem(row, column, item)
+        elif item.text() != text:
+            item.setText(text)
+
+    def _remove_missing(self, names):
+        for row in sorted((r for n, r in self._rows.items() if n not in names), reverse=True):
+            self.table.removeRow(row)
+        self._snapshots = {n: snap for n, snap in self._snapshots.items() if n in names}
+        self._rows = {self.table.item(row, 0).text(): row for row in range(self.table.rowCount())}
+
+    def refresh(self):
+        chronographs = dict(self.timer_registry.timers())
+        if set(self._rows) - set(chronographs):
+            self._remove_missing(chronographs)
+        self.table.setUpdatesEnabled(False)
+        try:
+            for name, chronograph in chronographs.items():
+                row = self._rows.get(name)
+                if row is None:
+                    row = self._rows[name] = self.table.rowCount()
+                    self.table.insertRow(row)
+                    self._set(row, 0, name)
+                snapshot = (chronograph.is_running, len(chronograph.mark_list), chronograph.start_time)
+                if chronograph.is_running or snapshot != self._snapshots.get(name):
+                    self._set(row, 2, format_seconds(chronograph.running_time()))
+                if snapshot == self._snapshots.get(name):
+                    continue
+                self._snapshots[name] = snapshot
+                intervals = chronograph.intervals(DASHBOARD_WINDOW)
+                stats = percentiles(intervals)
+                self._set(row, 1, "running" if chronograph.is_running else "stopped")
+                self._set(row, 3, str(snapshot[1]))
+                for column, q in ((4, 50), (5, 90), (6, 99)):
+                    self._set(row, column, format_seconds(stats[q]))
+                self._set(row, 7, sparkline(intervals))
+        finally:
+            self.table.setUpdatesEnabled(True)
+
+
+class DebugOverlay(QWidget):
+    """Layout outlines for a whole window, painted by a single overlay widget.
+
+    Applying DEBUG_STYLESHEET restyles every widget in the tree and makes Qt
+    re-polish and re-layout all of them.  This overlay is one transparent,
+    mouse-transparent child stretched over ``target``.  Showing it walks the
+    tree once to collect widget rectangles, then draws them all in one
+    paintEvent, so toggling it never touches the widgets' own styles.
+
+    Each widget class gets a pen and brush colour derived from its name.
+    They are built once and shared by every overlay.  The rectangles are
+    recollected when ``target`` resizes or relayouts, or on ``invalidate()``.
+    """
+
+    _styles = {}
+
+    def __init__(self, target, fill=True):
+        super().__init__(target)
+        self.target = target
+        self.fill = fill
+        self._rects = None
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        self.setFocusPolicy(Qt.NoFocus)
+        target.installEventFilter(self)
+        self.hide()
+
+    @classmethod
+    def style_for(cls, widget_class):
+        """Return the cached ``(pen, brush)`` for a widget class."""
+        style = cls._styles.get(widget_class)
+        if style is None:
+            hue = zlib.crc32(widget_class.__name__.encode()) % 360
+            pen = QPen(QColor.fromHsv(hue, 255, 220, DEBUG_OVERLAY_OUTLINE_ALPHA))
+            pen.setCosmetic(True)
+            brush = QBrush(QColor.fromHsv(hue, 255, 255, DEBUG_OVERLAY_FILL_ALPHA))
+            style = cls._styles[widget_class] = (pen, brush)
+        return style
+
+    def invalidate(self):
+        self._rects = None
+        if self.isVisible():
+            self.update()
+
+    def eventFilter(self, watched, event):
+        if watched is self.target and event.type() in (QEvent.Resize, QEvent.LayoutRequest):
+            self.setGeometry(self.target.rect())
+            self.invalidate()
+        return False
+
+    def _collect(self):
+        rects = {}
+        origin = QPoint(0, 0)
+        for widget in self.target.findChildren(QWidget):
+            if widget is self or not widget.isVisible():
+                continue
+            rect = QRect(widget.mapTo(self.target, origin), widget.size()).adjusted(0, 0, -1, -1)
+            rects.setdefault(type(widget), []).append(rect)
+        return rects
+
+    def paintEvent(self, event):
+        if self._rects is None:
+            self._rects = self._collect()
+        painter = QPainter(self)
+        for widget_class, rects in self._rects.items():
+            pen, brush = self.style_for(widget_class)
+            painter.setPen(pen)
+            painter.setBrush(brush if self.fill else Qt.NoBrush)
+            painter.drawRects(rects)
+        painter.end()
+
+    def set_active(self, active=True):
+        if active:
+            self.setGeometry(self.target.rect())
+            self._rects = None
+            self.raise_()
+        self.setVisible(active)
+
+    def toggle(self):
+        self.set_active(not self.isVisible())
+
+
+def debug_overlay(window):
+    """Return the DebugOverlay attached to ``window``, creating it on first use."""
+    overlay = getattr(window, "_debug_overlay", None)
+    if overlay is None:
+        overlay = window._debug_overlay = DebugOverlay(window)
+    return overlay
+
+
+def toggle_debug_overlay(window):
+    debug_overlay(window).toggle()
+
+
+def install_debug_shortcut(window, sequence=DEBUG_OVERLAY_SHORTCUT):
+    """Bind ``sequence`` on ``window`` to toggle its debug overlay."""
+    shortcut = QShortcut(QKeySequence(sequence), window)
+    shortcut.activated.connect(lambda: toggle_debug_overlay(window))
+    return shortcut
+
 
 __all__ = [
+    "CONSOLE_DEFAULT_MAX_LINES",
+    "CONSOLE_SINK_INTERVAL_MS",
+    "CONSOLE_SINK_MAX_BATCH",
     "DEBUG_FILL_STYLE",
     "DEBUG_STYLESHEET",
+    "DEBUG_OVERLAY_SHORTCUT",
+    "LineBuffer",
+    "ConsoleModel",
+    "Console",
+    "ConsoleSink",
+    "DASHBOARD_DEFAULT_FPS",
+    "sparkline",
+    "TimerDashboard",
+    "DebugOverlay",
+    "debug_overlay",
+    "toggle_debug_overlay",
+    "install_debug_shortcut",
 ]
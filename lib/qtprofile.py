@@ -0,0 +1,174 @@
+import time
+from collections import deque
+
+from chronograph import Timers
+
+try:
+    from PySide6.QtCore import QEvent, QObject, QTimer
+    from PySide6.QtWidgets import QApplication
+except ImportError:
+    from PyQt5.QtCore import QEvent, QObject, QTimer
+    from PyQt5.QtWidgets import QApplication
+
+__all__ = [
+    "STALL_HEARTBEAT_MS",
+    "STALL_THRESHOLD",
+    "EventProfiler",
+    "InstrumentedApplication",
+    "instrument",
+]
+
+STALL_HEARTBEAT_MS = 10
+STALL_THRESHOLD = 0.050
+STALL_HISTORY = 200
+
+_event_names = None
+
+
+def event_name(event_type):
+    """Return a readable name for a QEvent type (enum member or int)."""
+    global _event_names
+    name = getattr(event_type, "name", None)
+    if isinstance(name, str):
+        return name
+    if _event_names is None:
+        _event_names = {int(v): k for k, v in vars(QEvent).items() if isinstance(v, QEvent.Type)}
+    return _event_names.get(int(event_type), str(int(event_type)))
+
+
+class EventProfiler(QObject):
+    """Event-loop latency, dispatch and paint timings for a Qt application.
+
+    Three kinds of numbers end up in ``registry``, a chronograph.Timers of
+    TimingStats entries:
+
+    ``dispatch:<Event>:<ReceiverClass>``
+        time spent delivering one event, timed around QApplication.notify
+    ``paint:<WidgetClass>``
+        the subset of dispatches that are paint events
+    ``stall``
+        how late a STALL_HEARTBEAT_MS heartbeat timer fired, i.e. how long
+        the event loop was blocked
+
+    Dispatch and paint timings need the application to route ``notify``
+    through the profiler, which InstrumentedApplication does.  For an app
+    that already exists, ``install`` can still add the stall heartbeat and an
+    application-wide event filter that counts events per type and class.
+    Stalls longer than ``stall_threshold`` are also kept, newest last, in
+    ``stalls`` as ``(monotonic time, seconds)``.
+    """
+
+    def __init__(self, registry=None, stall_threshold=STALL_THRESHOLD, heartbeat_ms=STALL_HEARTBEAT_MS,
+                 parent=None):
+        super().__init__(parent)
+        self.registry = Timers(add_internal=False) if registry is None else registry
+        self.stall_threshold = stall_threshold
+        self.heartbeat_ms = heartbeat_ms
+        self.stalls = deque(maxlen=STALL_HISTORY)
+        self.counts = {}
+        self.enabled = True
+        self._heartbeat = None
+        self._expected = None
+
+    def record(self, receiver, event_type, seconds):
+        receiver_class = type(receiver).__name__
+        name = event_name(event_type)
+        self.registry.record(f"dispatch:{name}:{receiver_class}", seconds)
+        if event_type == QEvent.Paint:
+            self.registry.record(f"paint:{receiver_class}", seconds)
+
+    def start_heartbeat(self):
+        if self._heartbeat is None:
+            self._heartbeat = QTimer(self)
+            self._heartbeat.timeout.connect(self._beat)
+        self._expected = time.perf_counter() + self.heartbeat_ms / 1000
+        self._heartbeat.start(self.heartbeat_ms)
+
+    def stop_heartbeat(self):
+        if self._heartbeat is not None:
+            self._heartbeat.stop()
+
+    def _beat(self):
+        now = time.perf_counter()
+        late = max(0.0, now - self._expected)
+        self._expected = now + self.heartbeat_ms / 1000
+        self.registry.record("stall", late)
+        if late >= self.stall_threshold:
+            self.stalls.append((time.monotonic(), late))
+
+    def eventFilter(self, watched, event):
+        key = (event_name(event.type()), type(watched).__name__)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        return False
+
+    def install(self, app=None, count_events=True):
+        """Start the heartbeat and, optionally, count events on an existing app."""
+        app = app or QApplication.instance()
+        if count_events:
+            app.installEventFilter(self)
+        self.start_heartbeat()
+        return self
+
+    def uninstall(self, app=None):
+        app = app or QApplication.instance()
+        app.removeEventFilter(self)
+        self.stop_heartbeat()
+
+    def reset(self):
+        self.registry.stats_list.clear()
+        self.stalls.clear()
+        self.counts.clear()
+
+    def report(self, count=10, key="total"):
+        """Return the ``count`` slowest handlers (by ``key``) and the stall summary as text."""
+        lines = [f"{'total ms':>10} {'max ms':>9} {'p99 ms':>9} {'calls':>8}  handler"]
+        handlers = [(name, summary) for name, summary in self.registry.top(count + 1, key) if name != "stall"]
+        for name, summary in handlers[:count]:
+            lines.append(f"{summary['total'] * 1e3:>10.2f} {summary['max'] * 1e3:>9.2f}"
+                         f" {summary['p99'] * 1e3:>9.2f} {summary['count']:>8}  {name}")
+        stall = self.registry.stats_list.get("stall")
+        if stall is not None and stall.count:
+            lines.append(f"event loop: p99 latency {stall.percentile(99) * 1e3:.2f} ms,"
+                         f" worst {stall.max * 1e3:.2f} ms,"
+                         f" {len(self.stalls)} stalls over {self.stall_threshold * 1e3:.0f} ms")
+        return "\n".join(lines)
+
+
+class InstrumentedApplication(QApplication):
+    """QApplication that times every event delivery into an EventProfiler.
+
+    Use it in place of QApplication (or mix ``notify`` into your own
+    subclass).  Timing is inclusive: an event that dispatches others
+    synchronously includes their time.
+    """
+
+    profiler = None
+
+    def __init__(self, *args, profiler=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.profiler = profiler or EventProfiler()
+        self.profiler.start_heartbeat()
+
+    def notify(self, receiver, event):
+        profiler = self.profiler
+        if profiler is None or not profiler.enabled:
+            return super().notify(receiver, event)
+        event_type = event.type()
+        start = time.perf_counter()
+        try:
+            return super().notify(receiver, event)
+        finally:
+            profiler.record(receiver, event_type, time.perf_counter() - start)
+
+
+def instrument(app=None, profiler=None):
+    """Attach an EventProfiler to ``app`` (the running QApplication by default).
+
+    An InstrumentedApplication already has one, which is returned as is.
+    Otherwise the profiler gets the stall heartbeat and the counting event
+    filter only.
+    """
+    app = app or QApplication.instance()
+    if isinstance(app, InstrumentedApplication):
+        return app.profiler
+    return (profiler or EventProfiler(parent=app)).install(app)
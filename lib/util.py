@@ -0,0 +1,496 @@
+import datetime
+import enum
+import functools
+import hashlib
+import itertools
+import math
+import os
+import pickle
+import sqlite3
+import struct
+import threading
+import time
+import weakref
+from collections import OrderedDict, namedtuple
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from pathlib import PurePath
+
+__all__ = [
+    "MEMO_MAX_ENTRIES",
+    "MEMO_DISK_MAX_BYTES",
+    "MEMO_CACHE_DIR",
+    "CacheInfo",
+    "stable_hash",
+    "MemoryTier",
+    "DiskTier",
+    "Memo",
+    "memoize",
+    "PMAP_CHUNK_TARGET",
+    "PMAP_MAX_CHUNK",
+    "pmap",
+]
+
+MEMO_MAX_ENTRIES = 1024
+MEMO_DISK_MAX_BYTES = 256 * 1024 * 1024
+MEMO_CACHE_DIR = os.environ.get(
+    "MEMO_CACHE_DIR", os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "memo")
+)
+MEMO_DISK_FILE = "memo.sqlite"
+MEMO_BUSY_TIMEOUT = 30.0
+
+PMAP_CHUNK_TARGET = 0.05
+PMAP_MAX_CHUNK = 4096
+PMAP_COST_SMOOTHING = 0.3
+
+MISSING = object()
+
+CacheInfo = namedtuple(
+    "CacheInfo",
+    ["hits", "misses", "disk_hits", "shared", "evictions", "disk_evictions", "expired", "size", "maxsize"],
+)
+
+
+def _encode(obj, out):
+    # type-tagged, length-prefixed, so different values can't produce the same bytes
+    if obj is None or obj is True or obj is False:
+        out.append(b"N" if obj is None else b"T" if obj else b"F")
+    elif isinstance(obj, enum.Enum):
+        out.append(b"E")
+        _encode(f"{type(obj).__module__}.{type(obj).__qualname__}", out)
+        _encode(obj.value, out)
+    elif isinstance(obj, int):
+        data = str(obj).encode()
+        out.append(b"i" + struct.pack("<I", len(data)) + data)
+    elif isinstance(obj, float):
+        out.append(b"f" + struct.pack("<d", obj) if not math.isnan(obj) else b"fnan")
+    elif isinstance(obj, str):
+        data = obj.encode("utf-8", "surrogatepass")
+        out.append(b"s" + struct.pack("<I", len(data)) + data)
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        data = bytes(obj)
+        out.append(b"b" + struct.pack("<I", len(data)) + data)
+    elif isinstance(obj, (tuple, list)):
+        out.append((b"t" if isinstance(obj, tuple) else b"l") + struct.pack("<I", len(obj)))
+        for item in obj:
+            _encode(item, out)
+    elif isinstance(obj, dict):
+        out.append(b"d" + struct.pack("<I", len(obj)))
+        for key, value in sorted(((stable_hash(k), v) for k, v in obj.items()), key=lambda item: item[0]):
+            out.append(key.encode())
+            _encode(value, out)
+    elif isinstance(obj, (set, frozenset)):
+        out.append(b"S" + struct.pack("<I", len(obj)))
+        out.extend(sorted(stable_hash(item).encode() for item in obj))
+    elif isinstance(obj, PurePath):
+        out.append(b"p")
+        _encode(str(obj), out)
+    elif isinstance(obj, (datetime.date, datetime.time, datetime.timedelta)):
+        out.append(b"D")
+        _encode(type(obj).__name__, out)
+        _encode(repr(obj), out)
+    elif hasattr(obj, "__dataclass_fields__"):
+        out.append(b"C")
+        _encode(f"{type(obj).__module__}.{type(obj).__qualname__}", out)
+        _encode({name: getattr(obj, name) for name in obj.__dataclass_fields__}, out)
+    else:
+        raise TypeError(f"no stable hash for {type(obj).__name__!r}; pass memoize a key function")
+
+
+def stable_hash(obj):
+    """Hex digest of ``obj`` that is the same in every process and run.
+
+    Unlike ``hash()``, it doesn't depend on PYTHONHASHSEED or object
+    identity.  It covers None, bools, numbers, strings, bytes, tuples,
+    lists, dicts, sets, paths, enums, dates and dataclasses, nested
+    arbitrarily.  Equal dicts and sets hash equally whatever their order.
+    Other types raise TypeError.
+    """
+    out = []
+    _encode(obj, out)
+    return hashlib.blake2b(b"".join(out), digest_size=20).hexdigest()
+
+
+class MemoryTier:
+    """Thread-safe LRU of ``key -> value`` with an optional per-entry TTL."""
+
+    def __init__(self, maxsize=MEMO_MAX_ENTRIES):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.evictions = 0
+        self.expired = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key, MISSING)
+            if entry is MISSING:
+                return MISSING
+            expires, value = entry
+            if expires is not None and expires <= time.monotonic():
+                del self.entries[key]
+                self.expired += 1
+                return MISSING
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        with self.lock:
+            self.entries[key] = (None if ttl is None else time.monotonic() + ttl, value)
+            self.entries.move_to_end(key)
+            while self.maxsize is not None and len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class DiskTier:
+    """Size-bounded SQLite store of pickled values, shared between processes.
+
+    Each entry records its pickled size and last access time.  When the
+    total goes over ``max_bytes``, the least recently used entries are
+    dropped until it fits.  Expiry uses wall-clock time, since entries
+    outlive the process.  The database runs in WAL mode, so readers in
+    other processes don't block a writer.
+
+    A forked child gets a connection of its own, since SQLite connections
+    can't cross a fork.  Database errors (a lock held past
+    MEMO_BUSY_TIMEOUT, say) make ``get`` a miss and ``set`` a no-op,
+    counted in ``errors``, so the cache never fails the call it serves.
+    """
+
+    def __init__(self, path=None, max_bytes=MEMO_DISK_MAX_BYTES):
+        self.path = path or os.path.join(MEMO_CACHE_DIR, MEMO_DISK_FILE)
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self.expired = 0
+        self.errors = 0
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._connect()
+        _open_disk_tiers.add(self)
+
+    def _connect(self):
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(self.path, timeout=MEMO_BUSY_TIMEOUT, check_same_thread=False,
+                                  isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                namespace TEXT NOT NULL,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires REAL,
+                accessed REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+            CREATE INDEX IF NOT EXISTS entries_namespace ON entries (namespace);
+        """)
+        self._size = self._total()
+
+    def _total(self):
+        return self.db.execute("SELECT coalesce(sum(size), 0) FROM entries").fetchone()[0]
+
+    def _reopen(self):
+        # closing the parent's connection here would drop the parent's locks
+        _inherited_connections.append(self.db)
+        self._connect()
+
+    def get(self, key):
+        now = time.time()
+        with self.lock:
+            try:
+                row = self.db.execute("SELECT value, expires FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return MISSING
+                if row[1] is not None and row[1] <= now:
+                    self.db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    self.expired += 1
+                    return MISSING
+                self.db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            except sqlite3.Error:
+                self.errors += 1
+                return MISSING
+        try:
+            return pickle.loads(row[0])
+        except Exception:
+            return MISSING
+
+    def set(self, key, value, namespace="", ttl=None):
+        """Store ``value``; return False if it can't be pickled or written."""
+        try:
+            data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False
+        now = time.time()
+        with self.lock:
+            try:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO entries (key, namespace, value, size, expires, accessed)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, namespace, data, len(data), None if ttl is None else now + ttl, now))
+                self._size += len(data)
+                if self._size > self.max_bytes:
+                    self._evict()
+            except sqlite3.Error:
+                self.errors += 1
+                return False
+        return True
+
+    def _evict(self):
+        # other processes write here too, so recount before trusting the estimate
+        with self.db:
+            self.db.execute("BEGIN IMMEDIATE")
+            self.db.execute("DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?", (time.time(),))
+            self.evictions += self.db.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM"
+                " (SELECT key, sum(size) OVER (ORDER BY accessed DESC ROWS UNBOUNDED PRECEDING) AS kept"
+                "  FROM entries) WHERE kept > ?)", (self.max_bytes,)).rowcount
+            self._size = self._total()
+
+    def clear(self, namespace=None):
+        with self.lock:
+            if namespace is None:
+                self.db.execute("DELETE FROM entries")
+            else:
+                self.db.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+            self._size = self._total()
+
+    def close(self):
+        _open_disk_tiers.discard(self)
+        self.db.close()
+
+
+class _InFlight:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class Memo:
+    """Two-tier cache in front of one function, with stampede protection.
+
+    Lookups try the in-memory LRU first and then the disk tier, if there is
+    one.  A disk hit is promoted to memory.  On a miss, the first caller
+    computes the value.  Concurrent callers with the same key wait for
+    that result, or its exception, instead of computing it again.  This
+    holds across threads, not across processes.
+    """
+
+    def __init__(self, namespace, maxsize=MEMO_MAX_ENTRIES, ttl=None, disk=None):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.memory = MemoryTier(maxsize)
+        self.disk = disk
+        self.hits = self.misses = self.disk_hits = self.shared = 0
+        self.lock = threading.Lock()
+        self.inflight = {}
+
+    def get(self, key, compute):
+        value = self.memory.get(key)
+        if value is not MISSING:
+            self.hits += 1
+            return value
+        with self.lock:
+            value = self.memory.get(key)
+            if value is not MISSING:
+                self.hits += 1
+                return value
+            flight = self.inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.inflight[key] = _InFlight()
+        if not leader:
+            flight.done.wait()
+            self.shared += 1
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+        try:
+            value = self.disk.get(key) if self.disk is not None else MISSING
+            if value is not MISSING:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+                value = compute()
+                if self.disk is not None:
+                    self.disk.set(key, value, self.namespace, self.ttl)
+            self.memory.set(key, value, self.ttl)
+            flight.value = value
+            return value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.inflight[key]
+            flight.done.set()
+
+    def info(self):
+        disk = self.disk
+        return CacheInfo(self.hits, self.misses, self.disk_hits, self.shared, self.memory.evictions,
+                         disk.evictions if disk is not None else 0,
+                         self.memory.expired + (disk.expired if disk is not None else 0),
+                         len(self.memory), self.memory.maxsize)
+
+    def clear(self, disk=True):
+        self.memory.clear()
+        if disk and self.disk is not None:
+            self.disk.clear(self.namespace)
+
+
+_disk_tiers = {}
+_disk_tiers_lock = threading.Lock()
+_open_disk_tiers = weakref.WeakSet()
+_inherited_connections = []
+
+
+def _reopen_disk_tiers():
+    global _disk_tiers_lock
+    _disk_tiers_lock = threading.Lock()
+    for tier in list(_open_disk_tiers):
+        tier._reopen()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reopen_disk_tiers)
+
+
+def _disk_tier(path, max_bytes):
+    path = os.path.abspath(path or os.path.join(MEMO_CACHE_DIR, MEMO_DISK_FILE))
+    with _disk_tiers_lock:
+        tier = _disk_tiers.get(path)
+        if tier is None:
+            tier = _disk_tiers[path] = DiskTier(path, max_bytes)
+        return tier
+
+
+def memoize(func=None, *, maxsize=MEMO_MAX_ENTRIES, ttl=None, disk=False, disk_max_bytes=MEMO_DISK_MAX_BYTES,
+            key=None, namespace=None, version=None):
+    """Cache a function's results in memory and, optionally, on disk.
+
+    ``disk`` is True for the shared cache file in MEMO_CACHE_DIR, or a path.
+    Functions using the same file share its ``disk_max_bytes`` budget.
+    Arguments are keyed by ``stable_hash``.  Pass ``key`` to derive a
+    hashable key from ``(*args, **kwargs)`` for arguments it can't handle.
+    Disk entries are namespaced by module and qualified name.  Bump
+    ``version`` when the function's results change meaning.  ``ttl`` is in
+    seconds and applies to both tiers.
+
+    The wrapper has ``cache`` (the Memo), ``cache_info()`` and
+    ``cache_clear()``.  Use it bare (``@memoize``) or with arguments.
+    """
+    def decorate(func):
+        name = namespace or f"{func.__module__}.{func.__qualname__}"
+        if version is not None:
+            name = f"{name}@{version}"
+        tier = _disk_tier(disk if isinstance(disk, (str, os.PathLike)) else None, disk_max_bytes) if disk else None
+        memo = Memo(name, maxsize, ttl, tier)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            parts = key(*args, **kwargs) if key is not None else (args, kwargs)
+            return memo.get(stable_hash((name, parts)), lambda: func(*args, **kwargs))
+
+        wrapper.cache = memo
+        wrapper.cache_info = memo.info
+        wrapper.cache_clear = memo.clear
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
+
+
+def _run_chunk(func, start, items):
+    began = time.perf_counter()
+    results = []
+    for offset, item in enumerate(items):
+        try:
+            results.append(func(item))
+        except BaseException as e:
+            if hasattr(e, "add_note"):
+                e.add_note(f"in pmap item {start + offset}: {item!r:.80}")
+            raise
+    return results, time.perf_counter() - began
+
+
+def pmap(func, iterable, executor="thread", workers=None, ordered=True, chunksize=None,
+         target=PMAP_CHUNK_TARGET, chronograph=None, timers=None, name="pmap"):
+    """Lazily yield ``func(item)`` for every item, computed on a pool.
+
+    ``executor`` is "thread", "process" or an Executor to reuse.  A pool
+    created here is shut down when the generator finishes or is closed.
+    Results come back in input order, or as chunks complete when
+    ``ordered`` is false.  Only a few chunks per worker are in flight or
+    waiting for their turn, so ``iterable`` can be endless.
+
+    Unless ``chunksize`` is given, chunks start at one item and then aim
+    for ``target`` seconds of work each, sized from the smoothed per-item
+    cost measured in the workers.  Cheap items get batched, and slow ones
+    don't leave workers idle at the end.
+
+    An exception from ``func`` is raised here with its traceback, from the
+    worker process's traceback for process pools, and a note naming the
+    item.  Every finished chunk adds a mark to ``chronograph`` and records
+    its in-worker seconds under ``name`` in ``timers`` (a chronograph.Timers).
+    """
+    if isinstance(executor, Executor):
+        pool, owned = executor, False
+    else:
+        pool, owned = (ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor)(workers), True
+    workers = workers or getattr(pool, "_max_workers", None) or os.cpu_count() or 1
+    items = iter(iterable)
+    cost = None
+    pending = {}
+    done = {}
+    submitted = emitted = position = 0
+
+    def submit():
+        nonlocal submitted, position
+        size = chunksize or (1 if cost is None else max(1, min(PMAP_MAX_CHUNK, round(target / max(cost, 1e-9)))))
+        chunk = list(itertools.islice(items, size))
+        if not chunk:
+            return False
+        pending[pool.submit(_run_chunk, func, position, chunk)] = (submitted, len(chunk))
+        submitted += 1
+        position += len(chunk)
+        return True
+
+    try:
+        exhausted = False
+        while True:
+            # finished chunks waiting behind a slow one count too, or they pile up
+            while not exhausted and len(pending) + len(done) < 2 * workers:
+                exhausted = not submit()
+            if not pending:
+                break
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                seq, count = pending.pop(future)
+                results, seconds = future.result()
+                per_item = seconds / count
+                cost = per_item if cost is None else cost + PMAP_COST_SMOOTHING * (per_item - cost)
+                if chronograph is not None:
+                    chronograph.set_mark(f"{name} chunk {seq}: {count} items")
+                if timers is not None:
+                    timers.record(name, seconds)
+                if ordered:
+                    done[seq] = results
+                else:
+                    yield from results
+            while emitted in done:
+                yield from done.pop(emitted)
+                emitted += 1
+    finally:
+        for future in pending:
+            future.cancel()
+        if owned:
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,170 @@
+"""Highlight many files in parallel.
+
+    python batch.py [-o OUTDIR] [-f FORMATTER] [-s STYLE] [-j JOBS] PATH...
+
+Directories are walked (skipping hidden entries and ``__pycache__``), and
+binary files are skipped.  The parent process only
+classifies files through the cache index, without importing any lexer, and
+groups them by lexer.  Each group is split into chunks that go to a process
+pool, so a worker imports a lexer and the formatter once per chunk rather
+than once per file.  Every result is written to OUTDIR as soon as its chunk
+finishes, mirroring the input tree below the inputs' common directory, with
+the formatter's extension appended.
+"""
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from guess import guess_lexer_class, guess_lexer_entry
+from resolver import formatter_class, load, style_class
+
+__all__ = [
+    "BATCH_CHUNK_SIZE",
+    "collect_files",
+    "group_by_lexer",
+    "highlight_chunk",
+    "highlight_batch",
+]
+
+BATCH_CHUNK_SIZE = 64
+FALLBACK = None
+SKIPPED_BINARY = "skipped binary file"
+
+
+def _common_base(paths):
+    """The deepest directory holding every input: the directories themselves
+    and the directories containing the files."""
+    dirs = [os.path.abspath(path) if os.path.isdir(path) else os.path.dirname(os.path.abspath(path))
+            for path in paths]
+    try:
+        return os.path.commonpath(dirs) if dirs else os.curdir
+    except ValueError:
+        raise ValueError("can't mirror inputs from different drives into one output tree") from None
+
+
+def collect_files(paths):
+    """Yield ``(path, relative name)`` for files under ``paths``.
+
+    Names are relative to the common base of all the inputs, so ``a/x.py``
+    and ``b/x.py`` stay apart, and a file reached twice is yielded once.
+    A single directory is mirrored from its own top.
+    """
+    base = _common_base(paths)
+    seen = set()
+
+    def visit(full):
+        absolute = os.path.abspath(full)
+        if absolute not in seen:
+            seen.add(absolute)
+            return full, os.path.relpath(absolute, base)
+
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if not d.startswith(".") and d != "__pycache__")
+                for name in sorted(files):
+                    if not name.startswith("."):
+                        item = visit(os.path.join(root, name))
+                        if item:
+                            yield item
+        else:
+            item = visit(path)
+            if item:
+                yield item
+
+
+def group_by_lexer(files):
+    """Map lexer entry (or FALLBACK for pygments' guessers) -> list of files."""
+    groups = {}
+    for item in files:
+        groups.setdefault(guess_lexer_entry(item[0]) or FALLBACK, []).append(item)
+    return groups
+
+
+def _output_extension(formatter_cls):
+    if formatter_cls.filenames:
+        return formatter_cls.filenames[0].lstrip("*")
+    return ".ansi" if formatter_cls.__module__.startswith("pygments.formatters.terminal") else ".txt"
+
+
+def highlight_chunk(entry, items, outdir, formatter, style, options):
+    """Worker: highlight ``items`` with one lexer; return ``(path, error)`` pairs."""
+    from pygments import highlight
+    formatter_cls = formatter_class(formatter)
+    formatter_obj = formatter_cls(style=style_class(style) or style, **options)
+    extension = _output_extension(formatter_cls)
+    lexer = load(entry)(stripnl=False, ensurenl=False) if entry is not FALLBACK else None
+    results = []
+    for path, relative in items:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            if b"\0" in data[:8192]:
+                results.append((path, SKIPPED_BINARY))
+                continue
+            text = data.decode("utf-8", errors="replace")
+            file_lexer = lexer
+            if file_lexer is None:
+                cls = guess_lexer_class(path, text[:4096])
+                file_lexer = (cls or load(("pygments.lexers.special", "TextLexer")))(stripnl=False)
+            target = os.path.join(outdir, relative + extension)
+            os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+            output = highlight(text, file_lexer, formatter_obj)
+            with open(target, "wb") as f:
+                f.write(output.encode("utf-8") if isinstance(output, str) else output)
+            results.append((path, None))
+        except Exception as e:
+            results.append((path, f"{type(e).__name__}: {e}"))
+    return results
+
+
+def highlight_batch(paths, outdir, formatter="terminal256", style="default", jobs=None,
+                    chunk_size=BATCH_CHUNK_SIZE, options=None):
+    """Highlight every file under ``paths`` into ``outdir``.
+
+    Yields ``(path, error)`` as chunks complete; ``error`` is None on success
+    and SKIPPED_BINARY for binary files.
+    """
+    if formatter_class(formatter) is None:
+        raise ValueError(f"unknown formatter {formatter!r}")
+    options = options or {}
+    groups = group_by_lexer(collect_files(paths))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(highlight_chunk, entry, items[i:i + chunk_size], outdir, formatter, style, options)
+            for entry, items in groups.items()
+            for i in range(0, len(items), chunk_size)
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def _parse_options(pairs):
+    options = {}
+    for pair in pairs:
+        key, _, value = pair.partition("=")
+        options[key] = value
+    return options
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Highlight many files in parallel.")
+    parser.add_argument("paths", nargs="+", help="files or directories to highlight")
+    parser.add_argument("-o", "--outdir", default="highlighted")
+    parser.add_argument("-f", "--formatter", default="terminal256")
+    parser.add_argument("-s", "--style", default="default")
+    parser.add_argument("-O", "--option", action="append", default=[], help="formatter option key=value")
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("-c", "--chunk-size", type=int, default=BATCH_CHUNK_SIZE)
+    parser.add_argument("-q", "--quiet", action="store_true")
+    args = parser.parse_args()
+    failed = 0
+    for path, error in highlight_batch(args.paths, args.outdir, args.formatter, args.style, args.jobs,
+                                       args.chunk_size, _parse_options(args.option)):
+        if error:
+            failed += error != SKIPPED_BINARY
+            print(f"{path}: {error}", file=sys.stderr)
+        elif not args.quiet:
+            print(path)
+    sys.exit(1 if failed else 0)
@@ -1,3 +1,4 @@
+# pygments 2.19.1
 {'filters': {'names': {'codetagify': ('pygments.filters', 'CodeTagFilter'),
                        'gobble': ('pygments.filters', 'GobbleFilter'),
                        'highlight': ('pygments.filters', 'NameHighlightFilter'),
@@ -114,7 +115,1208 @@
                                      'RawTokenFormatter'),
                           'troff': ('pygments.formatters.groff',
                                     'GroffFormatter')}},
- 'lexers': {'exts': {'.1p': ('pygments.lexers.markup', 'GroffLexer'),
+ 'lexers': {'aliases': {'abap': ('pygments.lexers.business', 'ABAPLexer'),
+                        'abl': ('pygments.lexers.business', 'OpenEdgeLexer'),
+                        'abnf': ('pygments.lexers.grammar_notation',
+                                 'AbnfLexer'),
+                        'aconf': ('pygments.lexers.configs', 'ApacheConfLexer'),
+                        'actionscript': ('pygments.lexers.actionscript',
+                                         'ActionScriptLexer'),
+                        'actionscript3': ('pygments.lexers.actionscript',
+                                          'ActionScript3Lexer'),
+                        'ada': ('pygments.lexers.ada', 'AdaLexer'),
+                        'ada2005': ('pygments.lexers.ada', 'AdaLexer'),
+                        'ada95': ('pygments.lexers.ada', 'AdaLexer'),
+                        'adl': ('pygments.lexers.archetype', 'AdlLexer'),
+                        'agda': ('pygments.lexers.haskell', 'AgdaLexer'),
+                        'aheui': ('pygments.lexers.esoteric', 'AheuiLexer'),
+                        'ahk': ('pygments.lexers.automation',
+                                'AutohotkeyLexer'),
+                        'alloy': ('pygments.lexers.dsls', 'AlloyLexer'),
+                        'ambienttalk': ('pygments.lexers.ambient',
+                                        'AmbientTalkLexer'),
+                        'ambienttalk/2': ('pygments.lexers.ambient',
+                                          'AmbientTalkLexer'),
+                        'amdgpu': ('pygments.lexers.amdgpu', 'AMDGPULexer'),
+                        'ampl': ('pygments.lexers.ampl', 'AmplLexer'),
+                        'androidbp': ('pygments.lexers.soong', 'SoongLexer'),
+                        'ansys': ('pygments.lexers.apdlexer', 'apdlexer'),
+                        'antlr': ('pygments.lexers.parsers', 'AntlrLexer'),
+                        'antlr-actionscript': ('pygments.lexers.parsers',
+                                               'AntlrActionScriptLexer'),
+                        'antlr-as': ('pygments.lexers.parsers',
+                                     'AntlrActionScriptLexer'),
+                        'antlr-c#': ('pygments.lexers.parsers',
+                                     'AntlrCSharpLexer'),
+                        'antlr-cpp': ('pygments.lexers.parsers',
+                                      'AntlrCppLexer'),
+                        'antlr-csharp': ('pygments.lexers.parsers',
+                                         'AntlrCSharpLexer'),
+                        'antlr-java': ('pygments.lexers.parsers',
+                                       'AntlrJavaLexer'),
+                        'antlr-objc': ('pygments.lexers.parsers',
+                                       'AntlrObjectiveCLexer'),
+                        'antlr-perl': ('pygments.lexers.parsers',
+                                       'AntlrPerlLexer'),
+                        'antlr-python': ('pygments.lexers.parsers',
+                                         'AntlrPythonLexer'),
+                        'antlr-rb': ('pygments.lexers.parsers',
+                                     'AntlrRubyLexer'),
+                        'antlr-ruby': ('pygments.lexers.parsers',
+                                       'AntlrRubyLexer'),
+                        'apache': ('pygments.lexers.configs',
+                                   'ApacheConfLexer'),
+                        'apacheconf': ('pygments.lexers.configs',
+                                       'ApacheConfLexer'),
+                        'apdl': ('pygments.lexers.apdlexer', 'apdlexer'),
+                        'apl': ('pygments.lexers.apl', 'APLLexer'),
+                        'applescript': ('pygments.lexers.scripting',
+                                        'AppleScriptLexer'),
+                        'arduino': ('pygments.lexers.c_like', 'ArduinoLexer'),
+                        'arexx': ('pygments.lexers.scripting', 'RexxLexer'),
+                        'arrow': ('pygments.lexers.arrow', 'ArrowLexer'),
+                        'art': ('pygments.lexers.arturo', 'ArturoLexer'),
+                        'arturo': ('pygments.lexers.arturo', 'ArturoLexer'),
+                        'as': ('pygments.lexers.actionscript',
+                               'ActionScriptLexer'),
+                        'as3': ('pygments.lexers.actionscript',
+                                'ActionScript3Lexer'),
+                        'asc': ('pygments.lexers.asc', 'AscLexer'),
+                        'asm': ('pygments.lexers.asm', 'GasLexer'),
+                        'asn1': ('pygments.lexers.asn1', 'Asn1Lexer'),
+                        'aspectj': ('pygments.lexers.jvm', 'AspectJLexer'),
+                        'aspx-cs': ('pygments.lexers.dotnet',
+                                    'CSharpAspxLexer'),
+                        'aspx-vb': ('pygments.lexers.dotnet', 'VbNetAspxLexer'),
+                        'asy': ('pygments.lexers.graphics', 'AsymptoteLexer'),
+                        'asymptote': ('pygments.lexers.graphics',
+                                      'AsymptoteLexer'),
+                        'at': ('pygments.lexers.ambient', 'AmbientTalkLexer'),
+                        'augeas': ('pygments.lexers.configs', 'AugeasLexer'),
+                        'autohotkey': ('pygments.lexers.automation',
+                                       'AutohotkeyLexer'),
+                        'autoit': ('pygments.lexers.automation', 'AutoItLexer'),
+                        'awk': ('pygments.lexers.textedit', 'AwkLexer'),
+                        'b3d': ('pygments.lexers.basic', 'BlitzBasicLexer'),
+                        'bare': ('pygments.lexers.bare', 'BareLexer'),
+                        'basemake': ('pygments.lexers.make',
+                                     'BaseMakefileLexer'),
+                        'bash': ('pygments.lexers.shell', 'BashLexer'),
+                        'basic': ('pygments.lexers.basic', 'QBasicLexer'),
+                        'bat': ('pygments.lexers.shell', 'BatchLexer'),
+                        'batch': ('pygments.lexers.shell', 'BatchLexer'),
+                        'bazel': ('pygments.lexers.python', 'PythonLexer'),
+                        'bbcbasic': ('pygments.lexers.basic', 'BBCBasicLexer'),
+                        'bbcode': ('pygments.lexers.markup', 'BBCodeLexer'),
+                        'bc': ('pygments.lexers.algebra', 'BCLexer'),
+                        'bdd': ('pygments.lexers.bdd', 'BddLexer'),
+                        'be': ('pygments.lexers.berry', 'BerryLexer'),
+                        'befunge': ('pygments.lexers.esoteric', 'BefungeLexer'),
+                        'berry': ('pygments.lexers.berry', 'BerryLexer'),
+                        'bf': ('pygments.lexers.esoteric', 'BrainfuckLexer'),
+                        'bib': ('pygments.lexers.bibtex', 'BibTeXLexer'),
+                        'bibtex': ('pygments.lexers.bibtex', 'BibTeXLexer'),
+                        'blitzbasic': ('pygments.lexers.basic',
+                                       'BlitzBasicLexer'),
+                        'blitzmax': ('pygments.lexers.basic', 'BlitzMaxLexer'),
+                        'blueprint': ('pygments.lexers.blueprint',
+                                      'BlueprintLexer'),
+                        'bmax': ('pygments.lexers.basic', 'BlitzMaxLexer'),
+                        'bnf': ('pygments.lexers.grammar_notation', 'BnfLexer'),
+                        'boa': ('pygments.lexers.boa', 'BoaLexer'),
+                        'boo': ('pygments.lexers.dotnet', 'BooLexer'),
+                        'boogie': ('pygments.lexers.verification',
+                                   'BoogieLexer'),
+                        'bp': ('pygments.lexers.soong', 'SoongLexer'),
+                        'bplus': ('pygments.lexers.basic', 'BlitzBasicLexer'),
+                        'bqn': ('pygments.lexers.bqn', 'BQNLexer'),
+                        'brainfuck': ('pygments.lexers.esoteric',
+                                      'BrainfuckLexer'),
+                        'bro': ('pygments.lexers.dsls', 'ZeekLexer'),
+                        'bsdmake': ('pygments.lexers.make', 'MakefileLexer'),
+                        'bst': ('pygments.lexers.bibtex', 'BSTLexer'),
+                        'bst-pybtex': ('pygments.lexers.bibtex', 'BSTLexer'),
+                        'bugs': ('pygments.lexers.modeling', 'BugsLexer'),
+                        'c': ('pygments.lexers.c_cpp', 'CLexer'),
+                        'c#': ('pygments.lexers.dotnet', 'CSharpLexer'),
+                        'c++': ('pygments.lexers.c_cpp', 'CppLexer'),
+                        'c++-objdumb': ('pygments.lexers.asm',
+                                        'CppObjdumpLexer'),
+                        'c-objdump': ('pygments.lexers.asm', 'CObjdumpLexer'),
+                        'ca65': ('pygments.lexers.asm', 'Ca65Lexer'),
+                        'cadl': ('pygments.lexers.archetype', 'CadlLexer'),
+                        'camkes': ('pygments.lexers.esoteric', 'CAmkESLexer'),
+                        'capdl': ('pygments.lexers.esoteric', 'CapDLLexer'),
+                        'capnp': ('pygments.lexers.capnproto',
+                                  'CapnProtoLexer'),
+                        'carbon': ('pygments.lexers.carbon', 'CarbonLexer'),
+                        'cbmbas': ('pygments.lexers.basic', 'CbmBasicV2Lexer'),
+                        'cddl': ('pygments.lexers.cddl', 'CddlLexer'),
+                        'ceylon': ('pygments.lexers.jvm', 'CeylonLexer'),
+                        'cf3': ('pygments.lexers.configs', 'Cfengine3Lexer'),
+                        'cfc': ('pygments.lexers.templates',
+                                'ColdfusionCFCLexer'),
+                        'cfengine3': ('pygments.lexers.configs',
+                                      'Cfengine3Lexer'),
+                        'cfg': ('pygments.lexers.configs', 'IniLexer'),
+                        'cfm': ('pygments.lexers.templates',
+                                'ColdfusionHtmlLexer'),
+                        'cfs': ('pygments.lexers.templates', 'ColdfusionLexer'),
+                        'chai': ('pygments.lexers.scripting',
+                                 'ChaiscriptLexer'),
+                        'chaiscript': ('pygments.lexers.scripting',
+                                       'ChaiscriptLexer'),
+                        'chapel': ('pygments.lexers.chapel', 'ChapelLexer'),
+                        'charmci': ('pygments.lexers.c_like', 'CharmciLexer'),
+                        'cheetah': ('pygments.lexers.templates',
+                                    'CheetahLexer'),
+                        'chpl': ('pygments.lexers.chapel', 'ChapelLexer'),
+                        'cirru': ('pygments.lexers.webmisc', 'CirruLexer'),
+                        'cl': ('pygments.lexers.lisp', 'CommonLispLexer'),
+                        'clay': ('pygments.lexers.c_like', 'ClayLexer'),
+                        'clean': ('pygments.lexers.clean', 'CleanLexer'),
+                        'clipper': ('pygments.lexers.foxpro', 'FoxProLexer'),
+                        'clj': ('pygments.lexers.jvm', 'ClojureLexer'),
+                        'cljs': ('pygments.lexers.jvm', 'ClojureScriptLexer'),
+                        'clojure': ('pygments.lexers.jvm', 'ClojureLexer'),
+                        'clojurescript': ('pygments.lexers.jvm',
+                                          'ClojureScriptLexer'),
+                        'cmake': ('pygments.lexers.make', 'CMakeLexer'),
+                        'cobol': ('pygments.lexers.business', 'CobolLexer'),
+                        'cobolfree': ('pygments.lexers.business',
+                                      'CobolFreeformatLexer'),
+                        'codeql': ('pygments.lexers.codeql', 'CodeQLLexer'),
+                        'coffee': ('pygments.lexers.javascript',
+                                   'CoffeeScriptLexer'),
+                        'coffee-script': ('pygments.lexers.javascript',
+                                          'CoffeeScriptLexer'),
+                        'coffeescript': ('pygments.lexers.javascript',
+                                         'CoffeeScriptLexer'),
+                        'comal': ('pygments.lexers.comal', 'Comal80Lexer'),
+                        'comal80': ('pygments.lexers.comal', 'Comal80Lexer'),
+                        'common-lisp': ('pygments.lexers.lisp',
+                                        'CommonLispLexer'),
+                        'componentpascal': ('pygments.lexers.oberon',
+                                            'ComponentPascalLexer'),
+                        'console': ('pygments.lexers.shell',
+                                    'BashSessionLexer'),
+                        'control': ('pygments.lexers.installers',
+                                    'DebianControlLexer'),
+                        'coq': ('pygments.lexers.theorem', 'CoqLexer'),
+                        'cp': ('pygments.lexers.oberon',
+                               'ComponentPascalLexer'),
+                        'cplint': ('pygments.lexers.cplint', 'CplintLexer'),
+                        'cpp': ('pygments.lexers.c_cpp', 'CppLexer'),
+                        'cpp-objdump': ('pygments.lexers.asm',
+                                        'CppObjdumpLexer'),
+                        'cpsa': ('pygments.lexers.lisp', 'CPSALexer'),
+                        'cr': ('pygments.lexers.crystal', 'CrystalLexer'),
+                        'crmsh': ('pygments.lexers.dsls', 'CrmshLexer'),
+                        'croc': ('pygments.lexers.d', 'CrocLexer'),
+                        'cry': ('pygments.lexers.haskell', 'CryptolLexer'),
+                        'cryptol': ('pygments.lexers.haskell', 'CryptolLexer'),
+                        'crystal': ('pygments.lexers.crystal', 'CrystalLexer'),
+                        'cs': ('pygments.lexers.dotnet', 'CSharpLexer'),
+                        'csh': ('pygments.lexers.shell', 'TcshLexer'),
+                        'csharp': ('pygments.lexers.dotnet', 'CSharpLexer'),
+                        'csound': ('pygments.lexers.csound',
+                                   'CsoundOrchestraLexer'),
+                        'csound-csd': ('pygments.lexers.csound',
+                                       'CsoundDocumentLexer'),
+                        'csound-document': ('pygments.lexers.csound',
+                                            'CsoundDocumentLexer'),
+                        'csound-orc': ('pygments.lexers.csound',
+                                       'CsoundOrchestraLexer'),
+                        'csound-sco': ('pygments.lexers.csound',
+                                       'CsoundScoreLexer'),
+                        'csound-score': ('pygments.lexers.csound',
+                                         'CsoundScoreLexer'),
+                        'css': ('pygments.lexers.css', 'CssLexer'),
+                        'css+django': ('pygments.lexers.templates',
+                                       'CssDjangoLexer'),
+                        'css+erb': ('pygments.lexers.templates', 'CssErbLexer'),
+                        'css+genshi': ('pygments.lexers.templates',
+                                       'CssGenshiLexer'),
+                        'css+genshitext': ('pygments.lexers.templates',
+                                           'CssGenshiLexer'),
+                        'css+jinja': ('pygments.lexers.templates',
+                                      'CssDjangoLexer'),
+                        'css+lasso': ('pygments.lexers.templates',
+                                      'LassoCssLexer'),
+                        'css+mako': ('pygments.lexers.templates',
+                                     'MakoCssLexer'),
+                        'css+mozpreproc': ('pygments.lexers.markup',
+                                           'MozPreprocCssLexer'),
+                        'css+myghty': ('pygments.lexers.templates',
+                                       'MyghtyCssLexer'),
+                        'css+php': ('pygments.lexers.templates', 'CssPhpLexer'),
+                        'css+ruby': ('pygments.lexers.templates',
+                                     'CssErbLexer'),
+                        'css+smarty': ('pygments.lexers.templates',
+                                       'CssSmartyLexer'),
+                        'css+ul4': ('pygments.lexers.ul4', 'CSSUL4Lexer'),
+                        'cu': ('pygments.lexers.c_like', 'CudaLexer'),
+                        'cucumber': ('pygments.lexers.testing', 'GherkinLexer'),
+                        'cuda': ('pygments.lexers.c_like', 'CudaLexer'),
+                        'cxx-objdump': ('pygments.lexers.asm',
+                                        'CppObjdumpLexer'),
+                        'cypher': ('pygments.lexers.graph', 'CypherLexer'),
+                        'cython': ('pygments.lexers.python', 'CythonLexer'),
+                        'd': ('pygments.lexers.d', 'DLexer'),
+                        'd-objdump': ('pygments.lexers.asm', 'DObjdumpLexer'),
+                        'dart': ('pygments.lexers.javascript', 'DartLexer'),
+                        'dasm16': ('pygments.lexers.asm', 'Dasm16Lexer'),
+                        'dax': ('pygments.lexers.dax', 'DaxLexer'),
+                        'debcontrol': ('pygments.lexers.installers',
+                                       'DebianControlLexer'),
+                        'debian.sources': ('pygments.lexers.installers',
+                                           'DebianSourcesLexer'),
+                        'debsources': ('pygments.lexers.installers',
+                                       'SourcesListLexer'),
+                        'delphi': ('pygments.lexers.pascal', 'DelphiLexer'),
+                        'desktop': ('pygments.lexers.configs', 'DesktopLexer'),
+                        'devicetree': ('pygments.lexers.devicetree',
+                                       'DevicetreeLexer'),
+                        'dg': ('pygments.lexers.python', 'DgLexer'),
+                        'diff': ('pygments.lexers.diff', 'DiffLexer'),
+                        'django': ('pygments.lexers.templates', 'DjangoLexer'),
+                        'dmesg': ('pygments.lexers.textfmts', 'KernelLogLexer'),
+                        'do': ('pygments.lexers.stata', 'StataLexer'),
+                        'docker': ('pygments.lexers.configs', 'DockerLexer'),
+                        'dockerfile': ('pygments.lexers.configs',
+                                       'DockerLexer'),
+                        'dosbatch': ('pygments.lexers.shell', 'BatchLexer'),
+                        'doscon': ('pygments.lexers.shell',
+                                   'MSDOSSessionLexer'),
+                        'dosini': ('pygments.lexers.configs', 'IniLexer'),
+                        'dot': ('pygments.lexers.graphviz', 'GraphvizLexer'),
+                        'dpatch': ('pygments.lexers.diff', 'DarcsPatchLexer'),
+                        'dtd': ('pygments.lexers.html', 'DtdLexer'),
+                        'dts': ('pygments.lexers.devicetree',
+                                'DevicetreeLexer'),
+                        'duby': ('pygments.lexers.ruby', 'RubyLexer'),
+                        'duel': ('pygments.lexers.webmisc', 'DuelLexer'),
+                        'dylan': ('pygments.lexers.dylan', 'DylanLexer'),
+                        'dylan-console': ('pygments.lexers.dylan',
+                                          'DylanConsoleLexer'),
+                        'dylan-lid': ('pygments.lexers.dylan', 'DylanLidLexer'),
+                        'dylan-repl': ('pygments.lexers.dylan',
+                                       'DylanConsoleLexer'),
+                        'earl-grey': ('pygments.lexers.javascript',
+                                      'EarlGreyLexer'),
+                        'earlgrey': ('pygments.lexers.javascript',
+                                     'EarlGreyLexer'),
+                        'easytrieve': ('pygments.lexers.scripting',
+                                       'EasytrieveLexer'),
+                        'ebnf': ('pygments.lexers.parsers', 'EbnfLexer'),
+                        'ec': ('pygments.lexers.c_like', 'ECLexer'),
+                        'ecl': ('pygments.lexers.ecl', 'ECLLexer'),
+                        'eg': ('pygments.lexers.javascript', 'EarlGreyLexer'),
+                        'eiffel': ('pygments.lexers.eiffel', 'EiffelLexer'),
+                        'elisp': ('pygments.lexers.lisp', 'EmacsLispLexer'),
+                        'elixir': ('pygments.lexers.erlang', 'ElixirLexer'),
+                        'elm': ('pygments.lexers.elm', 'ElmLexer'),
+                        'elpi': ('pygments.lexers.elpi', 'ElpiLexer'),
+                        'emacs': ('pygments.lexers.lisp', 'EmacsLispLexer'),
+                        'emacs-lisp': ('pygments.lexers.lisp',
+                                       'EmacsLispLexer'),
+                        'email': ('pygments.lexers.email', 'EmailLexer'),
+                        'eml': ('pygments.lexers.email', 'EmailLexer'),
+                        'erb': ('pygments.lexers.templates', 'ErbLexer'),
+                        'erl': ('pygments.lexers.erlang', 'ErlangShellLexer'),
+                        'erlang': ('pygments.lexers.erlang', 'ErlangLexer'),
+                        'evoque': ('pygments.lexers.templates', 'EvoqueLexer'),
+                        'ex': ('pygments.lexers.erlang', 'ElixirLexer'),
+                        'execline': ('pygments.lexers.shell', 'ExeclineLexer'),
+                        'exs': ('pygments.lexers.erlang', 'ElixirLexer'),
+                        'extempore': ('pygments.lexers.lisp', 'XtlangLexer'),
+                        'ezhil': ('pygments.lexers.ezhil', 'EzhilLexer'),
+                        'f#': ('pygments.lexers.dotnet', 'FSharpLexer'),
+                        'f90': ('pygments.lexers.fortran', 'FortranLexer'),
+                        'factor': ('pygments.lexers.factor', 'FactorLexer'),
+                        'fan': ('pygments.lexers.fantom', 'FantomLexer'),
+                        'fancy': ('pygments.lexers.ruby', 'FancyLexer'),
+                        'fc': ('pygments.lexers.func', 'FuncLexer'),
+                        'felix': ('pygments.lexers.felix', 'FelixLexer'),
+                        'fennel': ('pygments.lexers.lisp', 'FennelLexer'),
+                        'fif': ('pygments.lexers.fift', 'FiftLexer'),
+                        'fift': ('pygments.lexers.fift', 'FiftLexer'),
+                        'fish': ('pygments.lexers.shell', 'FishShellLexer'),
+                        'fishshell': ('pygments.lexers.shell',
+                                      'FishShellLexer'),
+                        'flatline': ('pygments.lexers.dsls', 'FlatlineLexer'),
+                        'flo': ('pygments.lexers.floscript', 'FloScriptLexer'),
+                        'floscript': ('pygments.lexers.floscript',
+                                      'FloScriptLexer'),
+                        'flx': ('pygments.lexers.felix', 'FelixLexer'),
+                        'fnl': ('pygments.lexers.lisp', 'FennelLexer'),
+                        'forth': ('pygments.lexers.forth', 'ForthLexer'),
+                        'fortran': ('pygments.lexers.fortran', 'FortranLexer'),
+                        'fortranfixed': ('pygments.lexers.fortran',
+                                         'FortranFixedLexer'),
+                        'foxpro': ('pygments.lexers.foxpro', 'FoxProLexer'),
+                        'freefem': ('pygments.lexers.freefem', 'FreeFemLexer'),
+                        'fsharp': ('pygments.lexers.dotnet', 'FSharpLexer'),
+                        'fstar': ('pygments.lexers.ml', 'FStarLexer'),
+                        'func': ('pygments.lexers.func', 'FuncLexer'),
+                        'futhark': ('pygments.lexers.futhark', 'FutharkLexer'),
+                        'fy': ('pygments.lexers.ruby', 'FancyLexer'),
+                        'gap': ('pygments.lexers.algebra', 'GAPLexer'),
+                        'gap-console': ('pygments.lexers.algebra',
+                                        'GAPConsoleLexer'),
+                        'gap-repl': ('pygments.lexers.algebra',
+                                     'GAPConsoleLexer'),
+                        'gas': ('pygments.lexers.asm', 'GasLexer'),
+                        'gawk': ('pygments.lexers.textedit', 'AwkLexer'),
+                        'gcode': ('pygments.lexers.gcodelexer', 'GcodeLexer'),
+                        'gd': ('pygments.lexers.gdscript', 'GDScriptLexer'),
+                        'gdscript': ('pygments.lexers.gdscript',
+                                     'GDScriptLexer'),
+                        'genshi': ('pygments.lexers.templates', 'GenshiLexer'),
+                        'genshitext': ('pygments.lexers.templates',
+                                       'GenshiTextLexer'),
+                        'gherkin': ('pygments.lexers.testing', 'GherkinLexer'),
+                        'gleam': ('pygments.lexers.gleam', 'GleamLexer'),
+                        'glsl': ('pygments.lexers.graphics', 'GLShaderLexer'),
+                        'gnuplot': ('pygments.lexers.graphics', 'GnuplotLexer'),
+                        'go': ('pygments.lexers.go', 'GoLexer'),
+                        'golang': ('pygments.lexers.go', 'GoLexer'),
+                        'golo': ('pygments.lexers.jvm', 'GoloLexer'),
+                        'gooddata-cl': ('pygments.lexers.business',
+                                        'GoodDataCLLexer'),
+                        'googlesql': ('pygments.lexers.sql', 'GoogleSqlLexer'),
+                        'gosu': ('pygments.lexers.jvm', 'GosuLexer'),
+                        'graphql': ('pygments.lexers.graphql', 'GraphQLLexer'),
+                        'graphviz': ('pygments.lexers.graphviz',
+                                     'GraphvizLexer'),
+                        'groff': ('pygments.lexers.markup', 'GroffLexer'),
+                        'groovy': ('pygments.lexers.jvm', 'GroovyLexer'),
+                        'gsed': ('pygments.lexers.textedit', 'SedLexer'),
+                        'gsql': ('pygments.lexers.gsql', 'GSQLLexer'),
+                        'gst': ('pygments.lexers.jvm', 'GosuTemplateLexer'),
+                        'haml': ('pygments.lexers.html', 'HamlLexer'),
+                        'handlebars': ('pygments.lexers.templates',
+                                       'HandlebarsLexer'),
+                        'hare': ('pygments.lexers.hare', 'HareLexer'),
+                        'haskell': ('pygments.lexers.haskell', 'HaskellLexer'),
+                        'haxe': ('pygments.lexers.haxe', 'HaxeLexer'),
+                        'haxeml': ('pygments.lexers.haxe', 'HxmlLexer'),
+                        'hcl': ('pygments.lexers.configs', 'TerraformLexer'),
+                        'hexdump': ('pygments.lexers.hexdump', 'HexdumpLexer'),
+                        'hlsl': ('pygments.lexers.graphics', 'HLSLShaderLexer'),
+                        'hs': ('pygments.lexers.haskell', 'HaskellLexer'),
+                        'hsa': ('pygments.lexers.asm', 'HsailLexer'),
+                        'hsail': ('pygments.lexers.asm', 'HsailLexer'),
+                        'hspec': ('pygments.lexers.haskell', 'HspecLexer'),
+                        'html': ('pygments.lexers.html', 'HtmlLexer'),
+                        'html+cheetah': ('pygments.lexers.templates',
+                                         'CheetahHtmlLexer'),
+                        'html+django': ('pygments.lexers.templates',
+                                        'HtmlDjangoLexer'),
+                        'html+erb': ('pygments.lexers.templates', 'RhtmlLexer'),
+                        'html+evoque': ('pygments.lexers.templates',
+                                        'EvoqueHtmlLexer'),
+                        'html+genshi': ('pygments.lexers.templates',
+                                        'HtmlGenshiLexer'),
+                        'html+handlebars': ('pygments.lexers.templates',
+                                            'HandlebarsHtmlLexer'),
+                        'html+jinja': ('pygments.lexers.templates',
+                                       'HtmlDjangoLexer'),
+                        'html+kid': ('pygments.lexers.templates',
+                                     'HtmlGenshiLexer'),
+                        'html+lasso': ('pygments.lexers.templates',
+                                       'LassoHtmlLexer'),
+                        'html+mako': ('pygments.lexers.templates',
+                                      'MakoHtmlLexer'),
+                        'html+myghty': ('pygments.lexers.templates',
+                                        'MyghtyHtmlLexer'),
+                        'html+ng2': ('pygments.lexers.templates',
+                                     'Angular2HtmlLexer'),
+                        'html+php': ('pygments.lexers.templates',
+                                     'HtmlPhpLexer'),
+                        'html+ruby': ('pygments.lexers.templates',
+                                      'RhtmlLexer'),
+                        'html+smarty': ('pygments.lexers.templates',
+                                        'HtmlSmartyLexer'),
+                        'html+spitfire': ('pygments.lexers.templates',
+                                          'CheetahHtmlLexer'),
+                        'html+twig': ('pygments.lexers.templates',
+                                      'TwigHtmlLexer'),
+                        'html+ul4': ('pygments.lexers.ul4', 'HTMLUL4Lexer'),
+                        'html+velocity': ('pygments.lexers.templates',
+                                          'VelocityHtmlLexer'),
+                        'htmlcheetah': ('pygments.lexers.templates',
+                                        'CheetahHtmlLexer'),
+                        'htmldjango': ('pygments.lexers.templates',
+                                       'HtmlDjangoLexer'),
+                        'http': ('pygments.lexers.textfmts', 'HttpLexer'),
+                        'hx': ('pygments.lexers.haxe', 'HaxeLexer'),
+                        'hxml': ('pygments.lexers.haxe', 'HxmlLexer'),
+                        'hxsl': ('pygments.lexers.haxe', 'HaxeLexer'),
+                        'hy': ('pygments.lexers.lisp', 'HyLexer'),
+                        'hybris': ('pygments.lexers.scripting', 'HybrisLexer'),
+                        'hylang': ('pygments.lexers.lisp', 'HyLexer'),
+                        'i6': ('pygments.lexers.int_fiction', 'Inform6Lexer'),
+                        'i6t': ('pygments.lexers.int_fiction',
+                                'Inform6TemplateLexer'),
+                        'i7': ('pygments.lexers.int_fiction', 'Inform7Lexer'),
+                        'icon': ('pygments.lexers.unicon', 'IconLexer'),
+                        'idl': ('pygments.lexers.idl', 'IDLLexer'),
+                        'idl4': ('pygments.lexers.esoteric', 'CAmkESLexer'),
+                        'idr': ('pygments.lexers.haskell', 'IdrisLexer'),
+                        'idris': ('pygments.lexers.haskell', 'IdrisLexer'),
+                        'iex': ('pygments.lexers.erlang', 'ElixirConsoleLexer'),
+                        'igor': ('pygments.lexers.igor', 'IgorLexer'),
+                        'igorpro': ('pygments.lexers.igor', 'IgorLexer'),
+                        'ik': ('pygments.lexers.jvm', 'IokeLexer'),
+                        'inform6': ('pygments.lexers.int_fiction',
+                                    'Inform6Lexer'),
+                        'inform7': ('pygments.lexers.int_fiction',
+                                    'Inform7Lexer'),
+                        'ini': ('pygments.lexers.configs', 'IniLexer'),
+                        'io': ('pygments.lexers.iolang', 'IoLexer'),
+                        'ioke': ('pygments.lexers.jvm', 'IokeLexer'),
+                        'irb': ('pygments.lexers.ruby', 'RubyConsoleLexer'),
+                        'irc': ('pygments.lexers.textfmts', 'IrcLogsLexer'),
+                        'isabelle': ('pygments.lexers.theorem',
+                                     'IsabelleLexer'),
+                        'j': ('pygments.lexers.j', 'JLexer'),
+                        'jade': ('pygments.lexers.html', 'PugLexer'),
+                        'jags': ('pygments.lexers.modeling', 'JagsLexer'),
+                        'janet': ('pygments.lexers.lisp', 'JanetLexer'),
+                        'jasmin': ('pygments.lexers.jvm', 'JasminLexer'),
+                        'jasminxt': ('pygments.lexers.jvm', 'JasminLexer'),
+                        'java': ('pygments.lexers.jvm', 'JavaLexer'),
+                        'javascript': ('pygments.lexers.javascript',
+                                       'JavascriptLexer'),
+                        'javascript+cheetah': ('pygments.lexers.templates',
+                                               'CheetahJavascriptLexer'),
+                        'javascript+django': ('pygments.lexers.templates',
+                                              'JavascriptDjangoLexer'),
+                        'javascript+erb': ('pygments.lexers.templates',
+                                           'JavascriptErbLexer'),
+                        'javascript+genshi': ('pygments.lexers.templates',
+                                              'JavascriptGenshiLexer'),
+                        'javascript+genshitext': ('pygments.lexers.templates',
+                                                  'JavascriptGenshiLexer'),
+                        'javascript+jinja': ('pygments.lexers.templates',
+                                             'JavascriptDjangoLexer'),
+                        'javascript+lasso': ('pygments.lexers.templates',
+                                             'LassoJavascriptLexer'),
+                        'javascript+mako': ('pygments.lexers.templates',
+                                            'MakoJavascriptLexer'),
+                        'javascript+mozpreproc': ('pygments.lexers.markup',
+                                                  'MozPreprocJavascriptLexer'),
+                        'javascript+myghty': ('pygments.lexers.templates',
+                                              'MyghtyJavascriptLexer'),
+                        'javascript+php': ('pygments.lexers.templates',
+                                           'JavascriptPhpLexer'),
+                        'javascript+ruby': ('pygments.lexers.templates',
+                                            'JavascriptErbLexer'),
+                        'javascript+smarty': ('pygments.lexers.templates',
+                                              'JavascriptSmartyLexer'),
+                        'javascript+spitfire': ('pygments.lexers.templates',
+                                                'CheetahJavascriptLexer'),
+                        'jbst': ('pygments.lexers.webmisc', 'DuelLexer'),
+                        'jcl': ('pygments.lexers.scripting', 'JclLexer'),
+                        'jinja': ('pygments.lexers.templates', 'DjangoLexer'),
+                        'jl': ('pygments.lexers.julia', 'JuliaLexer'),
+                        'jlcon': ('pygments.lexers.julia', 'JuliaConsoleLexer'),
+                        'jmespath': ('pygments.lexers.jmespath',
+                                     'JMESPathLexer'),
+                        'jp': ('pygments.lexers.jmespath', 'JMESPathLexer'),
+                        'jproperties': ('pygments.lexers.configs',
+                                        'PropertiesLexer'),
+                        'js': ('pygments.lexers.javascript', 'JavascriptLexer'),
+                        'js+cheetah': ('pygments.lexers.templates',
+                                       'CheetahJavascriptLexer'),
+                        'js+django': ('pygments.lexers.templates',
+                                      'JavascriptDjangoLexer'),
+                        'js+erb': ('pygments.lexers.templates',
+                                   'JavascriptErbLexer'),
+                        'js+genshi': ('pygments.lexers.templates',
+                                      'JavascriptGenshiLexer'),
+                        'js+genshitext': ('pygments.lexers.templates',
+                                          'JavascriptGenshiLexer'),
+                        'js+jinja': ('pygments.lexers.templates',
+                                     'JavascriptDjangoLexer'),
+                        'js+lasso': ('pygments.lexers.templates',
+                                     'LassoJavascriptLexer'),
+                        'js+mako': ('pygments.lexers.templates',
+                                    'MakoJavascriptLexer'),
+                        'js+myghty': ('pygments.lexers.templates',
+                                      'MyghtyJavascriptLexer'),
+                        'js+php': ('pygments.lexers.templates',
+                                   'JavascriptPhpLexer'),
+                        'js+ruby': ('pygments.lexers.templates',
+                                    'JavascriptErbLexer'),
+                        'js+smarty': ('pygments.lexers.templates',
+                                      'JavascriptSmartyLexer'),
+                        'js+spitfire': ('pygments.lexers.templates',
+                                        'CheetahJavascriptLexer'),
+                        'js+ul4': ('pygments.lexers.ul4', 'JavascriptUL4Lexer'),
+                        'jsgf': ('pygments.lexers.grammar_notation',
+                                 'JsgfLexer'),
+                        'jslt': ('pygments.lexers.jslt', 'JSLTLexer'),
+                        'json': ('pygments.lexers.data', 'JsonLexer'),
+                        'json-ld': ('pygments.lexers.data', 'JsonLdLexer'),
+                        'json-object': ('pygments.lexers.data', 'JsonLexer'),
+                        'json5': ('pygments.lexers.json5', 'Json5Lexer'),
+                        'jsonld': ('pygments.lexers.data', 'JsonLdLexer'),
+                        'jsonml+bst': ('pygments.lexers.webmisc', 'DuelLexer'),
+                        'jsonnet': ('pygments.lexers.jsonnet', 'JsonnetLexer'),
+                        'jsp': ('pygments.lexers.templates', 'JspLexer'),
+                        'jsx': ('pygments.lexers.jsx', 'JsxLexer'),
+                        'julia': ('pygments.lexers.julia', 'JuliaLexer'),
+                        'julia-repl': ('pygments.lexers.julia',
+                                       'JuliaConsoleLexer'),
+                        'juttle': ('pygments.lexers.javascript', 'JuttleLexer'),
+                        'k': ('pygments.lexers.q', 'KLexer'),
+                        'kal': ('pygments.lexers.javascript', 'KalLexer'),
+                        'kconfig': ('pygments.lexers.configs', 'KconfigLexer'),
+                        'kernel-config': ('pygments.lexers.configs',
+                                          'KconfigLexer'),
+                        'kid': ('pygments.lexers.templates', 'GenshiLexer'),
+                        'kmsg': ('pygments.lexers.textfmts', 'KernelLogLexer'),
+                        'koka': ('pygments.lexers.haskell', 'KokaLexer'),
+                        'kotlin': ('pygments.lexers.jvm', 'KotlinLexer'),
+                        'kql': ('pygments.lexers.kusto', 'KustoLexer'),
+                        'ksh': ('pygments.lexers.shell', 'BashLexer'),
+                        'kuin': ('pygments.lexers.kuin', 'KuinLexer'),
+                        'kusto': ('pygments.lexers.kusto', 'KustoLexer'),
+                        'lagda': ('pygments.lexers.haskell',
+                                  'LiterateAgdaLexer'),
+                        'lasso': ('pygments.lexers.javascript', 'LassoLexer'),
+                        'lassoscript': ('pygments.lexers.javascript',
+                                        'LassoLexer'),
+                        'latex': ('pygments.lexers.markup', 'TexLexer'),
+                        'lcry': ('pygments.lexers.haskell',
+                                 'LiterateCryptolLexer'),
+                        'lcryptol': ('pygments.lexers.haskell',
+                                     'LiterateCryptolLexer'),
+                        'ldapconf': ('pygments.lexers.ldap', 'LdaprcLexer'),
+                        'ldaprc': ('pygments.lexers.ldap', 'LdaprcLexer'),
+                        'ldif': ('pygments.lexers.ldap', 'LdifLexer'),
+                        'lean': ('pygments.lexers.lean', 'Lean3Lexer'),
+                        'lean3': ('pygments.lexers.lean', 'Lean3Lexer'),
+                        'lean4': ('pygments.lexers.lean', 'Lean4Lexer'),
+                        'less': ('pygments.lexers.css', 'LessCssLexer'),
+                        'lhaskell': ('pygments.lexers.haskell',
+                                     'LiterateHaskellLexer'),
+                        'lhs': ('pygments.lexers.haskell',
+                                'LiterateHaskellLexer'),
+                        'lid': ('pygments.lexers.dylan', 'DylanLidLexer'),
+                        'lidr': ('pygments.lexers.haskell',
+                                 'LiterateIdrisLexer'),
+                        'lidris': ('pygments.lexers.haskell',
+                                   'LiterateIdrisLexer'),
+                        'lighttpd': ('pygments.lexers.configs',
+                                     'LighttpdConfLexer'),
+                        'lighty': ('pygments.lexers.configs',
+                                   'LighttpdConfLexer'),
+                        'lilypond': ('pygments.lexers.lilypond',
+                                     'LilyPondLexer'),
+                        'limbo': ('pygments.lexers.inferno', 'LimboLexer'),
+                        'linux-config': ('pygments.lexers.configs',
+                                         'KconfigLexer'),
+                        'linuxconfig': ('pygments.lexers.configs',
+                                        'UnixConfigLexer'),
+                        'liquid': ('pygments.lexers.templates', 'LiquidLexer'),
+                        'lisp': ('pygments.lexers.lisp', 'CommonLispLexer'),
+                        'literate-agda': ('pygments.lexers.haskell',
+                                          'LiterateAgdaLexer'),
+                        'literate-cryptol': ('pygments.lexers.haskell',
+                                             'LiterateCryptolLexer'),
+                        'literate-haskell': ('pygments.lexers.haskell',
+                                             'LiterateHaskellLexer'),
+                        'literate-idris': ('pygments.lexers.haskell',
+                                           'LiterateIdrisLexer'),
+                        'live-script': ('pygments.lexers.javascript',
+                                        'LiveScriptLexer'),
+                        'livescript': ('pygments.lexers.javascript',
+                                       'LiveScriptLexer'),
+                        'llvm': ('pygments.lexers.asm', 'LlvmLexer'),
+                        'llvm-mir': ('pygments.lexers.asm', 'LlvmMirLexer'),
+                        'llvm-mir-body': ('pygments.lexers.asm',
+                                          'LlvmMirBodyLexer'),
+                        'lobas': ('pygments.lexers.dotnet', 'VbNetLexer'),
+                        'logos': ('pygments.lexers.objective', 'LogosLexer'),
+                        'logtalk': ('pygments.lexers.prolog', 'LogtalkLexer'),
+                        'lsl': ('pygments.lexers.scripting', 'LSLLexer'),
+                        'lua': ('pygments.lexers.scripting', 'LuaLexer'),
+                        'luau': ('pygments.lexers.scripting', 'LuauLexer'),
+                        'm2': ('pygments.lexers.modula2', 'Modula2Lexer'),
+                        'macaulay2': ('pygments.lexers.macaulay2',
+                                      'Macaulay2Lexer'),
+                        'macsyma': ('pygments.lexers.maxima', 'MaximaLexer'),
+                        'make': ('pygments.lexers.make', 'MakefileLexer'),
+                        'makefile': ('pygments.lexers.make', 'MakefileLexer'),
+                        'mako': ('pygments.lexers.templates', 'MakoLexer'),
+                        'man': ('pygments.lexers.markup', 'GroffLexer'),
+                        'maple': ('pygments.lexers.maple', 'MapleLexer'),
+                        'maql': ('pygments.lexers.business', 'MaqlLexer'),
+                        'markdown': ('pygments.lexers.markup', 'MarkdownLexer'),
+                        'mask': ('pygments.lexers.javascript', 'MaskLexer'),
+                        'mason': ('pygments.lexers.templates', 'MasonLexer'),
+                        'mathematica': ('pygments.lexers.algebra',
+                                        'MathematicaLexer'),
+                        'matlab': ('pygments.lexers.matlab', 'MatlabLexer'),
+                        'matlabsession': ('pygments.lexers.matlab',
+                                          'MatlabSessionLexer'),
+                        'mawk': ('pygments.lexers.textedit', 'AwkLexer'),
+                        'maxima': ('pygments.lexers.maxima', 'MaximaLexer'),
+                        'mcf': ('pygments.lexers.minecraft', 'MCFunctionLexer'),
+                        'mcfunction': ('pygments.lexers.minecraft',
+                                       'MCFunctionLexer'),
+                        'mcschema': ('pygments.lexers.minecraft',
+                                     'MCSchemaLexer'),
+                        'md': ('pygments.lexers.markup', 'MarkdownLexer'),
+                        'mediawiki': ('pygments.lexers.markup',
+                                      'WikitextLexer'),
+                        'menuconfig': ('pygments.lexers.configs',
+                                       'KconfigLexer'),
+                        'meson': ('pygments.lexers.meson', 'MesonLexer'),
+                        'meson.build': ('pygments.lexers.meson', 'MesonLexer'),
+                        'mf': ('pygments.lexers.make', 'MakefileLexer'),
+                        'mime': ('pygments.lexers.mime', 'MIMELexer'),
+                        'minid': ('pygments.lexers.d', 'MiniDLexer'),
+                        'miniscript': ('pygments.lexers.scripting',
+                                       'MiniScriptLexer'),
+                        'mips': ('pygments.lexers.mips', 'MIPSLexer'),
+                        'mma': ('pygments.lexers.algebra', 'MathematicaLexer'),
+                        'modelica': ('pygments.lexers.modeling',
+                                     'ModelicaLexer'),
+                        'modula2': ('pygments.lexers.modula2', 'Modula2Lexer'),
+                        'moin': ('pygments.lexers.markup', 'MoinWikiLexer'),
+                        'mojo': ('pygments.lexers.mojo', 'MojoLexer'),
+                        'monkey': ('pygments.lexers.basic', 'MonkeyLexer'),
+                        'monte': ('pygments.lexers.monte', 'MonteLexer'),
+                        'moo': ('pygments.lexers.scripting', 'MOOCodeLexer'),
+                        'moocode': ('pygments.lexers.scripting',
+                                    'MOOCodeLexer'),
+                        'moon': ('pygments.lexers.scripting',
+                                 'MoonScriptLexer'),
+                        'moonscript': ('pygments.lexers.scripting',
+                                       'MoonScriptLexer'),
+                        'mosel': ('pygments.lexers.mosel', 'MoselLexer'),
+                        'mozhashpreproc': ('pygments.lexers.markup',
+                                           'MozPreprocHashLexer'),
+                        'mozpercentpreproc': ('pygments.lexers.markup',
+                                              'MozPreprocPercentLexer'),
+                        'mq4': ('pygments.lexers.c_like', 'MqlLexer'),
+                        'mq5': ('pygments.lexers.c_like', 'MqlLexer'),
+                        'mql': ('pygments.lexers.c_like', 'MqlLexer'),
+                        'mql4': ('pygments.lexers.c_like', 'MqlLexer'),
+                        'mql5': ('pygments.lexers.c_like', 'MqlLexer'),
+                        'ms': ('pygments.lexers.scripting', 'MiniScriptLexer'),
+                        'msc': ('pygments.lexers.dsls', 'MscgenLexer'),
+                        'mscgen': ('pygments.lexers.dsls', 'MscgenLexer'),
+                        'mupad': ('pygments.lexers.algebra', 'MuPADLexer'),
+                        'mxml': ('pygments.lexers.actionscript', 'MxmlLexer'),
+                        'myghty': ('pygments.lexers.templates', 'MyghtyLexer'),
+                        'mysql': ('pygments.lexers.sql', 'MySqlLexer'),
+                        'nasm': ('pygments.lexers.asm', 'NasmLexer'),
+                        'nawk': ('pygments.lexers.textedit', 'AwkLexer'),
+                        'nb': ('pygments.lexers.algebra', 'MathematicaLexer'),
+                        'ncl': ('pygments.lexers.ncl', 'NCLLexer'),
+                        'nemerle': ('pygments.lexers.dotnet', 'NemerleLexer'),
+                        'nesc': ('pygments.lexers.c_like', 'NesCLexer'),
+                        'nestedtext': ('pygments.lexers.configs',
+                                       'NestedTextLexer'),
+                        'newlisp': ('pygments.lexers.lisp', 'NewLispLexer'),
+                        'newspeak': ('pygments.lexers.smalltalk',
+                                     'NewspeakLexer'),
+                        'ng2': ('pygments.lexers.templates', 'Angular2Lexer'),
+                        'nginx': ('pygments.lexers.configs', 'NginxConfLexer'),
+                        'nim': ('pygments.lexers.nimrod', 'NimrodLexer'),
+                        'nimrod': ('pygments.lexers.nimrod', 'NimrodLexer'),
+                        'nit': ('pygments.lexers.nit', 'NitLexer'),
+                        'nix': ('pygments.lexers.nix', 'NixLexer'),
+                        'nixos': ('pygments.lexers.nix', 'NixLexer'),
+                        'nodejsrepl': ('pygments.lexers.javascript',
+                                       'NodeConsoleLexer'),
+                        'notmuch': ('pygments.lexers.textfmts', 'NotmuchLexer'),
+                        'nroff': ('pygments.lexers.markup', 'GroffLexer'),
+                        'nsh': ('pygments.lexers.installers', 'NSISLexer'),
+                        'nsi': ('pygments.lexers.installers', 'NSISLexer'),
+                        'nsis': ('pygments.lexers.installers', 'NSISLexer'),
+                        'nt': ('pygments.lexers.configs', 'NestedTextLexer'),
+                        'numba_ir': ('pygments.lexers.numbair', 'NumbaIRLexer'),
+                        'numbair': ('pygments.lexers.numbair', 'NumbaIRLexer'),
+                        'numpy': ('pygments.lexers.python', 'NumPyLexer'),
+                        'nusmv': ('pygments.lexers.smv', 'NuSMVLexer'),
+                        'obj-c': ('pygments.lexers.objective',
+                                  'ObjectiveCLexer'),
+                        'obj-c++': ('pygments.lexers.objective',
+                                    'ObjectiveCppLexer'),
+                        'obj-j': ('pygments.lexers.javascript',
+                                  'ObjectiveJLexer'),
+                        'objc': ('pygments.lexers.objective',
+                                 'ObjectiveCLexer'),
+                        'objc++': ('pygments.lexers.objective',
+                                   'ObjectiveCppLexer'),
+                        'objdump': ('pygments.lexers.asm', 'ObjdumpLexer'),
+                        'objdump-nasm': ('pygments.lexers.asm',
+                                         'NasmObjdumpLexer'),
+                        'objective-c': ('pygments.lexers.objective',
+                                        'ObjectiveCLexer'),
+                        'objective-c++': ('pygments.lexers.objective',
+                                          'ObjectiveCppLexer'),
+                        'objective-j': ('pygments.lexers.javascript',
+                                        'ObjectiveJLexer'),
+                        'objectivec': ('pygments.lexers.objective',
+                                       'ObjectiveCLexer'),
+                        'objectivec++': ('pygments.lexers.objective',
+                                         'ObjectiveCppLexer'),
+                        'objectivej': ('pygments.lexers.javascript',
+                                       'ObjectiveJLexer'),
+                        'objectpascal': ('pygments.lexers.pascal',
+                                         'DelphiLexer'),
+                        'objj': ('pygments.lexers.javascript',
+                                 'ObjectiveJLexer'),
+                        'ocaml': ('pygments.lexers.ml', 'OcamlLexer'),
+                        'octave': ('pygments.lexers.matlab', 'OctaveLexer'),
+                        'odin': ('pygments.lexers.archetype', 'OdinLexer'),
+                        'omg-idl': ('pygments.lexers.c_like', 'OmgIdlLexer'),
+                        'oobas': ('pygments.lexers.dotnet', 'VbNetLexer'),
+                        'ooc': ('pygments.lexers.ooc', 'OocLexer'),
+                        'opa': ('pygments.lexers.ml', 'OpaLexer'),
+                        'openbugs': ('pygments.lexers.modeling', 'BugsLexer'),
+                        'openedge': ('pygments.lexers.business',
+                                     'OpenEdgeLexer'),
+                        'openrc': ('pygments.lexers.shell', 'BashLexer'),
+                        'openscad': ('pygments.lexers.openscad',
+                                     'OpenScadLexer'),
+                        'org': ('pygments.lexers.markup', 'OrgLexer'),
+                        'org-mode': ('pygments.lexers.markup', 'OrgLexer'),
+                        'orgmode': ('pygments.lexers.markup', 'OrgLexer'),
+                        'output': ('pygments.lexers.special', 'OutputLexer'),
+                        'pacmanconf': ('pygments.lexers.configs',
+                                       'PacmanConfLexer'),
+                        'pan': ('pygments.lexers.dsls', 'PanLexer'),
+                        'parasail': ('pygments.lexers.parasail',
+                                     'ParaSailLexer'),
+                        'pas': ('pygments.lexers.pascal', 'DelphiLexer'),
+                        'pascal': ('pygments.lexers.pascal', 'DelphiLexer'),
+                        'pawn': ('pygments.lexers.pawn', 'PawnLexer'),
+                        'pcmk': ('pygments.lexers.dsls', 'CrmshLexer'),
+                        'pddl': ('pygments.lexers.pddl', 'PddlLexer'),
+                        'peg': ('pygments.lexers.grammar_notation', 'PegLexer'),
+                        'pem': ('pygments.lexers.asc', 'AscLexer'),
+                        'perl': ('pygments.lexers.perl', 'PerlLexer'),
+                        'perl6': ('pygments.lexers.perl', 'Perl6Lexer'),
+                        'phix': ('pygments.lexers.phix', 'PhixLexer'),
+                        'php': ('pygments.lexers.php', 'PhpLexer'),
+                        'php3': ('pygments.lexers.php', 'PhpLexer'),
+                        'php4': ('pygments.lexers.php', 'PhpLexer'),
+                        'php5': ('pygments.lexers.php', 'PhpLexer'),
+                        'pig': ('pygments.lexers.jvm', 'PigLexer'),
+                        'pike': ('pygments.lexers.c_like', 'PikeLexer'),
+                        'pkgconfig': ('pygments.lexers.configs',
+                                      'PkgConfigLexer'),
+                        'pl': ('pygments.lexers.perl', 'PerlLexer'),
+                        'pl6': ('pygments.lexers.perl', 'Perl6Lexer'),
+                        'plpgsql': ('pygments.lexers.sql', 'PlPgsqlLexer'),
+                        'po': ('pygments.lexers.textfmts', 'GettextLexer'),
+                        'pointless': ('pygments.lexers.pointless',
+                                      'PointlessLexer'),
+                        'pony': ('pygments.lexers.pony', 'PonyLexer'),
+                        'portugol': ('pygments.lexers.pascal', 'PortugolLexer'),
+                        'posh': ('pygments.lexers.shell', 'PowerShellLexer'),
+                        'postgres': ('pygments.lexers.sql', 'PostgresLexer'),
+                        'postgres-console': ('pygments.lexers.sql',
+                                             'PostgresConsoleLexer'),
+                        'postgres-explain': ('pygments.lexers.sql',
+                                             'PostgresExplainLexer'),
+                        'postgresql': ('pygments.lexers.sql', 'PostgresLexer'),
+                        'postgresql-console': ('pygments.lexers.sql',
+                                               'PostgresConsoleLexer'),
+                        'postscr': ('pygments.lexers.graphics',
+                                    'PostScriptLexer'),
+                        'postscript': ('pygments.lexers.graphics',
+                                       'PostScriptLexer'),
+                        'pot': ('pygments.lexers.textfmts', 'GettextLexer'),
+                        'pov': ('pygments.lexers.graphics', 'PovrayLexer'),
+                        'powershell': ('pygments.lexers.shell',
+                                       'PowerShellLexer'),
+                        'praat': ('pygments.lexers.praat', 'PraatLexer'),
+                        'procfile': ('pygments.lexers.procfile',
+                                     'ProcfileLexer'),
+                        'progress': ('pygments.lexers.business',
+                                     'OpenEdgeLexer'),
+                        'prolog': ('pygments.lexers.prolog', 'PrologLexer'),
+                        'promela': ('pygments.lexers.c_like', 'PromelaLexer'),
+                        'promql': ('pygments.lexers.promql', 'PromQLLexer'),
+                        'properties': ('pygments.lexers.configs',
+                                       'PropertiesLexer'),
+                        'proto': ('pygments.lexers.dsls', 'ProtoBufLexer'),
+                        'protobuf': ('pygments.lexers.dsls', 'ProtoBufLexer'),
+                        'prql': ('pygments.lexers.prql', 'PrqlLexer'),
+                        'ps1': ('pygments.lexers.shell', 'PowerShellLexer'),
+                        'ps1con': ('pygments.lexers.shell',
+                                   'PowerShellSessionLexer'),
+                        'psm1': ('pygments.lexers.shell', 'PowerShellLexer'),
+                        'psql': ('pygments.lexers.sql', 'PostgresConsoleLexer'),
+                        'psysh': ('pygments.lexers.php', 'PsyshConsoleLexer'),
+                        'ptx': ('pygments.lexers.ptx', 'PtxLexer'),
+                        'pug': ('pygments.lexers.html', 'PugLexer'),
+                        'puppet': ('pygments.lexers.dsls', 'PuppetLexer'),
+                        'pwsh': ('pygments.lexers.shell', 'PowerShellLexer'),
+                        'pwsh-session': ('pygments.lexers.shell',
+                                         'PowerShellSessionLexer'),
+                        'py': ('pygments.lexers.python', 'PythonLexer'),
+                        'py+ul4': ('pygments.lexers.ul4', 'PythonUL4Lexer'),
+                        'py2': ('pygments.lexers.python', 'Python2Lexer'),
+                        'py2tb': ('pygments.lexers.python',
+                                  'Python2TracebackLexer'),
+                        'py3': ('pygments.lexers.python', 'PythonLexer'),
+                        'py3tb': ('pygments.lexers.python',
+                                  'PythonTracebackLexer'),
+                        'pycon': ('pygments.lexers.python',
+                                  'PythonConsoleLexer'),
+                        'pyi': ('pygments.lexers.python', 'PythonLexer'),
+                        'pypy': ('pygments.lexers.console', 'PyPyLogLexer'),
+                        'pypylog': ('pygments.lexers.console', 'PyPyLogLexer'),
+                        'pyrex': ('pygments.lexers.python', 'CythonLexer'),
+                        'pytb': ('pygments.lexers.python',
+                                 'PythonTracebackLexer'),
+                        'python': ('pygments.lexers.python', 'PythonLexer'),
+                        'python-console': ('pygments.lexers.python',
+                                           'PythonConsoleLexer'),
+                        'python2': ('pygments.lexers.python', 'Python2Lexer'),
+                        'python3': ('pygments.lexers.python', 'PythonLexer'),
+                        'pyx': ('pygments.lexers.python', 'CythonLexer'),
+                        'q': ('pygments.lexers.q', 'QLexer'),
+                        'qbasic': ('pygments.lexers.basic', 'QBasicLexer'),
+                        'qbs': ('pygments.lexers.webmisc', 'QmlLexer'),
+                        'ql': ('pygments.lexers.codeql', 'CodeQLLexer'),
+                        'qlik': ('pygments.lexers.qlik', 'QlikLexer'),
+                        'qlikscript': ('pygments.lexers.qlik', 'QlikLexer'),
+                        'qliksense': ('pygments.lexers.qlik', 'QlikLexer'),
+                        'qlikview': ('pygments.lexers.qlik', 'QlikLexer'),
+                        'qml': ('pygments.lexers.webmisc', 'QmlLexer'),
+                        'qvt': ('pygments.lexers.qvt', 'QVToLexer'),
+                        'qvto': ('pygments.lexers.qvt', 'QVToLexer'),
+                        'r': ('pygments.lexers.r', 'SLexer'),
+                        'racket': ('pygments.lexers.lisp', 'RacketLexer'),
+                        'ragel': ('pygments.lexers.parsers', 'RagelLexer'),
+                        'ragel-c': ('pygments.lexers.parsers', 'RagelCLexer'),
+                        'ragel-cpp': ('pygments.lexers.parsers',
+                                      'RagelCppLexer'),
+                        'ragel-d': ('pygments.lexers.parsers', 'RagelDLexer'),
+                        'ragel-em': ('pygments.lexers.parsers',
+                                     'RagelEmbeddedLexer'),
+                        'ragel-java': ('pygments.lexers.parsers',
+                                       'RagelJavaLexer'),
+                        'ragel-objc': ('pygments.lexers.parsers',
+                                       'RagelObjectiveCLexer'),
+                        'ragel-rb': ('pygments.lexers.parsers',
+                                     'RagelRubyLexer'),
+                        'ragel-ruby': ('pygments.lexers.parsers',
+                                       'RagelRubyLexer'),
+                        'raku': ('pygments.lexers.perl', 'Perl6Lexer'),
+                        'rb': ('pygments.lexers.ruby', 'RubyLexer'),
+                        'rbcon': ('pygments.lexers.ruby', 'RubyConsoleLexer'),
+                        'rconsole': ('pygments.lexers.r', 'RConsoleLexer'),
+                        'rd': ('pygments.lexers.r', 'RdLexer'),
+                        'react': ('pygments.lexers.jsx', 'JsxLexer'),
+                        'reason': ('pygments.lexers.ml', 'ReasonLexer'),
+                        'reasonml': ('pygments.lexers.ml', 'ReasonLexer'),
+                        'rebol': ('pygments.lexers.rebol', 'RebolLexer'),
+                        'red': ('pygments.lexers.rebol', 'RedLexer'),
+                        'red/system': ('pygments.lexers.rebol', 'RedLexer'),
+                        'redcode': ('pygments.lexers.esoteric', 'RedcodeLexer'),
+                        'registry': ('pygments.lexers.configs', 'RegeditLexer'),
+                        'rego': ('pygments.lexers.rego', 'RegoLexer'),
+                        'resource': ('pygments.lexers.resource',
+                                     'ResourceLexer'),
+                        'resourcebundle': ('pygments.lexers.resource',
+                                           'ResourceLexer'),
+                        'rest': ('pygments.lexers.markup', 'RstLexer'),
+                        'restructuredtext': ('pygments.lexers.markup',
+                                             'RstLexer'),
+                        'rexx': ('pygments.lexers.scripting', 'RexxLexer'),
+                        'rhtml': ('pygments.lexers.templates', 'RhtmlLexer'),
+                        'ride': ('pygments.lexers.ride', 'RideLexer'),
+                        'rita': ('pygments.lexers.rita', 'RitaLexer'),
+                        'rkt': ('pygments.lexers.lisp', 'RacketLexer'),
+                        'rnc': ('pygments.lexers.rnc', 'RNCCompactLexer'),
+                        'rng-compact': ('pygments.lexers.rnc',
+                                        'RNCCompactLexer'),
+                        'roboconf-graph': ('pygments.lexers.roboconf',
+                                           'RoboconfGraphLexer'),
+                        'roboconf-instances': ('pygments.lexers.roboconf',
+                                               'RoboconfInstancesLexer'),
+                        'robotframework': ('pygments.lexers.robotframework',
+                                           'RobotFrameworkLexer'),
+                        'rout': ('pygments.lexers.r', 'RConsoleLexer'),
+                        'rql': ('pygments.lexers.sql', 'RqlLexer'),
+                        'rs': ('pygments.lexers.rust', 'RustLexer'),
+                        'rsl': ('pygments.lexers.dsls', 'RslLexer'),
+                        'rst': ('pygments.lexers.markup', 'RstLexer'),
+                        'rts': ('pygments.lexers.trafficscript', 'RtsLexer'),
+                        'ruby': ('pygments.lexers.ruby', 'RubyLexer'),
+                        'rust': ('pygments.lexers.rust', 'RustLexer'),
+                        's': ('pygments.lexers.r', 'SLexer'),
+                        'sage': ('pygments.lexers.python', 'PythonLexer'),
+                        'salt': ('pygments.lexers.templates', 'YamlJinjaLexer'),
+                        'sarl': ('pygments.lexers.jvm', 'SarlLexer'),
+                        'sas': ('pygments.lexers.sas', 'SASLexer'),
+                        'sass': ('pygments.lexers.css', 'SassLexer'),
+                        'savi': ('pygments.lexers.savi', 'SaviLexer'),
+                        'sbatch': ('pygments.lexers.shell', 'SlurmBashLexer'),
+                        'sc': ('pygments.lexers.supercollider',
+                               'SuperColliderLexer'),
+                        'scala': ('pygments.lexers.jvm', 'ScalaLexer'),
+                        'scaml': ('pygments.lexers.html', 'ScamlLexer'),
+                        'scd': ('pygments.lexers.scdoc', 'ScdocLexer'),
+                        'scdoc': ('pygments.lexers.scdoc', 'ScdocLexer'),
+                        'scheme': ('pygments.lexers.lisp', 'SchemeLexer'),
+                        'scilab': ('pygments.lexers.matlab', 'ScilabLexer'),
+                        'scm': ('pygments.lexers.lisp', 'SchemeLexer'),
+                        'scss': ('pygments.lexers.css', 'ScssLexer'),
+                        'sed': ('pygments.lexers.textedit', 'SedLexer'),
+                        'sgf': ('pygments.lexers.sgf', 'SmartGameFormatLexer'),
+                        'sh': ('pygments.lexers.shell', 'BashLexer'),
+                        'shell': ('pygments.lexers.shell', 'BashLexer'),
+                        'shell-session': ('pygments.lexers.shell',
+                                          'BashSessionLexer'),
+                        'shen': ('pygments.lexers.lisp', 'ShenLexer'),
+                        'shex': ('pygments.lexers.rdf', 'ShExCLexer'),
+                        'shexc': ('pygments.lexers.rdf', 'ShExCLexer'),
+                        'sieve': ('pygments.lexers.sieve', 'SieveLexer'),
+                        'silver': ('pygments.lexers.verification',
+                                   'SilverLexer'),
+                        'singularity': ('pygments.lexers.configs',
+                                        'SingularityLexer'),
+                        'slash': ('pygments.lexers.slash', 'SlashLexer'),
+                        'slim': ('pygments.lexers.webmisc', 'SlimLexer'),
+                        'sls': ('pygments.lexers.templates', 'YamlJinjaLexer'),
+                        'slurm': ('pygments.lexers.shell', 'SlurmBashLexer'),
+                        'smali': ('pygments.lexers.dalvik', 'SmaliLexer'),
+                        'smalltalk': ('pygments.lexers.smalltalk',
+                                      'SmalltalkLexer'),
+                        'smarty': ('pygments.lexers.templates', 'SmartyLexer'),
+                        'smithy': ('pygments.lexers.smithy', 'SmithyLexer'),
+                        'sml': ('pygments.lexers.ml', 'SMLLexer'),
+                        'snbt': ('pygments.lexers.minecraft', 'SNBTLexer'),
+                        'snobol': ('pygments.lexers.snobol', 'SnobolLexer'),
+                        'snowball': ('pygments.lexers.dsls', 'SnowballLexer'),
+                        'sobas': ('pygments.lexers.dotnet', 'VbNetLexer'),
+                        'solidity': ('pygments.lexers.solidity',
+                                     'SolidityLexer'),
+                        'soong': ('pygments.lexers.soong', 'SoongLexer'),
+                        'sophia': ('pygments.lexers.sophia', 'SophiaLexer'),
+                        'sources.list': ('pygments.lexers.installers',
+                                         'SourcesListLexer'),
+                        'sourceslist': ('pygments.lexers.installers',
+                                        'SourcesListLexer'),
+                        'sp': ('pygments.lexers.pawn', 'SourcePawnLexer'),
+                        'sparql': ('pygments.lexers.rdf', 'SparqlLexer'),
+                        'spec': ('pygments.lexers.installers', 'RPMSpecLexer'),
+                        'spice': ('pygments.lexers.spice', 'SpiceLexer'),
+                        'spicelang': ('pygments.lexers.spice', 'SpiceLexer'),
+                        'spitfire': ('pygments.lexers.templates',
+                                     'CheetahLexer'),
+                        'splus': ('pygments.lexers.r', 'SLexer'),
+                        'sql': ('pygments.lexers.sql', 'SqlLexer'),
+                        'sql+jinja': ('pygments.lexers.templates',
+                                      'SqlJinjaLexer'),
+                        'sqlite3': ('pygments.lexers.sql',
+                                    'SqliteConsoleLexer'),
+                        'squeak': ('pygments.lexers.smalltalk',
+                                   'SmalltalkLexer'),
+                        'squid': ('pygments.lexers.configs', 'SquidConfLexer'),
+                        'squid.conf': ('pygments.lexers.configs',
+                                       'SquidConfLexer'),
+                        'squidconf': ('pygments.lexers.configs',
+                                      'SquidConfLexer'),
+                        'srcinfo': ('pygments.lexers.srcinfo', 'SrcinfoLexer'),
+                        'ssed': ('pygments.lexers.textedit', 'SedLexer'),
+                        'ssp': ('pygments.lexers.templates', 'SspLexer'),
+                        'st': ('pygments.lexers.smalltalk', 'SmalltalkLexer'),
+                        'stan': ('pygments.lexers.modeling', 'StanLexer'),
+                        'starlark': ('pygments.lexers.python', 'PythonLexer'),
+                        'stata': ('pygments.lexers.stata', 'StataLexer'),
+                        'supercollider': ('pygments.lexers.supercollider',
+                                          'SuperColliderLexer'),
+                        'sv': ('pygments.lexers.hdl', 'SystemVerilogLexer'),
+                        'swift': ('pygments.lexers.objective', 'SwiftLexer'),
+                        'swig': ('pygments.lexers.c_like', 'SwigLexer'),
+                        'systemd': ('pygments.lexers.configs', 'SystemdLexer'),
+                        'systemverilog': ('pygments.lexers.hdl',
+                                          'SystemVerilogLexer'),
+                        't-sql': ('pygments.lexers.sql', 'TransactSqlLexer'),
+                        'tablegen': ('pygments.lexers.tablegen',
+                                     'TableGenLexer'),
+                        'tact': ('pygments.lexers.tact', 'TactLexer'),
+                        'tads3': ('pygments.lexers.int_fiction', 'Tads3Lexer'),
+                        'tal': ('pygments.lexers.tal', 'TalLexer'),
+                        'tap': ('pygments.lexers.testing', 'TAPLexer'),
+                        'tasm': ('pygments.lexers.asm', 'TasmLexer'),
+                        'tcl': ('pygments.lexers.tcl', 'TclLexer'),
+                        'tcsh': ('pygments.lexers.shell', 'TcshLexer'),
+                        'tcshcon': ('pygments.lexers.shell',
+                                    'TcshSessionLexer'),
+                        'td': ('pygments.lexers.tablegen', 'TableGenLexer'),
+                        'tea': ('pygments.lexers.templates',
+                                'TeaTemplateLexer'),
+                        'teal': ('pygments.lexers.teal', 'TealLexer'),
+                        'teraterm': ('pygments.lexers.teraterm',
+                                     'TeraTermLexer'),
+                        'teratermmacro': ('pygments.lexers.teraterm',
+                                          'TeraTermLexer'),
+                        'termcap': ('pygments.lexers.configs', 'TermcapLexer'),
+                        'terminfo': ('pygments.lexers.configs',
+                                     'TerminfoLexer'),
+                        'terraform': ('pygments.lexers.configs',
+                                      'TerraformLexer'),
+                        'tex': ('pygments.lexers.markup', 'TexLexer'),
+                        'text': ('pygments.lexers.special', 'TextLexer'),
+                        'tf': ('pygments.lexers.configs', 'TerraformLexer'),
+                        'thingsdb': ('pygments.lexers.thingsdb',
+                                     'ThingsDBLexer'),
+                        'thrift': ('pygments.lexers.dsls', 'ThriftLexer'),
+                        'ti': ('pygments.lexers.thingsdb', 'ThingsDBLexer'),
+                        'tid': ('pygments.lexers.markup', 'TiddlyWiki5Lexer'),
+                        'tlb': ('pygments.lexers.tlb', 'TlbLexer'),
+                        'tls': ('pygments.lexers.tls', 'TlsLexer'),
+                        'tnt': ('pygments.lexers.tnt', 'TNTLexer'),
+                        'todotxt': ('pygments.lexers.textfmts', 'TodotxtLexer'),
+                        'toml': ('pygments.lexers.configs', 'TOMLLexer'),
+                        'trac-wiki': ('pygments.lexers.markup',
+                                      'MoinWikiLexer'),
+                        'trafficscript': ('pygments.lexers.trafficscript',
+                                          'RtsLexer'),
+                        'treetop': ('pygments.lexers.parsers', 'TreetopLexer'),
+                        'ts': ('pygments.lexers.javascript', 'TypeScriptLexer'),
+                        'tsql': ('pygments.lexers.sql', 'TransactSqlLexer'),
+                        'tsx': ('pygments.lexers.jsx', 'TsxLexer'),
+                        'ttl': ('pygments.lexers.teraterm', 'TeraTermLexer'),
+                        'turtle': ('pygments.lexers.rdf', 'TurtleLexer'),
+                        'twig': ('pygments.lexers.templates', 'TwigLexer'),
+                        'typescript': ('pygments.lexers.javascript',
+                                       'TypeScriptLexer'),
+                        'typoscript': ('pygments.lexers.typoscript',
+                                       'TypoScriptLexer'),
+                        'typoscriptcssdata': ('pygments.lexers.typoscript',
+                                              'TypoScriptCssDataLexer'),
+                        'typoscripthtmldata': ('pygments.lexers.typoscript',
+                                               'TypoScriptHtmlDataLexer'),
+                        'typst': ('pygments.lexers.typst', 'TypstLexer'),
+                        'ucode': ('pygments.lexers.unicon', 'UcodeLexer'),
+                        'udiff': ('pygments.lexers.diff', 'DiffLexer'),
+                        'ul4': ('pygments.lexers.ul4', 'UL4Lexer'),
+                        'unicon': ('pygments.lexers.unicon', 'UniconLexer'),
+                        'unixconfig': ('pygments.lexers.configs',
+                                       'UnixConfigLexer'),
+                        'urbiscript': ('pygments.lexers.urbi',
+                                       'UrbiscriptLexer'),
+                        'urlencoded': ('pygments.lexers.html',
+                                       'UrlEncodedLexer'),
+                        'usd': ('pygments.lexers.usd', 'UsdLexer'),
+                        'usda': ('pygments.lexers.usd', 'UsdLexer'),
+                        'uxntal': ('pygments.lexers.tal', 'TalLexer'),
+                        'v': ('pygments.lexers.hdl', 'VerilogLexer'),
+                        'vala': ('pygments.lexers.c_like', 'ValaLexer'),
+                        'vapi': ('pygments.lexers.c_like', 'ValaLexer'),
+                        'vb.net': ('pygments.lexers.dotnet', 'VbNetLexer'),
+                        'vbnet': ('pygments.lexers.dotnet', 'VbNetLexer'),
+                        'vbscript': ('pygments.lexers.basic', 'VBScriptLexer'),
+                        'vcl': ('pygments.lexers.varnish', 'VCLLexer'),
+                        'vclsnippet': ('pygments.lexers.varnish',
+                                       'VCLSnippetLexer'),
+                        'vclsnippets': ('pygments.lexers.varnish',
+                                        'VCLSnippetLexer'),
+                        'vctreestatus': ('pygments.lexers.console',
+                                         'VCTreeStatusLexer'),
+                        'velocity': ('pygments.lexers.templates',
+                                     'VelocityLexer'),
+                        'verifpal': ('pygments.lexers.verifpal',
+                                     'VerifpalLexer'),
+                        'verilog': ('pygments.lexers.hdl', 'VerilogLexer'),
+                        'vfp': ('pygments.lexers.foxpro', 'FoxProLexer'),
+                        'vgl': ('pygments.lexers.dsls', 'VGLLexer'),
+                        'vhdl': ('pygments.lexers.hdl', 'VhdlLexer'),
+                        'vim': ('pygments.lexers.textedit', 'VimLexer'),
+                        'visual-basic': ('pygments.lexers.dotnet',
+                                         'VbNetLexer'),
+                        'visualbasic': ('pygments.lexers.dotnet', 'VbNetLexer'),
+                        'visualprolog': ('pygments.lexers.vip',
+                                         'VisualPrologLexer'),
+                        'visualprologgrammar': ('pygments.lexers.vip',
+                                                'VisualPrologGrammarLexer'),
+                        'vue': ('pygments.lexers.html', 'VueLexer'),
+                        'vyper': ('pygments.lexers.vyper', 'VyperLexer'),
+                        'wast': ('pygments.lexers.webassembly', 'WatLexer'),
+                        'wat': ('pygments.lexers.webassembly', 'WatLexer'),
+                        'wdiff': ('pygments.lexers.diff', 'WDiffLexer'),
+                        'webidl': ('pygments.lexers.webidl', 'WebIDLLexer'),
+                        'wgsl': ('pygments.lexers.wgsl', 'WgslLexer'),
+                        'whiley': ('pygments.lexers.whiley', 'WhileyLexer'),
+                        'wikitext': ('pygments.lexers.markup', 'WikitextLexer'),
+                        'winbatch': ('pygments.lexers.shell', 'BatchLexer'),
+                        'winbugs': ('pygments.lexers.modeling', 'BugsLexer'),
+                        'wowtoc': ('pygments.lexers.wowtoc', 'WoWTocLexer'),
+                        'wren': ('pygments.lexers.wren', 'WrenLexer'),
+                        'x++': ('pygments.lexers.dotnet', 'XppLexer'),
+                        'x10': ('pygments.lexers.x10', 'X10Lexer'),
+                        'xbase': ('pygments.lexers.foxpro', 'FoxProLexer'),
+                        'xml': ('pygments.lexers.html', 'XmlLexer'),
+                        'xml+cheetah': ('pygments.lexers.templates',
+                                        'CheetahXmlLexer'),
+                        'xml+django': ('pygments.lexers.templates',
+                                       'XmlDjangoLexer'),
+                        'xml+erb': ('pygments.lexers.templates', 'XmlErbLexer'),
+                        'xml+evoque': ('pygments.lexers.templates',
+                                       'EvoqueXmlLexer'),
+                        'xml+genshi': ('pygments.lexers.templates',
+                                       'GenshiLexer'),
+                        'xml+jinja': ('pygments.lexers.templates',
+                                      'XmlDjangoLexer'),
+                        'xml+kid': ('pygments.lexers.templates', 'GenshiLexer'),
+                        'xml+lasso': ('pygments.lexers.templates',
+                                      'LassoXmlLexer'),
+                        'xml+mako': ('pygments.lexers.templates',
+                                     'MakoXmlLexer'),
+                        'xml+myghty': ('pygments.lexers.templates',
+                                       'MyghtyXmlLexer'),
+                        'xml+php': ('pygments.lexers.templates', 'XmlPhpLexer'),
+                        'xml+ruby': ('pygments.lexers.templates',
+                                     'XmlErbLexer'),
+                        'xml+smarty': ('pygments.lexers.templates',
+                                       'XmlSmartyLexer'),
+                        'xml+spitfire': ('pygments.lexers.templates',
+                                         'CheetahXmlLexer'),
+                        'xml+ul4': ('pygments.lexers.ul4', 'XMLUL4Lexer'),
+                        'xml+velocity': ('pygments.lexers.templates',
+                                         'VelocityXmlLexer'),
+                        'xorg.conf': ('pygments.lexers.xorg', 'XorgLexer'),
+                        'xpp': ('pygments.lexers.dotnet', 'XppLexer'),
+                        'xq': ('pygments.lexers.webmisc', 'XQueryLexer'),
+                        'xql': ('pygments.lexers.webmisc', 'XQueryLexer'),
+                        'xqm': ('pygments.lexers.webmisc', 'XQueryLexer'),
+                        'xquery': ('pygments.lexers.webmisc', 'XQueryLexer'),
+                        'xqy': ('pygments.lexers.webmisc', 'XQueryLexer'),
+                        'xslt': ('pygments.lexers.html', 'XsltLexer'),
+                        'xten': ('pygments.lexers.x10', 'X10Lexer'),
+                        'xtend': ('pygments.lexers.jvm', 'XtendLexer'),
+                        'xul+mozpreproc': ('pygments.lexers.markup',
+                                           'MozPreprocXulLexer'),
+                        'yaml': ('pygments.lexers.data', 'YamlLexer'),
+                        'yaml+jinja': ('pygments.lexers.templates',
+                                       'YamlJinjaLexer'),
+                        'yang': ('pygments.lexers.yang', 'YangLexer'),
+                        'yar': ('pygments.lexers.yara', 'YaraLexer'),
+                        'yara': ('pygments.lexers.yara', 'YaraLexer'),
+                        'zeek': ('pygments.lexers.dsls', 'ZeekLexer'),
+                        'zephir': ('pygments.lexers.php', 'ZephirLexer'),
+                        'zetasql': ('pygments.lexers.sql', 'GoogleSqlLexer'),
+                        'zig': ('pygments.lexers.zig', 'ZigLexer'),
+                        'zone': ('pygments.lexers.dns', 'DnsZoneLexer'),
+                        'zsh': ('pygments.lexers.shell', 'BashLexer'),
+                        '🔥': ('pygments.lexers.mojo', 'MojoLexer')},
+            'exts': {'.1p': ('pygments.lexers.markup', 'GroffLexer'),
                      '.3pm': ('pygments.lexers.markup', 'GroffLexer'),
                      '.6pl': ('pygments.lexers.perl', 'Perl6Lexer'),
                      '.6pm': ('pygments.lexers.perl', 'Perl6Lexer'),
@@ -527,6 +1729,7 @@
                      '.lisp': ('pygments.lexers.lisp', 'CommonLispLexer'),
                      '.ll': ('pygments.lexers.asm', 'LlvmLexer'),
                      '.load': ('pygments.lexers.shell', 'FishShellLexer'),
+                     '.log': ('pygments.lexers.special', 'TextLexer'),
                      '.logtalk': ('pygments.lexers.prolog', 'LogtalkLexer'),
                      '.lpad': ('pygments.lexers.cplint', 'CplintLexer'),
                      '.ls': ('pygments.lexers.javascript', 'LiveScriptLexer'),
@@ -999,7 +2202,989 @@
                      'todo.txt': ('pygments.lexers.textfmts', 'TodotxtLexer'),
                      'vimrc': ('pygments.lexers.textedit', 'VimLexer'),
                      'xorg.conf': ('pygments.lexers.xorg', 'XorgLexer'),
-                     'zshrc': ('pygments.lexers.shell', 'BashLexer')}},
+                     'zshrc': ('pygments.lexers.shell', 'BashLexer')},
+            'globs': {'*.[1-9]': ('pygments.lexers.markup', 'GroffLexer'),
+                      '*.[gs]sed': ('pygments.lexers.textedit', 'SedLexer'),
+                      '*.lasso[89]': ('pygments.lexers.javascript',
+                                      'LassoLexer'),
+                      '*.php[345]': ('pygments.lexers.php', 'PhpLexer'),
+                      '*.x[bp]m': ('pygments.lexers.c_cpp', 'CLexer'),
+                      '*Config.in*': ('pygments.lexers.configs',
+                                      'KconfigLexer'),
+                      '*Spec.hs': ('pygments.lexers.haskell', 'HspecLexer'),
+                      '.bash_*': ('pygments.lexers.shell', 'BashLexer'),
+                      'Kconfig*': ('pygments.lexers.configs', 'KconfigLexer'),
+                      'Makefile.*': ('pygments.lexers.make', 'MakefileLexer'),
+                      'bash_*': ('pygments.lexers.shell', 'BashLexer'),
+                      'external.in*': ('pygments.lexers.configs',
+                                       'KconfigLexer')},
+            'mimetypes': {'application/atom+xml': ('pygments.lexers.html',
+                                                   'XmlLexer'),
+                          'application/javascript': ('pygments.lexers.javascript',
+                                                     'JavascriptLexer'),
+                          'application/jsgf': ('pygments.lexers.grammar_notation',
+                                               'JsgfLexer'),
+                          'application/json': ('pygments.lexers.data',
+                                               'JsonLexer'),
+                          'application/json-object': ('pygments.lexers.data',
+                                                      'JsonLexer'),
+                          'application/json-seq': ('pygments.lexers.data',
+                                                   'JsonLexer'),
+                          'application/jsonl': ('pygments.lexers.data',
+                                                'JsonLexer'),
+                          'application/juttle': ('pygments.lexers.javascript',
+                                                 'JuttleLexer'),
+                          'application/kal': ('pygments.lexers.javascript',
+                                              'KalLexer'),
+                          'application/ld+json': ('pygments.lexers.data',
+                                                  'JsonLdLexer'),
+                          'application/mathematica': ('pygments.lexers.algebra',
+                                                      'MathematicaLexer'),
+                          'application/pem-certificate-chain': ('pygments.lexers.asc',
+                                                                'AscLexer'),
+                          'application/pgp-encrypted': ('pygments.lexers.asc',
+                                                        'AscLexer'),
+                          'application/pgp-keys': ('pygments.lexers.asc',
+                                                   'AscLexer'),
+                          'application/pgp-signature': ('pygments.lexers.asc',
+                                                        'AscLexer'),
+                          'application/postscript': ('pygments.lexers.graphics',
+                                                     'PostScriptLexer'),
+                          'application/prql': ('pygments.lexers.prql',
+                                               'PrqlLexer'),
+                          'application/rss+xml': ('pygments.lexers.html',
+                                                  'XmlLexer'),
+                          'application/sparql-query': ('pygments.lexers.rdf',
+                                                       'SparqlLexer'),
+                          'application/supercollider': ('pygments.lexers.supercollider',
+                                                        'SuperColliderLexer'),
+                          'application/toml': ('pygments.lexers.configs',
+                                               'TOMLLexer'),
+                          'application/vnd.wolfram.cdf': ('pygments.lexers.algebra',
+                                                          'MathematicaLexer'),
+                          'application/vnd.wolfram.mathematica': ('pygments.lexers.algebra',
+                                                                  'MathematicaLexer'),
+                          'application/vnd.wolfram.mathematica.package': ('pygments.lexers.algebra',
+                                                                          'MathematicaLexer'),
+                          'application/x-actionscript': ('pygments.lexers.actionscript',
+                                                         'ActionScriptLexer'),
+                          'application/x-actionscript3': ('pygments.lexers.actionscript',
+                                                          'ActionScript3Lexer'),
+                          'application/x-awk': ('pygments.lexers.textedit',
+                                                'AwkLexer'),
+                          'application/x-befunge': ('pygments.lexers.esoteric',
+                                                    'BefungeLexer'),
+                          'application/x-berry': ('pygments.lexers.berry',
+                                                  'BerryLexer'),
+                          'application/x-brainfuck': ('pygments.lexers.esoteric',
+                                                      'BrainfuckLexer'),
+                          'application/x-chaiscript': ('pygments.lexers.scripting',
+                                                       'ChaiscriptLexer'),
+                          'application/x-cheetah': ('pygments.lexers.templates',
+                                                    'CheetahLexer'),
+                          'application/x-clojure': ('pygments.lexers.jvm',
+                                                    'ClojureLexer'),
+                          'application/x-clojurescript': ('pygments.lexers.jvm',
+                                                          'ClojureScriptLexer'),
+                          'application/x-coldfusion': ('pygments.lexers.templates',
+                                                       'ColdfusionHtmlLexer'),
+                          'application/x-csh': ('pygments.lexers.shell',
+                                                'TcshLexer'),
+                          'application/x-cython': ('pygments.lexers.python',
+                                                   'CythonLexer'),
+                          'application/x-desktop': ('pygments.lexers.configs',
+                                                    'DesktopLexer'),
+                          'application/x-django-templating': ('pygments.lexers.templates',
+                                                              'DjangoLexer'),
+                          'application/x-dos-batch': ('pygments.lexers.shell',
+                                                      'BatchLexer'),
+                          'application/x-ecl': ('pygments.lexers.ecl',
+                                                'ECLLexer'),
+                          'application/x-elisp': ('pygments.lexers.lisp',
+                                                  'EmacsLispLexer'),
+                          'application/x-evoque': ('pygments.lexers.templates',
+                                                   'EvoqueLexer'),
+                          'application/x-fantom': ('pygments.lexers.fantom',
+                                                   'FantomLexer'),
+                          'application/x-fish': ('pygments.lexers.shell',
+                                                 'FishShellLexer'),
+                          'application/x-forth': ('pygments.lexers.forth',
+                                                  'ForthLexer'),
+                          'application/x-gdscript': ('pygments.lexers.gdscript',
+                                                     'GDScriptLexer'),
+                          'application/x-genshi': ('pygments.lexers.templates',
+                                                   'GenshiLexer'),
+                          'application/x-genshi-text': ('pygments.lexers.templates',
+                                                        'GenshiTextLexer'),
+                          'application/x-gettext': ('pygments.lexers.textfmts',
+                                                    'GettextLexer'),
+                          'application/x-gooddata-maql': ('pygments.lexers.business',
+                                                          'MaqlLexer'),
+                          'application/x-httpd-lasso': ('pygments.lexers.templates',
+                                                        'LassoHtmlLexer'),
+                          'application/x-httpd-lasso[89]': ('pygments.lexers.templates',
+                                                            'LassoHtmlLexer'),
+                          'application/x-httpd-php': ('pygments.lexers.templates',
+                                                      'HtmlPhpLexer'),
+                          'application/x-httpd-php3': ('pygments.lexers.templates',
+                                                       'HtmlPhpLexer'),
+                          'application/x-httpd-php4': ('pygments.lexers.templates',
+                                                       'HtmlPhpLexer'),
+                          'application/x-httpd-php5': ('pygments.lexers.templates',
+                                                       'HtmlPhpLexer'),
+                          'application/x-hy': ('pygments.lexers.lisp',
+                                               'HyLexer'),
+                          'application/x-hybris': ('pygments.lexers.scripting',
+                                                   'HybrisLexer'),
+                          'application/x-janet': ('pygments.lexers.lisp',
+                                                  'JanetLexer'),
+                          'application/x-javascript': ('pygments.lexers.javascript',
+                                                       'JavascriptLexer'),
+                          'application/x-javascript+cheetah': ('pygments.lexers.templates',
+                                                               'CheetahJavascriptLexer'),
+                          'application/x-javascript+django': ('pygments.lexers.templates',
+                                                              'JavascriptDjangoLexer'),
+                          'application/x-javascript+genshi': ('pygments.lexers.templates',
+                                                              'JavascriptGenshiLexer'),
+                          'application/x-javascript+jinja': ('pygments.lexers.templates',
+                                                             'JavascriptDjangoLexer'),
+                          'application/x-javascript+lasso': ('pygments.lexers.templates',
+                                                             'LassoJavascriptLexer'),
+                          'application/x-javascript+mako': ('pygments.lexers.templates',
+                                                            'MakoJavascriptLexer'),
+                          'application/x-javascript+myghty': ('pygments.lexers.templates',
+                                                              'MyghtyJavascriptLexer'),
+                          'application/x-javascript+php': ('pygments.lexers.templates',
+                                                           'JavascriptPhpLexer'),
+                          'application/x-javascript+ruby': ('pygments.lexers.templates',
+                                                            'JavascriptErbLexer'),
+                          'application/x-javascript+smarty': ('pygments.lexers.templates',
+                                                              'JavascriptSmartyLexer'),
+                          'application/x-javascript+spitfire': ('pygments.lexers.templates',
+                                                                'CheetahJavascriptLexer'),
+                          'application/x-jinja': ('pygments.lexers.templates',
+                                                  'DjangoLexer'),
+                          'application/x-jsgf': ('pygments.lexers.grammar_notation',
+                                                 'JsgfLexer'),
+                          'application/x-jsp': ('pygments.lexers.templates',
+                                                'JspLexer'),
+                          'application/x-julia': ('pygments.lexers.julia',
+                                                  'JuliaLexer'),
+                          'application/x-juttle': ('pygments.lexers.javascript',
+                                                   'JuttleLexer'),
+                          'application/x-kid': ('pygments.lexers.templates',
+                                                'GenshiLexer'),
+                          'application/x-lua': ('pygments.lexers.scripting',
+                                                'LuaLexer'),
+                          'application/x-mako': ('pygments.lexers.templates',
+                                                 'MakoLexer'),
+                          'application/x-mason': ('pygments.lexers.templates',
+                                                  'MasonLexer'),
+                          'application/x-miniscript': ('pygments.lexers.scripting',
+                                                       'MiniScriptLexer'),
+                          'application/x-mojo': ('pygments.lexers.mojo',
+                                                 'MojoLexer'),
+                          'application/x-moonscript': ('pygments.lexers.scripting',
+                                                       'MoonScriptLexer'),
+                          'application/x-myghty': ('pygments.lexers.templates',
+                                                   'MyghtyLexer'),
+                          'application/x-ndjson': ('pygments.lexers.data',
+                                                   'JsonLexer'),
+                          'application/x-newlisp': ('pygments.lexers.lisp',
+                                                    'NewLispLexer'),
+                          'application/x-openedge': ('pygments.lexers.business',
+                                                     'OpenEdgeLexer'),
+                          'application/x-openscad': ('pygments.lexers.openscad',
+                                                     'OpenScadLexer'),
+                          'application/x-perl': ('pygments.lexers.perl',
+                                                 'PerlLexer'),
+                          'application/x-perl6': ('pygments.lexers.perl',
+                                                  'Perl6Lexer'),
+                          'application/x-php': ('pygments.lexers.templates',
+                                                'HtmlPhpLexer'),
+                          'application/x-prql': ('pygments.lexers.prql',
+                                                 'PrqlLexer'),
+                          'application/x-pygments-tokens': ('pygments.lexers.special',
+                                                            'RawTokenLexer'),
+                          'application/x-pypylog': ('pygments.lexers.console',
+                                                    'PyPyLogLexer'),
+                          'application/x-python': ('pygments.lexers.python',
+                                                   'PythonLexer'),
+                          'application/x-python2': ('pygments.lexers.python',
+                                                    'Python2Lexer'),
+                          'application/x-python3': ('pygments.lexers.python',
+                                                    'PythonLexer'),
+                          'application/x-qml': ('pygments.lexers.webmisc',
+                                                'QmlLexer'),
+                          'application/x-qt.qbs+qml': ('pygments.lexers.webmisc',
+                                                       'QmlLexer'),
+                          'application/x-racket': ('pygments.lexers.lisp',
+                                                   'RacketLexer'),
+                          'application/x-ruby': ('pygments.lexers.ruby',
+                                                 'RubyLexer'),
+                          'application/x-ruby-templating': ('pygments.lexers.templates',
+                                                            'ErbLexer'),
+                          'application/x-sas': ('pygments.lexers.sas',
+                                                'SASLexer'),
+                          'application/x-scheme': ('pygments.lexers.lisp',
+                                                   'SchemeLexer'),
+                          'application/x-sh': ('pygments.lexers.shell',
+                                               'BashLexer'),
+                          'application/x-sh-session': ('pygments.lexers.shell',
+                                                       'BashSessionLexer'),
+                          'application/x-shell-session': ('pygments.lexers.shell',
+                                                          'BashSessionLexer'),
+                          'application/x-shellscript': ('pygments.lexers.shell',
+                                                        'BashLexer'),
+                          'application/x-shen': ('pygments.lexers.lisp',
+                                                 'ShenLexer'),
+                          'application/x-smarty': ('pygments.lexers.templates',
+                                                   'SmartyLexer'),
+                          'application/x-spitfire': ('pygments.lexers.templates',
+                                                     'CheetahLexer'),
+                          'application/x-ssp': ('pygments.lexers.templates',
+                                                'SspLexer'),
+                          'application/x-standardml': ('pygments.lexers.ml',
+                                                       'SMLLexer'),
+                          'application/x-stata': ('pygments.lexers.stata',
+                                                  'StataLexer'),
+                          'application/x-tcl': ('pygments.lexers.tcl',
+                                                'TclLexer'),
+                          'application/x-terraform': ('pygments.lexers.configs',
+                                                      'TerraformLexer'),
+                          'application/x-tf': ('pygments.lexers.configs',
+                                               'TerraformLexer'),
+                          'application/x-thrift': ('pygments.lexers.dsls',
+                                                   'ThriftLexer'),
+                          'application/x-troff': ('pygments.lexers.markup',
+                                                  'GroffLexer'),
+                          'application/x-turtle': ('pygments.lexers.rdf',
+                                                   'TurtleLexer'),
+                          'application/x-twig': ('pygments.lexers.templates',
+                                                 'TwigLexer'),
+                          'application/x-typescript': ('pygments.lexers.javascript',
+                                                       'TypeScriptLexer'),
+                          'application/x-urbiscript': ('pygments.lexers.urbi',
+                                                       'UrbiscriptLexer'),
+                          'application/x-www-form-urlencoded': ('pygments.lexers.html',
+                                                                'UrlEncodedLexer'),
+                          'application/xhtml+xml': ('pygments.lexers.html',
+                                                    'HtmlLexer'),
+                          'application/xml': ('pygments.lexers.html',
+                                              'XmlLexer'),
+                          'application/xml+cheetah': ('pygments.lexers.templates',
+                                                      'CheetahXmlLexer'),
+                          'application/xml+django': ('pygments.lexers.templates',
+                                                     'XmlDjangoLexer'),
+                          'application/xml+evoque': ('pygments.lexers.templates',
+                                                     'EvoqueXmlLexer'),
+                          'application/xml+jinja': ('pygments.lexers.templates',
+                                                    'XmlDjangoLexer'),
+                          'application/xml+lasso': ('pygments.lexers.templates',
+                                                    'LassoXmlLexer'),
+                          'application/xml+mako': ('pygments.lexers.templates',
+                                                   'MakoXmlLexer'),
+                          'application/xml+myghty': ('pygments.lexers.templates',
+                                                     'MyghtyXmlLexer'),
+                          'application/xml+php': ('pygments.lexers.templates',
+                                                  'XmlPhpLexer'),
+                          'application/xml+ruby': ('pygments.lexers.templates',
+                                                   'XmlErbLexer'),
+                          'application/xml+smarty': ('pygments.lexers.templates',
+                                                     'XmlSmartyLexer'),
+                          'application/xml+spitfire': ('pygments.lexers.templates',
+                                                       'CheetahXmlLexer'),
+                          'application/xml+velocity': ('pygments.lexers.templates',
+                                                       'VelocityXmlLexer'),
+                          'application/xml-dtd': ('pygments.lexers.html',
+                                                  'DtdLexer'),
+                          'application/xquery': ('pygments.lexers.webmisc',
+                                                 'XQueryLexer'),
+                          'application/xsl+xml': ('pygments.lexers.html',
+                                                  'XsltLexer'),
+                          'application/xslt+xml': ('pygments.lexers.html',
+                                                   'XsltLexer'),
+                          'application/yang': ('pygments.lexers.yang',
+                                               'YangLexer'),
+                          'image/svg+xml': ('pygments.lexers.html', 'XmlLexer'),
+                          'image/x-xbitmap': ('pygments.lexers.c_cpp',
+                                              'CLexer'),
+                          'image/x-xpixmap': ('pygments.lexers.c_cpp',
+                                              'CLexer'),
+                          'message/rfc822': ('pygments.lexers.email',
+                                             'EmailLexer'),
+                          'multipart/alternative': ('pygments.lexers.mime',
+                                                    'MIMELexer'),
+                          'multipart/mixed': ('pygments.lexers.mime',
+                                              'MIMELexer'),
+                          'multipart/related': ('pygments.lexers.mime',
+                                                'MIMELexer'),
+                          'text/S': ('pygments.lexers.r', 'SLexer'),
+                          'text/S-plus': ('pygments.lexers.r', 'SLexer'),
+                          'text/actionscript': ('pygments.lexers.actionscript',
+                                                'ActionScriptLexer'),
+                          'text/actionscript3': ('pygments.lexers.actionscript',
+                                                 'ActionScript3Lexer'),
+                          'text/basic': ('pygments.lexers.basic',
+                                         'QBasicLexer'),
+                          'text/coffeescript': ('pygments.lexers.javascript',
+                                                'CoffeeScriptLexer'),
+                          'text/css': ('pygments.lexers.css', 'CssLexer'),
+                          'text/css+django': ('pygments.lexers.templates',
+                                              'CssDjangoLexer'),
+                          'text/css+genshi': ('pygments.lexers.templates',
+                                              'CssGenshiLexer'),
+                          'text/css+jinja': ('pygments.lexers.templates',
+                                             'CssDjangoLexer'),
+                          'text/css+lasso': ('pygments.lexers.templates',
+                                             'LassoCssLexer'),
+                          'text/css+mako': ('pygments.lexers.templates',
+                                            'MakoCssLexer'),
+                          'text/css+myghty': ('pygments.lexers.templates',
+                                              'MyghtyCssLexer'),
+                          'text/css+php': ('pygments.lexers.templates',
+                                           'CssPhpLexer'),
+                          'text/css+ruby': ('pygments.lexers.templates',
+                                            'CssErbLexer'),
+                          'text/css+smarty': ('pygments.lexers.templates',
+                                              'CssSmartyLexer'),
+                          'text/dns': ('pygments.lexers.dns', 'DnsZoneLexer'),
+                          'text/gettext': ('pygments.lexers.textfmts',
+                                           'GettextLexer'),
+                          'text/haxe': ('pygments.lexers.haxe', 'HaxeLexer'),
+                          'text/html': ('pygments.lexers.html', 'HtmlLexer'),
+                          'text/html+cheetah': ('pygments.lexers.templates',
+                                                'CheetahHtmlLexer'),
+                          'text/html+django': ('pygments.lexers.templates',
+                                               'HtmlDjangoLexer'),
+                          'text/html+evoque': ('pygments.lexers.templates',
+                                               'EvoqueHtmlLexer'),
+                          'text/html+genshi': ('pygments.lexers.templates',
+                                               'HtmlGenshiLexer'),
+                          'text/html+handlebars': ('pygments.lexers.templates',
+                                                   'HandlebarsHtmlLexer'),
+                          'text/html+jinja': ('pygments.lexers.templates',
+                                              'HtmlDjangoLexer'),
+                          'text/html+lasso': ('pygments.lexers.templates',
+                                              'LassoHtmlLexer'),
+                          'text/html+mako': ('pygments.lexers.templates',
+                                             'MakoHtmlLexer'),
+                          'text/html+myghty': ('pygments.lexers.templates',
+                                               'MyghtyHtmlLexer'),
+                          'text/html+ruby': ('pygments.lexers.templates',
+                                             'RhtmlLexer'),
+                          'text/html+smarty': ('pygments.lexers.templates',
+                                               'HtmlSmartyLexer'),
+                          'text/html+spitfire': ('pygments.lexers.templates',
+                                                 'CheetahHtmlLexer'),
+                          'text/html+twig': ('pygments.lexers.templates',
+                                             'TwigHtmlLexer'),
+                          'text/html+velocity': ('pygments.lexers.templates',
+                                                 'VelocityHtmlLexer'),
+                          'text/idl': ('pygments.lexers.idl', 'IDLLexer'),
+                          'text/inf': ('pygments.lexers.configs', 'IniLexer'),
+                          'text/ipf': ('pygments.lexers.igor', 'IgorLexer'),
+                          'text/javascript': ('pygments.lexers.javascript',
+                                              'JavascriptLexer'),
+                          'text/javascript+cheetah': ('pygments.lexers.templates',
+                                                      'CheetahJavascriptLexer'),
+                          'text/javascript+django': ('pygments.lexers.templates',
+                                                     'JavascriptDjangoLexer'),
+                          'text/javascript+genshi': ('pygments.lexers.templates',
+                                                     'JavascriptGenshiLexer'),
+                          'text/javascript+jinja': ('pygments.lexers.templates',
+                                                    'JavascriptDjangoLexer'),
+                          'text/javascript+lasso': ('pygments.lexers.templates',
+                                                    'LassoJavascriptLexer'),
+                          'text/javascript+mako': ('pygments.lexers.templates',
+                                                   'MakoJavascriptLexer'),
+                          'text/javascript+mygthy': ('pygments.lexers.templates',
+                                                     'MyghtyJavascriptLexer'),
+                          'text/javascript+php': ('pygments.lexers.templates',
+                                                  'JavascriptPhpLexer'),
+                          'text/javascript+ruby': ('pygments.lexers.templates',
+                                                   'JavascriptErbLexer'),
+                          'text/javascript+smarty': ('pygments.lexers.templates',
+                                                     'JavascriptSmartyLexer'),
+                          'text/javascript+spitfire': ('pygments.lexers.templates',
+                                                       'CheetahJavascriptLexer'),
+                          'text/jsgf': ('pygments.lexers.grammar_notation',
+                                        'JsgfLexer'),
+                          'text/jsx': ('pygments.lexers.jsx', 'JsxLexer'),
+                          'text/juttle': ('pygments.lexers.javascript',
+                                          'JuttleLexer'),
+                          'text/kal': ('pygments.lexers.javascript',
+                                       'KalLexer'),
+                          'text/limbo': ('pygments.lexers.inferno',
+                                         'LimboLexer'),
+                          'text/livescript': ('pygments.lexers.javascript',
+                                              'LiveScriptLexer'),
+                          'text/matlab': ('pygments.lexers.matlab',
+                                          'MatlabLexer'),
+                          'text/mcfunction': ('pygments.lexers.minecraft',
+                                              'MCFunctionLexer'),
+                          'text/mcschema': ('pygments.lexers.minecraft',
+                                            'MCSchemaLexer'),
+                          'text/ncl': ('pygments.lexers.ncl', 'NCLLexer'),
+                          'text/octave': ('pygments.lexers.matlab',
+                                          'OctaveLexer'),
+                          'text/odin': ('pygments.lexers.archetype',
+                                        'OdinLexer'),
+                          'text/org': ('pygments.lexers.markup', 'OrgLexer'),
+                          'text/plain': ('pygments.lexers.special',
+                                         'TextLexer'),
+                          'text/prs.fallenstein.rst': ('pygments.lexers.markup',
+                                                       'RstLexer'),
+                          'text/rita': ('pygments.lexers.rita', 'RitaLexer'),
+                          'text/rsl': ('pygments.lexers.dsls', 'RslLexer'),
+                          'text/rust': ('pygments.lexers.rust', 'RustLexer'),
+                          'text/sas': ('pygments.lexers.sas', 'SASLexer'),
+                          'text/scilab': ('pygments.lexers.matlab',
+                                          'ScilabLexer'),
+                          'text/shex': ('pygments.lexers.rdf', 'ShExCLexer'),
+                          'text/smali': ('pygments.lexers.dalvik',
+                                         'SmaliLexer'),
+                          'text/snbt': ('pygments.lexers.minecraft',
+                                        'SNBTLexer'),
+                          'text/stata': ('pygments.lexers.stata', 'StataLexer'),
+                          'text/supercollider': ('pygments.lexers.supercollider',
+                                                 'SuperColliderLexer'),
+                          'text/swig': ('pygments.lexers.c_like', 'SwigLexer'),
+                          'text/troff': ('pygments.lexers.markup',
+                                         'GroffLexer'),
+                          'text/turtle': ('pygments.lexers.rdf', 'TurtleLexer'),
+                          'text/typescript-jsx': ('pygments.lexers.jsx',
+                                                  'JsxLexer'),
+                          'text/typescript-tsx': ('pygments.lexers.jsx',
+                                                  'TsxLexer'),
+                          'text/unicon': ('pygments.lexers.unicon',
+                                          'UniconLexer'),
+                          'text/vnd.graphviz': ('pygments.lexers.graphviz',
+                                                'GraphvizLexer'),
+                          'text/vnd.tiddlywiki': ('pygments.lexers.markup',
+                                                  'TiddlyWiki5Lexer'),
+                          'text/wgsl': ('pygments.lexers.wgsl', 'WgslLexer'),
+                          'text/x-R': ('pygments.lexers.r', 'SLexer'),
+                          'text/x-abap': ('pygments.lexers.business',
+                                          'ABAPLexer'),
+                          'text/x-abnf': ('pygments.lexers.grammar_notation',
+                                          'AbnfLexer'),
+                          'text/x-actionscript': ('pygments.lexers.actionscript',
+                                                  'ActionScriptLexer'),
+                          'text/x-actionscript3': ('pygments.lexers.actionscript',
+                                                   'ActionScript3Lexer'),
+                          'text/x-ada': ('pygments.lexers.ada', 'AdaLexer'),
+                          'text/x-agda': ('pygments.lexers.haskell',
+                                          'AgdaLexer'),
+                          'text/x-alloy': ('pygments.lexers.dsls',
+                                           'AlloyLexer'),
+                          'text/x-ambienttalk': ('pygments.lexers.ambient',
+                                                 'AmbientTalkLexer'),
+                          'text/x-apacheconf': ('pygments.lexers.configs',
+                                                'ApacheConfLexer'),
+                          'text/x-arduino': ('pygments.lexers.c_like',
+                                             'ArduinoLexer'),
+                          'text/x-aspectj': ('pygments.lexers.jvm',
+                                             'AspectJLexer'),
+                          'text/x-asymptote': ('pygments.lexers.graphics',
+                                               'AsymptoteLexer'),
+                          'text/x-autohotkey': ('pygments.lexers.automation',
+                                                'AutohotkeyLexer'),
+                          'text/x-autoit': ('pygments.lexers.automation',
+                                            'AutoItLexer'),
+                          'text/x-bb': ('pygments.lexers.basic',
+                                        'BlitzBasicLexer'),
+                          'text/x-bbcode': ('pygments.lexers.markup',
+                                            'BBCodeLexer'),
+                          'text/x-bdd': ('pygments.lexers.bdd', 'BddLexer'),
+                          'text/x-berry': ('pygments.lexers.berry',
+                                           'BerryLexer'),
+                          'text/x-bibtex': ('pygments.lexers.bibtex',
+                                            'BibTeXLexer'),
+                          'text/x-blueprint': ('pygments.lexers.blueprint',
+                                               'BlueprintLexer'),
+                          'text/x-bmx': ('pygments.lexers.basic',
+                                         'BlitzMaxLexer'),
+                          'text/x-bnf': ('pygments.lexers.grammar_notation',
+                                         'BnfLexer'),
+                          'text/x-boo': ('pygments.lexers.dotnet', 'BooLexer'),
+                          'text/x-c': ('pygments.lexers.devicetree',
+                                       'DevicetreeLexer'),
+                          'text/x-c++hdr': ('pygments.lexers.c_cpp',
+                                            'CppLexer'),
+                          'text/x-c++src': ('pygments.lexers.c_cpp',
+                                            'CppLexer'),
+                          'text/x-c-objdump': ('pygments.lexers.asm',
+                                               'CObjdumpLexer'),
+                          'text/x-carbon': ('pygments.lexers.carbon',
+                                            'CarbonLexer'),
+                          'text/x-cddl': ('pygments.lexers.cddl', 'CddlLexer'),
+                          'text/x-ceylon': ('pygments.lexers.jvm',
+                                            'CeylonLexer'),
+                          'text/x-chaiscript': ('pygments.lexers.scripting',
+                                                'ChaiscriptLexer'),
+                          'text/x-chdr': ('pygments.lexers.c_cpp', 'CLexer'),
+                          'text/x-cirru': ('pygments.lexers.webmisc',
+                                           'CirruLexer'),
+                          'text/x-clay': ('pygments.lexers.c_like',
+                                          'ClayLexer'),
+                          'text/x-clojure': ('pygments.lexers.jvm',
+                                             'ClojureLexer'),
+                          'text/x-clojurescript': ('pygments.lexers.jvm',
+                                                   'ClojureScriptLexer'),
+                          'text/x-cmake': ('pygments.lexers.make',
+                                           'CMakeLexer'),
+                          'text/x-cobol': ('pygments.lexers.business',
+                                           'CobolLexer'),
+                          'text/x-common-lisp': ('pygments.lexers.lisp',
+                                                 'CommonLispLexer'),
+                          'text/x-component-pascal': ('pygments.lexers.oberon',
+                                                      'ComponentPascalLexer'),
+                          'text/x-coq': ('pygments.lexers.theorem', 'CoqLexer'),
+                          'text/x-cplint': ('pygments.lexers.cplint',
+                                            'CplintLexer'),
+                          'text/x-cpp-objdump': ('pygments.lexers.asm',
+                                                 'CppObjdumpLexer'),
+                          'text/x-crocsrc': ('pygments.lexers.d', 'CrocLexer'),
+                          'text/x-cryptol': ('pygments.lexers.haskell',
+                                             'CryptolLexer'),
+                          'text/x-crystal': ('pygments.lexers.crystal',
+                                             'CrystalLexer'),
+                          'text/x-csharp': ('pygments.lexers.dotnet',
+                                            'CSharpLexer'),
+                          'text/x-csrc': ('pygments.lexers.c_cpp', 'CLexer'),
+                          'text/x-cuda': ('pygments.lexers.c_like',
+                                          'CudaLexer'),
+                          'text/x-cython': ('pygments.lexers.python',
+                                            'CythonLexer'),
+                          'text/x-d-objdump': ('pygments.lexers.asm',
+                                               'DObjdumpLexer'),
+                          'text/x-dart': ('pygments.lexers.javascript',
+                                          'DartLexer'),
+                          'text/x-dasm16': ('pygments.lexers.asm',
+                                            'Dasm16Lexer'),
+                          'text/x-dg': ('pygments.lexers.python', 'DgLexer'),
+                          'text/x-diff': ('pygments.lexers.diff', 'DiffLexer'),
+                          'text/x-dockerfile-config': ('pygments.lexers.configs',
+                                                       'DockerLexer'),
+                          'text/x-dsrc': ('pygments.lexers.d', 'DLexer'),
+                          'text/x-duel': ('pygments.lexers.webmisc',
+                                          'DuelLexer'),
+                          'text/x-dylan': ('pygments.lexers.dylan',
+                                           'DylanLexer'),
+                          'text/x-dylan-console': ('pygments.lexers.dylan',
+                                                   'DylanConsoleLexer'),
+                          'text/x-dylan-lid': ('pygments.lexers.dylan',
+                                               'DylanLidLexer'),
+                          'text/x-earl-grey': ('pygments.lexers.javascript',
+                                               'EarlGreyLexer'),
+                          'text/x-easytrieve': ('pygments.lexers.scripting',
+                                                'EasytrieveLexer'),
+                          'text/x-ebnf': ('pygments.lexers.parsers',
+                                          'EbnfLexer'),
+                          'text/x-echdr': ('pygments.lexers.c_like', 'ECLexer'),
+                          'text/x-ecsrc': ('pygments.lexers.c_like', 'ECLexer'),
+                          'text/x-eiffel': ('pygments.lexers.eiffel',
+                                            'EiffelLexer'),
+                          'text/x-elisp': ('pygments.lexers.lisp',
+                                           'EmacsLispLexer'),
+                          'text/x-elixir': ('pygments.lexers.erlang',
+                                            'ElixirLexer'),
+                          'text/x-elixir-shellsession': ('pygments.lexers.erlang',
+                                                         'ElixirConsoleLexer'),
+                          'text/x-elm': ('pygments.lexers.elm', 'ElmLexer'),
+                          'text/x-elpi': ('pygments.lexers.elpi', 'ElpiLexer'),
+                          'text/x-erl-shellsession': ('pygments.lexers.erlang',
+                                                      'ErlangShellLexer'),
+                          'text/x-erlang': ('pygments.lexers.erlang',
+                                            'ErlangLexer'),
+                          'text/x-ezhil': ('pygments.lexers.ezhil',
+                                           'EzhilLexer'),
+                          'text/x-factor': ('pygments.lexers.factor',
+                                            'FactorLexer'),
+                          'text/x-fancysrc': ('pygments.lexers.ruby',
+                                              'FancyLexer'),
+                          'text/x-felix': ('pygments.lexers.felix',
+                                           'FelixLexer'),
+                          'text/x-flatline': ('pygments.lexers.dsls',
+                                              'FlatlineLexer'),
+                          'text/x-fortran': ('pygments.lexers.fortran',
+                                             'FortranLexer'),
+                          'text/x-freefem': ('pygments.lexers.freefem',
+                                             'FreeFemLexer'),
+                          'text/x-fsharp': ('pygments.lexers.dotnet',
+                                            'FSharpLexer'),
+                          'text/x-fstar': ('pygments.lexers.ml', 'FStarLexer'),
+                          'text/x-futhark': ('pygments.lexers.futhark',
+                                             'FutharkLexer'),
+                          'text/x-gas': ('pygments.lexers.asm', 'GasLexer'),
+                          'text/x-gdscript': ('pygments.lexers.gdscript',
+                                              'GDScriptLexer'),
+                          'text/x-genshi': ('pygments.lexers.templates',
+                                            'GenshiTextLexer'),
+                          'text/x-gettext': ('pygments.lexers.textfmts',
+                                             'GettextLexer'),
+                          'text/x-gherkin': ('pygments.lexers.testing',
+                                             'GherkinLexer'),
+                          'text/x-gleam': ('pygments.lexers.gleam',
+                                           'GleamLexer'),
+                          'text/x-glslsrc': ('pygments.lexers.graphics',
+                                             'GLShaderLexer'),
+                          'text/x-gnuplot': ('pygments.lexers.graphics',
+                                             'GnuplotLexer'),
+                          'text/x-gooddata-cl': ('pygments.lexers.business',
+                                                 'GoodDataCLLexer'),
+                          'text/x-gooddata-maql': ('pygments.lexers.business',
+                                                   'MaqlLexer'),
+                          'text/x-google-sql': ('pygments.lexers.sql',
+                                                'GoogleSqlLexer'),
+                          'text/x-google-sql-aux': ('pygments.lexers.sql',
+                                                    'GoogleSqlLexer'),
+                          'text/x-gosrc': ('pygments.lexers.go', 'GoLexer'),
+                          'text/x-gosu': ('pygments.lexers.jvm', 'GosuLexer'),
+                          'text/x-gosu-template': ('pygments.lexers.jvm',
+                                                   'GosuTemplateLexer'),
+                          'text/x-graphviz': ('pygments.lexers.graphviz',
+                                              'GraphvizLexer'),
+                          'text/x-groovy': ('pygments.lexers.jvm',
+                                            'GroovyLexer'),
+                          'text/x-haml': ('pygments.lexers.html', 'HamlLexer'),
+                          'text/x-handlebars-template': ('pygments.lexers.templates',
+                                                         'HandlebarsHtmlLexer'),
+                          'text/x-hare': ('pygments.lexers.hare', 'HareLexer'),
+                          'text/x-haskell': ('pygments.lexers.haskell',
+                                             'HaskellLexer'),
+                          'text/x-haxe': ('pygments.lexers.haxe', 'HaxeLexer'),
+                          'text/x-hlsl': ('pygments.lexers.graphics',
+                                          'HLSLShaderLexer'),
+                          'text/x-hsail': ('pygments.lexers.asm', 'HsailLexer'),
+                          'text/x-hx': ('pygments.lexers.haxe', 'HaxeLexer'),
+                          'text/x-hy': ('pygments.lexers.lisp', 'HyLexer'),
+                          'text/x-hybris': ('pygments.lexers.scripting',
+                                            'HybrisLexer'),
+                          'text/x-idris': ('pygments.lexers.haskell',
+                                           'IdrisLexer'),
+                          'text/x-ini': ('pygments.lexers.configs', 'IniLexer'),
+                          'text/x-iokesrc': ('pygments.lexers.jvm',
+                                             'IokeLexer'),
+                          'text/x-iosrc': ('pygments.lexers.iolang', 'IoLexer'),
+                          'text/x-irclog': ('pygments.lexers.textfmts',
+                                            'IrcLogsLexer'),
+                          'text/x-isabelle': ('pygments.lexers.theorem',
+                                              'IsabelleLexer'),
+                          'text/x-j': ('pygments.lexers.j', 'JLexer'),
+                          'text/x-jade': ('pygments.lexers.html', 'PugLexer'),
+                          'text/x-janet': ('pygments.lexers.lisp',
+                                           'JanetLexer'),
+                          'text/x-java': ('pygments.lexers.jvm', 'JavaLexer'),
+                          'text/x-java-properties': ('pygments.lexers.configs',
+                                                     'PropertiesLexer'),
+                          'text/x-javascript': ('pygments.lexers.javascript',
+                                                'JavascriptLexer'),
+                          'text/x-javascript+cheetah': ('pygments.lexers.templates',
+                                                        'CheetahJavascriptLexer'),
+                          'text/x-javascript+django': ('pygments.lexers.templates',
+                                                       'JavascriptDjangoLexer'),
+                          'text/x-javascript+genshi': ('pygments.lexers.templates',
+                                                       'JavascriptGenshiLexer'),
+                          'text/x-javascript+jinja': ('pygments.lexers.templates',
+                                                      'JavascriptDjangoLexer'),
+                          'text/x-javascript+lasso': ('pygments.lexers.templates',
+                                                      'LassoJavascriptLexer'),
+                          'text/x-javascript+mako': ('pygments.lexers.templates',
+                                                     'MakoJavascriptLexer'),
+                          'text/x-javascript+myghty': ('pygments.lexers.templates',
+                                                       'MyghtyJavascriptLexer'),
+                          'text/x-javascript+php': ('pygments.lexers.templates',
+                                                    'JavascriptPhpLexer'),
+                          'text/x-javascript+ruby': ('pygments.lexers.templates',
+                                                     'JavascriptErbLexer'),
+                          'text/x-javascript+smarty': ('pygments.lexers.templates',
+                                                       'JavascriptSmartyLexer'),
+                          'text/x-javascript+spitfire': ('pygments.lexers.templates',
+                                                         'CheetahJavascriptLexer'),
+                          'text/x-jbst': ('pygments.lexers.webmisc',
+                                          'DuelLexer'),
+                          'text/x-jcl': ('pygments.lexers.scripting',
+                                         'JclLexer'),
+                          'text/x-jslt': ('pygments.lexers.jslt', 'JSLTLexer'),
+                          'text/x-julia': ('pygments.lexers.julia',
+                                           'JuliaLexer'),
+                          'text/x-juttle': ('pygments.lexers.javascript',
+                                            'JuttleLexer'),
+                          'text/x-kconfig': ('pygments.lexers.configs',
+                                             'KconfigLexer'),
+                          'text/x-koka': ('pygments.lexers.haskell',
+                                          'KokaLexer'),
+                          'text/x-kotlin': ('pygments.lexers.jvm',
+                                            'KotlinLexer'),
+                          'text/x-lasso': ('pygments.lexers.javascript',
+                                           'LassoLexer'),
+                          'text/x-latex': ('pygments.lexers.markup',
+                                           'TexLexer'),
+                          'text/x-ldapconf': ('pygments.lexers.ldap',
+                                              'LdaprcLexer'),
+                          'text/x-ldif': ('pygments.lexers.ldap', 'LdifLexer'),
+                          'text/x-lean': ('pygments.lexers.lean', 'Lean3Lexer'),
+                          'text/x-lean3': ('pygments.lexers.lean',
+                                           'Lean3Lexer'),
+                          'text/x-lean4': ('pygments.lexers.lean',
+                                           'Lean4Lexer'),
+                          'text/x-less-css': ('pygments.lexers.css',
+                                              'LessCssLexer'),
+                          'text/x-lighttpd-conf': ('pygments.lexers.configs',
+                                                   'LighttpdConfLexer'),
+                          'text/x-literate-agda': ('pygments.lexers.haskell',
+                                                   'LiterateAgdaLexer'),
+                          'text/x-literate-cryptol': ('pygments.lexers.haskell',
+                                                      'LiterateCryptolLexer'),
+                          'text/x-literate-haskell': ('pygments.lexers.haskell',
+                                                      'LiterateHaskellLexer'),
+                          'text/x-literate-idris': ('pygments.lexers.haskell',
+                                                    'LiterateIdrisLexer'),
+                          'text/x-llvm': ('pygments.lexers.asm', 'LlvmLexer'),
+                          'text/x-logos': ('pygments.lexers.objective',
+                                           'LogosLexer'),
+                          'text/x-logtalk': ('pygments.lexers.prolog',
+                                             'LogtalkLexer'),
+                          'text/x-lsl': ('pygments.lexers.scripting',
+                                         'LSLLexer'),
+                          'text/x-lua': ('pygments.lexers.scripting',
+                                         'LuaLexer'),
+                          'text/x-makefile': ('pygments.lexers.make',
+                                              'MakefileLexer'),
+                          'text/x-maple': ('pygments.lexers.maple',
+                                           'MapleLexer'),
+                          'text/x-markdown': ('pygments.lexers.markup',
+                                              'MarkdownLexer'),
+                          'text/x-mask': ('pygments.lexers.javascript',
+                                          'MaskLexer'),
+                          'text/x-meson': ('pygments.lexers.meson',
+                                           'MesonLexer'),
+                          'text/x-minicript': ('pygments.lexers.scripting',
+                                               'MiniScriptLexer'),
+                          'text/x-minidsrc': ('pygments.lexers.d',
+                                              'MiniDLexer'),
+                          'text/x-modelica': ('pygments.lexers.modeling',
+                                              'ModelicaLexer'),
+                          'text/x-modula2': ('pygments.lexers.modula2',
+                                             'Modula2Lexer'),
+                          'text/x-mojo': ('pygments.lexers.mojo', 'MojoLexer'),
+                          'text/x-monkey': ('pygments.lexers.basic',
+                                            'MonkeyLexer'),
+                          'text/x-moocode': ('pygments.lexers.scripting',
+                                             'MOOCodeLexer'),
+                          'text/x-moonscript': ('pygments.lexers.scripting',
+                                                'MoonScriptLexer'),
+                          'text/x-mql': ('pygments.lexers.c_like', 'MqlLexer'),
+                          'text/x-mysql': ('pygments.lexers.sql', 'MySqlLexer'),
+                          'text/x-nasm': ('pygments.lexers.asm', 'NasmLexer'),
+                          'text/x-nasm-objdump': ('pygments.lexers.asm',
+                                                  'NasmObjdumpLexer'),
+                          'text/x-nemerle': ('pygments.lexers.dotnet',
+                                             'NemerleLexer'),
+                          'text/x-nescsrc': ('pygments.lexers.c_like',
+                                             'NesCLexer'),
+                          'text/x-newlisp': ('pygments.lexers.lisp',
+                                             'NewLispLexer'),
+                          'text/x-newspeak': ('pygments.lexers.smalltalk',
+                                              'NewspeakLexer'),
+                          'text/x-nginx-conf': ('pygments.lexers.configs',
+                                                'NginxConfLexer'),
+                          'text/x-nim': ('pygments.lexers.nimrod',
+                                         'NimrodLexer'),
+                          'text/x-nix': ('pygments.lexers.nix', 'NixLexer'),
+                          'text/x-nodejsrepl': ('pygments.lexers.javascript',
+                                                'NodeConsoleLexer'),
+                          'text/x-nsis': ('pygments.lexers.installers',
+                                          'NSISLexer'),
+                          'text/x-numba_ir': ('pygments.lexers.numbair',
+                                              'NumbaIRLexer'),
+                          'text/x-numbair': ('pygments.lexers.numbair',
+                                             'NumbaIRLexer'),
+                          'text/x-objdump': ('pygments.lexers.asm',
+                                             'ObjdumpLexer'),
+                          'text/x-objective-c': ('pygments.lexers.objective',
+                                                 'ObjectiveCLexer'),
+                          'text/x-objective-c++': ('pygments.lexers.objective',
+                                                   'ObjectiveCppLexer'),
+                          'text/x-objective-j': ('pygments.lexers.javascript',
+                                                 'ObjectiveJLexer'),
+                          'text/x-ocaml': ('pygments.lexers.ml', 'OcamlLexer'),
+                          'text/x-ooc': ('pygments.lexers.ooc', 'OocLexer'),
+                          'text/x-opa': ('pygments.lexers.ml', 'OpaLexer'),
+                          'text/x-openedge': ('pygments.lexers.business',
+                                              'OpenEdgeLexer'),
+                          'text/x-parasail': ('pygments.lexers.parasail',
+                                              'ParaSailLexer'),
+                          'text/x-pascal': ('pygments.lexers.pascal',
+                                            'DelphiLexer'),
+                          'text/x-patch': ('pygments.lexers.diff', 'DiffLexer'),
+                          'text/x-pawn': ('pygments.lexers.pawn', 'PawnLexer'),
+                          'text/x-peg': ('pygments.lexers.grammar_notation',
+                                         'PegLexer'),
+                          'text/x-perl': ('pygments.lexers.perl', 'PerlLexer'),
+                          'text/x-perl6': ('pygments.lexers.perl',
+                                           'Perl6Lexer'),
+                          'text/x-phix': ('pygments.lexers.phix', 'PhixLexer'),
+                          'text/x-php': ('pygments.lexers.php', 'PhpLexer'),
+                          'text/x-pig': ('pygments.lexers.jvm', 'PigLexer'),
+                          'text/x-pike': ('pygments.lexers.c_like',
+                                          'PikeLexer'),
+                          'text/x-plpgsql': ('pygments.lexers.sql',
+                                             'PlPgsqlLexer'),
+                          'text/x-postgresql': ('pygments.lexers.sql',
+                                                'PostgresLexer'),
+                          'text/x-postgresql-explain': ('pygments.lexers.sql',
+                                                        'PostgresExplainLexer'),
+                          'text/x-postgresql-psql': ('pygments.lexers.sql',
+                                                     'PostgresConsoleLexer'),
+                          'text/x-povray': ('pygments.lexers.graphics',
+                                            'PovrayLexer'),
+                          'text/x-powershell': ('pygments.lexers.shell',
+                                                'PowerShellLexer'),
+                          'text/x-prolog': ('pygments.lexers.prolog',
+                                            'PrologLexer'),
+                          'text/x-promela': ('pygments.lexers.c_like',
+                                             'PromelaLexer'),
+                          'text/x-ptx': ('pygments.lexers.ptx', 'PtxLexer'),
+                          'text/x-pug': ('pygments.lexers.html', 'PugLexer'),
+                          'text/x-python': ('pygments.lexers.python',
+                                            'PythonLexer'),
+                          'text/x-python-doctest': ('pygments.lexers.python',
+                                                    'PythonConsoleLexer'),
+                          'text/x-python-traceback': ('pygments.lexers.python',
+                                                      'PythonTracebackLexer'),
+                          'text/x-python2': ('pygments.lexers.python',
+                                             'Python2Lexer'),
+                          'text/x-python2-traceback': ('pygments.lexers.python',
+                                                       'Python2TracebackLexer'),
+                          'text/x-python3': ('pygments.lexers.python',
+                                             'PythonLexer'),
+                          'text/x-python3-traceback': ('pygments.lexers.python',
+                                                       'PythonTracebackLexer'),
+                          'text/x-r': ('pygments.lexers.r', 'SLexer'),
+                          'text/x-r-doc': ('pygments.lexers.r', 'RdLexer'),
+                          'text/x-r-history': ('pygments.lexers.r', 'SLexer'),
+                          'text/x-r-profile': ('pygments.lexers.r', 'SLexer'),
+                          'text/x-r-source': ('pygments.lexers.r', 'SLexer'),
+                          'text/x-racket': ('pygments.lexers.lisp',
+                                            'RacketLexer'),
+                          'text/x-reasonml': ('pygments.lexers.ml',
+                                              'ReasonLexer'),
+                          'text/x-rebol': ('pygments.lexers.rebol',
+                                           'RebolLexer'),
+                          'text/x-red': ('pygments.lexers.rebol', 'RedLexer'),
+                          'text/x-red-system': ('pygments.lexers.rebol',
+                                                'RedLexer'),
+                          'text/x-rego': ('pygments.lexers.rego', 'RegoLexer'),
+                          'text/x-rexx': ('pygments.lexers.scripting',
+                                          'RexxLexer'),
+                          'text/x-ride': ('pygments.lexers.ride', 'RideLexer'),
+                          'text/x-robotframework': ('pygments.lexers.robotframework',
+                                                    'RobotFrameworkLexer'),
+                          'text/x-rpm-spec': ('pygments.lexers.installers',
+                                              'RPMSpecLexer'),
+                          'text/x-rql': ('pygments.lexers.sql', 'RqlLexer'),
+                          'text/x-rst': ('pygments.lexers.markup', 'RstLexer'),
+                          'text/x-ruby': ('pygments.lexers.ruby', 'RubyLexer'),
+                          'text/x-ruby-shellsession': ('pygments.lexers.ruby',
+                                                       'RubyConsoleLexer'),
+                          'text/x-rust': ('pygments.lexers.rust', 'RustLexer'),
+                          'text/x-sarl': ('pygments.lexers.jvm', 'SarlLexer'),
+                          'text/x-sas': ('pygments.lexers.sas', 'SASLexer'),
+                          'text/x-sass': ('pygments.lexers.css', 'SassLexer'),
+                          'text/x-scala': ('pygments.lexers.jvm', 'ScalaLexer'),
+                          'text/x-scaml': ('pygments.lexers.html',
+                                           'ScamlLexer'),
+                          'text/x-scheme': ('pygments.lexers.lisp',
+                                            'SchemeLexer'),
+                          'text/x-script.tcl': ('pygments.lexers.tcl',
+                                                'TclLexer'),
+                          'text/x-scss': ('pygments.lexers.css', 'ScssLexer'),
+                          'text/x-sed': ('pygments.lexers.textedit',
+                                         'SedLexer'),
+                          'text/x-shellscript': ('pygments.lexers.shell',
+                                                 'BashLexer'),
+                          'text/x-shen': ('pygments.lexers.lisp', 'ShenLexer'),
+                          'text/x-slim': ('pygments.lexers.webmisc',
+                                          'SlimLexer'),
+                          'text/x-sls': ('pygments.lexers.templates',
+                                         'YamlJinjaLexer'),
+                          'text/x-smalltalk': ('pygments.lexers.smalltalk',
+                                               'SmalltalkLexer'),
+                          'text/x-snobol': ('pygments.lexers.snobol',
+                                            'SnobolLexer'),
+                          'text/x-sourcepawn': ('pygments.lexers.pawn',
+                                                'SourcePawnLexer'),
+                          'text/x-spice': ('pygments.lexers.spice',
+                                           'SpiceLexer'),
+                          'text/x-sql': ('pygments.lexers.sql', 'SqlLexer'),
+                          'text/x-sqlite3-console': ('pygments.lexers.sql',
+                                                     'SqliteConsoleLexer'),
+                          'text/x-squidconf': ('pygments.lexers.configs',
+                                               'SquidConfLexer'),
+                          'text/x-standardml': ('pygments.lexers.ml',
+                                                'SMLLexer'),
+                          'text/x-stata': ('pygments.lexers.stata',
+                                           'StataLexer'),
+                          'text/x-swift': ('pygments.lexers.objective',
+                                           'SwiftLexer'),
+                          'text/x-systemverilog': ('pygments.lexers.hdl',
+                                                   'SystemVerilogLexer'),
+                          'text/x-tasm': ('pygments.lexers.asm', 'TasmLexer'),
+                          'text/x-tcl': ('pygments.lexers.tcl', 'TclLexer'),
+                          'text/x-tea': ('pygments.lexers.templates',
+                                         'TeaTemplateLexer'),
+                          'text/x-teratermmacro': ('pygments.lexers.teraterm',
+                                                   'TeraTermLexer'),
+                          'text/x-tex': ('pygments.lexers.markup', 'TexLexer'),
+                          'text/x-todo': ('pygments.lexers.textfmts',
+                                          'TodotxtLexer'),
+                          'text/x-trac-wiki': ('pygments.lexers.markup',
+                                               'MoinWikiLexer'),
+                          'text/x-tsql': ('pygments.lexers.sql',
+                                          'TransactSqlLexer'),
+                          'text/x-typescript': ('pygments.lexers.javascript',
+                                                'TypeScriptLexer'),
+                          'text/x-typoscript': ('pygments.lexers.typoscript',
+                                                'TypoScriptLexer'),
+                          'text/x-typst': ('pygments.lexers.typst',
+                                           'TypstLexer'),
+                          'text/x-uxntal': ('pygments.lexers.tal', 'TalLexer'),
+                          'text/x-vala': ('pygments.lexers.c_like',
+                                          'ValaLexer'),
+                          'text/x-vba': ('pygments.lexers.dotnet',
+                                         'VbNetLexer'),
+                          'text/x-vbnet': ('pygments.lexers.dotnet',
+                                           'VbNetLexer'),
+                          'text/x-vclsnippet': ('pygments.lexers.varnish',
+                                                'VCLSnippetLexer'),
+                          'text/x-vclsrc': ('pygments.lexers.varnish',
+                                            'VCLLexer'),
+                          'text/x-verifpal': ('pygments.lexers.verifpal',
+                                              'VerifpalLexer'),
+                          'text/x-verilog': ('pygments.lexers.hdl',
+                                             'VerilogLexer'),
+                          'text/x-vhdl': ('pygments.lexers.hdl', 'VhdlLexer'),
+                          'text/x-vim': ('pygments.lexers.textedit',
+                                         'VimLexer'),
+                          'text/x-whiley': ('pygments.lexers.whiley',
+                                            'WhileyLexer'),
+                          'text/x-wiki': ('pygments.lexers.markup',
+                                          'WikitextLexer'),
+                          'text/x-windows-registry': ('pygments.lexers.configs',
+                                                      'RegeditLexer'),
+                          'text/x-x10': ('pygments.lexers.x10', 'X10Lexer'),
+                          'text/x-xtend': ('pygments.lexers.jvm', 'XtendLexer'),
+                          'text/x-yaml': ('pygments.lexers.data', 'YamlLexer'),
+                          'text/x-yaml+jinja': ('pygments.lexers.templates',
+                                                'YamlJinjaLexer'),
+                          'text/x-yara': ('pygments.lexers.yara', 'YaraLexer'),
+                          'text/xml': ('pygments.lexers.html', 'XmlLexer'),
+                          'text/xquery': ('pygments.lexers.webmisc',
+                                          'XQueryLexer'),
+                          'text/zig': ('pygments.lexers.zig', 'ZigLexer')}},
  'styles': {'names': {'abap': ('pygments.styles.abap', 'AbapStyle'),
                       'algol': ('pygments.styles.algol', 'AlgolStyle'),
                       'algol_nu': ('pygments.styles.algol_nu', 'Algol_NuStyle'),
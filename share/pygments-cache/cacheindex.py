@@ -0,0 +1,229 @@
+"""Compiled, memory-mapped form of the pygments lookup cache.
+
+``cache.py`` next to this file is a dict literal mapping
+``section -> kind -> key -> (module, class)``, e.g.
+``cache['lexers']['exts']['.py'] == ('pygments.lexers.python', 'PythonLexer')``.
+Evaluating it builds every entry up front.  This module compiles it once into
+``cache.idx``: a sorted table of fixed-size entries plus a deduplicated string
+pool, which is mmap'ed and binary searched so a lookup only touches the pages
+it needs.
+
+Layout (little endian)::
+
+    header   magic, format, flags, source mtime_ns, source size, entry count,
+             string pool offset
+    entries  key, module and class as (offset, length) pairs into the pool,
+             sorted by key bytes
+    pool     utf-8 strings
+
+Keys are ``section NUL kind NUL key`` so that one sorted table holds all
+sections and a section/kind prefix is a contiguous run.
+"""
+import ast
+import mmap
+import os
+import struct
+import sys
+
+__all__ = [
+    "CACHE_DIR",
+    "CACHE_FILE",
+    "INDEX_FILE",
+    "CacheIndex",
+    "compile_cache",
+    "load_cache",
+    "open_index",
+]
+
+CACHE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_FILE = os.environ.get("PYGMENTS_CACHE_FILE", os.path.join(CACHE_DIR, "cache.py"))
+INDEX_FILE = os.path.splitext(CACHE_FILE)[0] + ".idx"
+
+INDEX_MAGIC = b"PGCI"
+INDEX_FORMAT = 1
+HEADER = struct.Struct("<4sHHQQII")
+ENTRY = struct.Struct("<IHIHIH")
+KEY_SEPARATOR = "\0"
+
+
+def _key(section, kind, key):
+    return KEY_SEPARATOR.join((section, kind, key)).encode("utf-8")
+
+
+def load_cache(path=CACHE_FILE):
+    """Parse the dict literal in ``path`` without executing it."""
+    with open(path, encoding="utf-8") as f:
+        return ast.literal_eval(f.read())
+
+
+def _flatten(cache):
+    for section, kinds in cache.items():
+        for kind, entries in kinds.items():
+            for key, (module, cls) in entries.items():
+                yield _key(section, kind, key), module, cls
+
+
+def compile_cache(cache, mtime_ns=0, size=0):
+    """Return the compiled index bytes for a cache dict."""
+    entries = sorted(_flatten(cache))
+    pool = bytearray()
+    offsets = {}
+
+    def intern(text):
+        data = text if isinstance(text, bytes) else text.encode("utf-8")
+        if data not in offsets:
+            offsets[data] = len(pool)
+            pool.extend(data)
+        return offsets[data], len(data)
+
+    table = bytearray()
+    for key, module, cls in entries:
+        table += ENTRY.pack(*intern(key), *intern(module), *intern(cls))
+    pool_offset = HEADER.size + len(table)
+    header = HEADER.pack(INDEX_MAGIC, INDEX_FORMAT, 0, mtime_ns, size, len(entries), pool_offset)
+    return bytes(header + table + pool)
+
+
+def write_index(source=CACHE_FILE, target=INDEX_FILE):
+    """Compile ``source`` into ``target`` atomically and return the bytes."""
+    st = os.stat(source)
+    data = compile_cache(load_cache(source), st.st_mtime_ns, st.st_size)
+    tmp = f"{target}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, target)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+    return data
+
+
+class CacheIndex:
+    """Read-only view over compiled index bytes (an mmap or a bytes object)."""
+
+    def __init__(self, buffer, source_file=None):
+        self.buffer = buffer
+        self.source_file = source_file
+        (magic, fmt, self.flags, self.source_mtime_ns, self.source_size,
+         self.count, self.pool_offset) = HEADER.unpack_from(buffer, 0)
+        if magic != INDEX_MAGIC or fmt != INDEX_FORMAT:
+            raise ValueError("not a compiled pygments cache index")
+
+    @classmethod
+    def open(cls, path=INDEX_FILE, source_file=None):
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, source_file)
+
+    def close(self):
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def is_current(self, source_file=None):
+        """True if the index was compiled from the current ``source_file``."""
+        try:
+            st = os.stat(source_file or self.source_file)
+        except (OSError, TypeError):
+            return True
+        return (st.st_mtime_ns, st.st_size) == (self.source_mtime_ns, self.source_size)
+
+    def _string(self, offset, length):
+        start = self.pool_offset + offset
+        return self.buffer[start:start + length]
+
+    def _entry(self, i):
+        return ENTRY.unpack_from(self.buffer, HEADER.size + i * ENTRY.size)
+
+    def _entry_key(self, i):
+        key_offset, key_length = self._entry(i)[:2]
+        return self._string(key_offset, key_length)
+
+    def _bisect(self, key):
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._entry_key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _value(self, i):
+        _, _, module_offset, module_length, cls_offset, cls_length = self._entry(i)
+        return (self._string(module_offset, module_length).decode("utf-8"),
+                self._string(cls_offset, cls_length).decode("utf-8"))
+
+    def get(self, section, kind, key, default=None):
+        """Return ``(module, class)`` for one key, or ``default``."""
+        wanted = _key(section, kind, key)
+        i = self._bisect(wanted)
+        if i < self.count and self._entry_key(i) == wanted:
+            return self._value(i)
+        return default
+
+    def items(self, section, kind):
+        """Yield ``(key, (module, class))`` for every entry of a section/kind."""
+        prefix = _key(section, kind, "")
+        i = self._bisect(prefix)
+        while i < self.count:
+            key = self._entry_key(i)
+            if not key.startswith(prefix):
+                break
+            yield key[len(prefix):].decode("utf-8"), self._value(i)
+            i += 1
+
+    def lexer_for_extension(self, ext):
+        return self.get("lexers", "exts", ext)
+
+    def formatter_for_extension(self, ext):
+        return self.get("formatters", "exts", ext)
+
+    def formatter(self, name):
+        return self.get("formatters", "names", name)
+
+    def style(self, name):
+        return self.get("styles", "names", name)
+
+    def filter(self, name):
+        return self.get("filters", "names", name)
+
+
+def open_index(source=CACHE_FILE, target=INDEX_FILE):
+    """Open the compiled index for ``source``, (re)compiling it if stale.
+
+    If the index can't be written (read-only install) the compiled bytes are
+    used from memory for this process instead.
+    """
+    try:
+        index = CacheIndex.open(target, source)
+        if index.is_current():
+            return index
+        index.close()
+    except (OSError, ValueError, struct.error):
+        pass
+    try:
+        write_index(source, target)
+    except OSError:
+        st = os.stat(source)
+        return CacheIndex(compile_cache(load_cache(source), st.st_mtime_ns, st.st_size), source)
+    return CacheIndex.open(target, source)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 1 or sys.argv[1] in ("-f", "--force"):
+        data = write_index()
+        print(f"Compiled {CACHE_FILE} -> {INDEX_FILE} ({len(data)} bytes)")
+    else:
+        with open_index() as index:
+            for ext in sys.argv[1:]:
+                print(ext, index.lexer_for_extension(ext))
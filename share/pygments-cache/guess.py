@@ -0,0 +1,230 @@
+"""Fast lexer guessing from file names and content, backed by the cache.
+
+``pygments.lexers.guess_lexer`` runs every lexer's ``analyse_text`` over the
+input.  Most files we look at can be classified far more cheaply, so this
+tries, in order:
+
+1. the whole base name as a cache key (``Dockerfile``, ``.bashrc``,
+   ``PKGBUILD``)
+2. the extension
+3. the cached filename globs (``.bash_*``, ``Makefile.*``, ``*.[1-9]``),
+   matched with one precompiled regex
+4. a mimetype, if the caller has one
+5. the first line: ``#!`` interpreter (through ``env``), well-known magic
+   prefixes, and vim/emacs modelines in the first or last few lines read
+
+and only then falls back to pygments' full scan.
+"""
+import fnmatch
+import os
+import re
+import sys
+
+from resolver import get_index, load, lookup
+
+__all__ = [
+    "HEAD_SIZE",
+    "INTERPRETER_ALIASES",
+    "read_head",
+    "interpreter",
+    "classify_text",
+    "guess_lexer_entry",
+    "guess_lexer_class",
+    "guess_lexer",
+]
+
+HEAD_SIZE = 4096
+MODELINE_LINES = 5
+
+# Interpreters whose name isn't itself a pygments lexer alias
+INTERPRETER_ALIASES = {
+    "ash": "sh",
+    "dash": "sh",
+    "deno": "typescript",
+    "escript": "erlang",
+    "gawk": "awk",
+    "guile": "scheme",
+    "jython": "python",
+    "mawk": "awk",
+    "nawk": "awk",
+    "node": "javascript",
+    "nodejs": "javascript",
+    "osascript": "applescript",
+    "pypy": "python",
+    "pypy3": "python",
+    "Rscript": "splus",
+    "runghc": "haskell",
+    "runhaskell": "haskell",
+    "sbcl": "common-lisp",
+    "tclsh": "tcl",
+    "ts-node": "typescript",
+    "wish": "tcl",
+}
+
+MAGIC_PREFIXES = (
+    ("<?xml", "xml"),
+    ("<?php", "php"),
+    ("<!doctype html", "html"),
+    ("<html", "html"),
+    ("%yaml", "yaml"),
+    ("diff --git ", "diff"),
+)
+
+VIM_MODELINE = re.compile(r"(?:^|\s)(?:vi|vim|ex)(?:[<=>]?\d+)?:.*?\b(?:ft|filetype|syntax)=([\w+-]+)")
+EMACS_MODELINE = re.compile(r"-\*-\s*(?:.*?\bmode:\s*)?([\w+-]+)\s*(?:;.*?)?-\*-", re.IGNORECASE)
+VERSION_SUFFIX = re.compile(r"[\d.]+$")
+
+_globs = None
+
+
+def read_head(path, size=HEAD_SIZE):
+    """Return the first ``size`` bytes of ``path`` decoded leniently."""
+    with open(path, "rb") as f:
+        return f.read(size).decode("utf-8", errors="replace")
+
+
+def interpreter(first_line):
+    """Return the interpreter name from a ``#!`` line, or None."""
+    if not first_line.startswith("#!"):
+        return None
+    words = first_line[2:].split()
+    if not words:
+        return None
+    name = os.path.basename(words[0])
+    if name == "env":
+        words = [w for w in words[1:] if not w.startswith("-") and "=" not in w]
+        if not words:
+            return None
+        name = os.path.basename(words[0])
+    return name
+
+
+def _alias(name):
+    name = INTERPRETER_ALIASES.get(name, name)
+    return get_index().get("lexers", "aliases", name) and name
+
+
+def _interpreter_alias(name):
+    """Try ``python3.11``, then ``python3``... down to ``python``."""
+    while name:
+        alias = _alias(name) or _alias(name.lower())
+        if alias:
+            return alias
+        stripped = VERSION_SUFFIX.sub("", name)
+        if stripped == name:
+            stripped = name[:-1] if name[-1:].isdigit() else ""
+        name = stripped
+    return None
+
+
+def classify_text(text):
+    """Return a lexer alias for ``text`` from its first line or modelines."""
+    lines = text.splitlines()
+    if not lines:
+        return None
+    first = lines[0]
+    name = interpreter(first)
+    if name:
+        return _interpreter_alias(name)
+    lowered = first.lstrip().lower()
+    for prefix, alias in MAGIC_PREFIXES:
+        if lowered.startswith(prefix):
+            return alias
+    # "--- " alone also opens YAML documents and Lua/SQL comments
+    if first.startswith("--- ") and len(lines) > 1 and lines[1].startswith("+++ "):
+        return "diff"
+    for line in lines[:MODELINE_LINES] + lines[-MODELINE_LINES:]:
+        match = VIM_MODELINE.search(line) or EMACS_MODELINE.search(line)
+        if match and _alias(match.group(1)):
+            return _alias(match.group(1))
+    return None
+
+
+def _glob_pattern():
+    """Compile the cached globs into one regex, again if the index was rebuilt."""
+    global _globs
+    index = get_index()
+    if _globs is None or _globs[0] is not index:
+        patterns = [pattern for pattern, _ in index.items("lexers", "globs")]
+        regex = "|".join(f"(?P<g{i}>{fnmatch.translate(p)})" for i, p in enumerate(patterns))
+        _globs = (index, re.compile(regex) if patterns else None, patterns)
+    return _globs
+
+
+def _match_glob(basename):
+    _, regex, patterns = _glob_pattern()
+    match = regex and regex.match(basename)
+    if not match:
+        return None
+    return lookup("lexers", "globs", patterns[int(match.lastgroup[1:])])
+
+
+def guess_lexer_entry(filename=None, text=None, mimetype=None):
+    """Return the cached ``(module, class)`` entry for a file, or None.
+
+    This is every check short of pygments' own guessers, and imports no
+    lexer.  If ``text`` is None and ``filename`` exists, its head is read on
+    demand for the content checks.
+    """
+    if filename:
+        basename = os.path.basename(filename)
+        entry = (lookup("lexers", "exts", basename)
+                 or lookup("lexers", "exts", os.path.splitext(basename)[1])
+                 or _match_glob(basename))
+        if entry is not None:
+            return entry
+    if mimetype:
+        entry = lookup("lexers", "mimetypes", mimetype)
+        if entry is not None:
+            return entry
+    if text is None and filename:
+        try:
+            text = read_head(filename)
+        except OSError:
+            text = None
+    if text:
+        alias = classify_text(text)
+        if alias:
+            return lookup("lexers", "aliases", alias)
+    return None
+
+
+def guess_lexer_class(filename=None, text=None, mimetype=None, fallback=True):
+    """Return the lexer class for a file name and/or its text, or None.
+
+    With ``fallback`` the slow pygments guessers run when the cached checks
+    of guess_lexer_entry come up empty.
+    """
+    entry = guess_lexer_entry(filename, text, mimetype)
+    if entry is not None:
+        return load(entry)
+    if text is None and filename:
+        try:
+            text = read_head(filename)
+        except OSError:
+            text = None
+    if not fallback or not (text or filename):
+        return None
+    from pygments.lexers import guess_lexer as pygments_guess_lexer
+    from pygments.lexers import guess_lexer_for_filename
+    from pygments.util import ClassNotFound
+    if filename:
+        try:
+            return type(guess_lexer_for_filename(filename, text or ""))
+        except ClassNotFound:
+            pass
+    try:
+        return type(pygments_guess_lexer(text)) if text else None
+    except ClassNotFound:
+        return None
+
+
+def guess_lexer(filename=None, text=None, mimetype=None, fallback=True, **options):
+    """Like guess_lexer_class, but return a lexer instance."""
+    cls = guess_lexer_class(filename, text, mimetype, fallback)
+    return cls(**options) if cls is not None else None
+
+
+if __name__ == "__main__":
+    for path in sys.argv[1:]:
+        print(path, guess_lexer_class(path))
@@ -0,0 +1,237 @@
+"""Content-addressed on-disk cache of highlighted output.
+
+Rendered output is stored under ``output/`` next to the lookup cache, keyed
+by a hash of the source bytes, the lexer, formatter, style and options, so
+re-highlighting an unchanged file is a cache read instead of a lexing pass.
+
+Each entry also gets a second name keyed by the source file's path and
+``stat`` (inode, size, mtime).  That name is a hard link to the same data,
+so a repeat on an unchanged file needs one ``stat`` and one read, without
+reading or hashing the source.
+
+Entries are written atomically (temp file plus ``os.replace``) into
+two-character shard directories.  Reads touch the entry's mtime, and once
+the directory grows past ``max_bytes`` the least recently used entries are
+removed, down to OUTPUT_CACHE_EVICT_TO of the budget.  The size is kept as a
+running total, so a write only scans the directory when the total goes over
+budget, or every OUTPUT_CACHE_RESCAN_EVERY writes to account for other
+processes.
+"""
+import hashlib
+import os
+import sys
+import tempfile
+
+from guess import guess_lexer_class
+from resolver import formatter_class, style_class
+
+__all__ = [
+    "OUTPUT_CACHE_DIR",
+    "OUTPUT_CACHE_MAX_BYTES",
+    "OutputCache",
+    "output_cache",
+    "highlight_bytes",
+    "highlight_file",
+]
+
+OUTPUT_CACHE_DIR = os.environ.get(
+    "PYGMENTS_OUTPUT_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "output"))
+OUTPUT_CACHE_MAX_BYTES = int(os.environ.get("PYGMENTS_OUTPUT_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+OUTPUT_CACHE_VERSION = "1"
+# writes between full rescans, to pick up what other processes have added
+OUTPUT_CACHE_RESCAN_EVERY = 100
+# eviction goes down to this fraction of the budget, leaving room for more writes
+OUTPUT_CACHE_EVICT_TO = 0.9
+
+
+def _digest(*parts):
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _qualname(cls):
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+class OutputCache:
+    """A size-bounded directory of rendered outputs with LRU eviction."""
+
+    def __init__(self, directory=OUTPUT_CACHE_DIR, max_bytes=OUTPUT_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = None
+        self._writes = 0
+
+    def path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key):
+        """Return the cached bytes for ``key`` (refreshing its LRU age), or None."""
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, key, data, alias=None):
+        """Store ``data`` under ``key`` atomically; optionally hard link ``alias``."""
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        if alias is not None:
+            self.link(key, alias)
+        self._writes += 1
+        if self._size is None or self._writes % OUTPUT_CACHE_RESCAN_EVERY == 0:
+            self._size = self.size()
+        else:
+            # an overwritten entry is counted twice; the next scan corrects it
+            self._size += len(data)
+        if self._size > self.max_bytes:
+            self.evict(int(self.max_bytes * OUTPUT_CACHE_EVICT_TO))
+
+    def link(self, key, alias):
+        alias_path = self.path(alias)
+        os.makedirs(os.path.dirname(alias_path), exist_ok=True)
+        tmp = f"{alias_path}.{os.getpid()}.tmp"
+        try:
+            os.link(self.path(key), tmp)
+            os.replace(tmp, alias_path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+    def _entries(self):
+        try:
+            shards = list(os.scandir(self.directory))
+        except OSError:
+            return
+        for shard in shards:
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    yield entry.path, entry.stat()
+
+    def size(self):
+        """Total bytes used, counting hard-linked entries once."""
+        return sum({st.st_ino: st.st_size for _, st in self._entries()}.values())
+
+    def evict(self, max_bytes=None):
+        """Remove least recently used entries until under ``max_bytes``."""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self._entries(), key=lambda e: e[1].st_mtime_ns)
+        sizes = {st.st_ino: st.st_size for _, st in entries}
+        links = {}
+        for _, st in entries:
+            links[st.st_ino] = links.get(st.st_ino, 0) + 1
+        total = sum(sizes.values())
+        for path, st in entries:
+            if total <= limit:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            self.evictions += 1
+            links[st.st_ino] -= 1
+            if links[st.st_ino] == 0:
+                total -= sizes[st.st_ino]
+        self._size = total
+
+    def clear(self):
+        self.evict(0)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "bytes": self.size()}
+
+
+output_cache = OutputCache()
+
+
+def _render_key(source_digest, lexer_cls, formatter, style, options):
+    return _digest(OUTPUT_CACHE_VERSION, source_digest, _qualname(lexer_cls), formatter, style,
+                   sorted(options.items()))
+
+
+def _render(data, lexer_cls, formatter, style, options):
+    from pygments import highlight
+    formatter_cls = formatter_class(formatter)
+    if formatter_cls is None:
+        raise ValueError(f"unknown formatter {formatter!r}")
+    text = data.decode("utf-8", errors="replace")
+    lexer = lexer_cls(stripnl=False, ensurenl=False)
+    output = highlight(text, lexer, formatter_cls(style=style_class(style) or style, **options))
+    return output.encode("utf-8") if isinstance(output, str) else output
+
+
+def highlight_bytes(data, lexer_cls, formatter="terminal256", style="default", cache=output_cache,
+                    alias=None, **options):
+    """Highlight source ``data`` with ``lexer_cls``, going through ``cache``."""
+    key = _render_key(_digest(data), lexer_cls, formatter, style, options)
+    output = cache.get(key)
+    if output is None:
+        output = _render(data, lexer_cls, formatter, style, options)
+        cache.put(key, output, alias)
+    elif alias is not None:
+        # same content under a new stat (touch, checkout): point the new alias at it
+        cache.link(key, alias)
+    return output
+
+
+def highlight_file(path, lexer_cls=None, formatter="terminal256", style="default", cache=output_cache,
+                   **options):
+    """Return the highlighted bytes of ``path``.
+
+    An unchanged file hits the stat-keyed alias without being read; otherwise
+    it is read, hashed and rendered (or found by content) as usual.
+    """
+    st = os.stat(path)
+    alias = _digest("stat", os.path.abspath(path), st.st_ino, st.st_size, st.st_mtime_ns,
+                    _qualname(lexer_cls) if lexer_cls else "", formatter, style, sorted(options.items()))
+    output = cache.get(alias)
+    if output is not None:
+        return output
+    with open(path, "rb") as f:
+        data = f.read()
+    if lexer_cls is None:
+        lexer_cls = guess_lexer_class(path, data[:4096].decode("utf-8", errors="replace"))
+        if lexer_cls is None:
+            from pygments.lexers.special import TextLexer as lexer_cls
+    return highlight_bytes(data, lexer_cls, formatter, style, cache, alias, **options)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Highlight files through the output cache.")
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("-f", "--formatter", default="terminal256")
+    parser.add_argument("-s", "--style", default="default")
+    parser.add_argument("--clear", action="store_true", help="empty the cache")
+    parser.add_argument("--stats", action="store_true", help="print cache statistics to stderr")
+    args = parser.parse_args()
+    if args.clear:
+        output_cache.clear()
+    for name in args.files:
+        sys.stdout.buffer.write(highlight_file(name, formatter=args.formatter, style=args.style))
+    sys.stdout.flush()
+    if args.stats:
+        print(output_cache.stats(), file=sys.stderr)
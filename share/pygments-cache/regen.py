@@ -0,0 +1,326 @@
+"""Rebuild the pygments lookup cache from the installed pygments.
+
+``cache.py`` is a snapshot of pygments' lexer/formatter/style/filter tables
+taken against one pygments release.  ``build_cache`` rebuilds those tables
+from pygments' own ``_mapping`` modules and installed plugins, and
+``regenerate`` merges the result into the existing cache: entries that still
+resolve are kept as they are (so hand-picked winners for extensions claimed
+by several lexers survive), new ones are added and vanished ones dropped.
+The file is only rewritten when something changed.
+
+The first line of ``cache.py`` records the pygments version it was built
+against, so the fingerprint is committed along with the cache.
+``ensure_fresh`` compares it with the installed pygments, which costs
+reading one line and ``import pygments``, and rebuilds in a detached
+process when they differ, so that short-lived commands don't cut the
+rebuild off when they exit.  A cache with no recorded version (written by
+hand) is never rebuilt automatically; run this module to regenerate it.
+"""
+import atexit
+import importlib.util
+import os
+import pprint
+import subprocess
+import sys
+import threading
+import time
+
+from cacheindex import CACHE_FILE, INDEX_FILE, load_cache, write_index
+
+__all__ = [
+    "FINGERPRINT_PREFIX",
+    "fingerprint",
+    "read_fingerprint",
+    "is_stale",
+    "build_cache",
+    "diff_cache",
+    "regenerate",
+    "rebuild_if_stale",
+    "ensure_fresh",
+]
+
+FINGERPRINT_PREFIX = "# pygments "
+LOCK_FILE = os.path.splitext(CACHE_FILE)[0] + ".lock"
+LOCK_TIMEOUT = 600
+
+
+def fingerprint():
+    """Identify the installed pygments cheaply (its version)."""
+    import pygments
+    return pygments.__version__
+
+
+def read_fingerprint(path=CACHE_FILE):
+    """Return the pygments version ``path`` was built against, or None."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            line = f.readline()
+    except OSError:
+        return None
+    return line[len(FINGERPRINT_PREFIX):].strip() if line.startswith(FINGERPRINT_PREFIX) else None
+
+
+def is_stale(path=CACHE_FILE):
+    recorded = read_fingerprint(path)
+    return recorded is not None and recorded != fingerprint()
+
+
+def _plugins(group):
+    """Yield ``(entry point name, (module, attribute), loaded object)``.
+
+    The value is taken from the entry point itself: plugin classes built by
+    factories don't always carry a usable ``__module__``/``__name__``.
+    """
+    from pygments import plugin
+    try:
+        entry_points = list(plugin.iter_entry_points(group))
+    except Exception:
+        return
+    for entry_point in entry_points:
+        try:
+            yield entry_point.name, (entry_point.module, entry_point.attr), entry_point.load()
+        except Exception:
+            continue
+
+
+def _candidates():
+    """Map section -> kind -> key -> [(module, class), ...] in pygments order."""
+    from pygments.filters import FILTERS
+    from pygments.formatters._mapping import FORMATTERS
+    from pygments.lexers._mapping import LEXERS
+    from pygments.styles._mapping import STYLES
+
+    found = {
+        "lexers": {"exts": {}, "globs": {}, "aliases": {}, "mimetypes": {}},
+        "formatters": {"exts": {}, "names": {}},
+        "styles": {"names": {}},
+        "filters": {"names": {}},
+    }
+
+    def add(section, kind, key, value):
+        found[section][kind].setdefault(key, []).append(value)
+
+    def add_filenames(section, filenames, value):
+        for filename in filenames:
+            if section == "lexers" and any(c in filename for c in "*?[") and not (
+                    filename.startswith("*.") and not any(c in filename[2:] for c in "*?[")):
+                add(section, "globs", filename, value)
+            if filename.startswith("*."):
+                filename = filename[1:]
+            if "*" not in filename:
+                add(section, "exts", filename, value)
+
+    def add_lexer(value, aliases, filenames, mimetypes):
+        add_filenames("lexers", filenames, value)
+        for alias in aliases:
+            add("lexers", "aliases", alias, value)
+        for mimetype in mimetypes:
+            add("lexers", "mimetypes", mimetype, value)
+
+    for cls, (module, _, aliases, filenames, mimetypes) in LEXERS.items():
+        add_lexer((module, cls), aliases, filenames, mimetypes)
+    for _, value, lexer in _plugins("pygments.lexers"):
+        add_lexer(value, lexer.aliases, lexer.filenames, lexer.mimetypes)
+
+    for cls, (module, name, aliases, filenames, _) in FORMATTERS.items():
+        for key in (name, *aliases):
+            add("formatters", "names", key, (module, cls))
+        add_filenames("formatters", filenames, (module, cls))
+    for _, value, formatter in _plugins("pygments.formatters"):
+        for key in (formatter.name, *formatter.aliases):
+            add("formatters", "names", key, value)
+        add_filenames("formatters", formatter.filenames, value)
+
+    for cls, (module, name, _) in STYLES.items():
+        add("styles", "names", name, (module, cls))
+    for name, value, _ in _plugins("pygments.styles"):
+        add("styles", "names", name, value)
+
+    for name, cls in FILTERS.items():
+        add("filters", "names", name, (cls.__module__, cls.__name__))
+    for name, value, _ in _plugins("pygments.filters"):
+        add("filters", "names", name, value)
+    return found
+
+
+def _resolves(entry):
+    import importlib
+    try:
+        return getattr(importlib.import_module(entry[0]), entry[1])
+    except Exception:
+        return None
+
+
+def _keeps(entry):
+    """Whether a key pygments doesn't list should stay in the cache.
+
+    It stays while its class imports, and also when its package isn't
+    installed here at all: a third-party lexer (``xonsh``, say) is missing
+    from this environment, not gone.
+    """
+    if _resolves(entry) is not None:
+        return True
+    top = entry[0].partition(".")[0]
+    try:
+        return top != "pygments" and importlib.util.find_spec(top) is None
+    except (ImportError, ValueError):
+        return False
+
+
+def _choose(old, values):
+    if old in values:
+        return old
+    cls = _resolves(old) if old is not None else None
+    if cls is not None:
+        if any(_resolves(value) is cls for value in values):
+            return old
+    return values[-1]
+
+
+def build_cache(previous=None):
+    """Return a fresh cache dict, keeping ``previous`` choices that still hold.
+
+    When several classes claim a key the last one pygments lists wins, unless
+    ``previous`` already maps the key to one of the claimants (or to an alias
+    of one).  Keys pygments doesn't know about, such as hand-added entries
+    for third-party lexers, are kept as long as their class still imports or
+    their package isn't installed here.
+    """
+    previous = previous or {}
+    cache = {}
+    for section, kinds in _candidates().items():
+        for kind, entries in kinds.items():
+            old = previous.get(section, {}).get(kind, {})
+            current = {key: _choose(old.get(key), values) for key, values in entries.items()}
+            current.update((key, value) for key, value in old.items()
+                           if key not in current and _keeps(value))
+            cache.setdefault(section, {})[kind] = current
+    return cache
+
+
+def diff_cache(old, new):
+    """Return ``(added, changed, removed)`` lists of ``(section, kind, key)``."""
+    added, changed, removed = [], [], []
+    for section in sorted(set(old) | set(new)):
+        for kind in sorted(set(old.get(section, {})) | set(new.get(section, {}))):
+            before = old.get(section, {}).get(kind, {})
+            after = new.get(section, {}).get(kind, {})
+            added += [(section, kind, key) for key in sorted(after.keys() - before.keys())]
+            removed += [(section, kind, key) for key in sorted(before.keys() - after.keys())]
+            changed += [(section, kind, key) for key in sorted(before.keys() & after.keys())
+                        if before[key] != after[key]]
+    return added, changed, removed
+
+
+def _write_atomic(path, text):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def regenerate(source=CACHE_FILE, target=INDEX_FILE):
+    """Bring ``source`` in line with the installed pygments; return the diff."""
+    try:
+        old = load_cache(source)
+    except (OSError, SyntaxError, ValueError):
+        old = {}
+    new = build_cache(old)
+    added, changed, removed = diff = diff_cache(old, new)
+    if added or changed or removed or read_fingerprint(source) != fingerprint():
+        _write_atomic(source, f"{FINGERPRINT_PREFIX}{fingerprint()}\n{pprint.pformat(new)}\n")
+        write_index(source, target)
+    return diff
+
+
+def _acquire_lock(path=LOCK_FILE):
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        try:
+            if time.time() - os.stat(path).st_mtime < LOCK_TIMEOUT:
+                return False
+            os.unlink(path)
+        except OSError:
+            return False
+        return _acquire_lock(path)
+    except OSError:
+        return False
+    os.close(fd)
+    # released even if the process exits some other way than through rebuild()
+    atexit.register(_release_lock, path)
+    return True
+
+
+def _release_lock(path=LOCK_FILE):
+    atexit.unregister(_release_lock)
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _locked(path=LOCK_FILE):
+    try:
+        return time.time() - os.stat(path).st_mtime < LOCK_TIMEOUT
+    except OSError:
+        return False
+
+
+def rebuild_if_stale():
+    """Regenerate under the lock if the cache is stale; return the diff or None."""
+    if not is_stale() or not _acquire_lock():
+        return None
+    try:
+        return regenerate()
+    finally:
+        _release_lock()
+
+
+def ensure_fresh(on_rebuilt=None, background=True):
+    """Rebuild the cache if it was built against a different pygments.
+
+    In the background the rebuild runs in a detached process that outlives
+    this one, and the ``subprocess.Popen`` is returned.  Returns None when
+    the cache is current, another process is already rebuilding, or
+    ``background`` is False.  ``on_rebuilt`` is called with the diff once
+    the rebuild has finished (with None from a background rebuild, and only
+    if this process is still running by then).
+    """
+    if not is_stale() or _locked():
+        return None
+    if not background:
+        diff = rebuild_if_stale()
+        if diff is not None and on_rebuilt is not None:
+            on_rebuilt(diff)
+        return None
+    process = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--if-stale"], cwd=os.path.dirname(os.path.abspath(__file__)),
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    if on_rebuilt is not None:
+        def wait():
+            if process.wait() == 0:
+                on_rebuilt(None)
+
+        threading.Thread(target=wait, name="pygments-cache-regen", daemon=True).start()
+    return process
+
+
+if __name__ == "__main__":
+    if "--if-stale" in sys.argv:
+        rebuild_if_stale()
+        sys.exit()
+    dry_run = "-n" in sys.argv or "--dry-run" in sys.argv
+    if dry_run:
+        added, changed, removed = diff_cache(load_cache(), build_cache(load_cache()))
+    else:
+        added, changed, removed = regenerate()
+    for label, keys in (("+", added), ("~", changed), ("-", removed)):
+        for section, kind, key in keys:
+            print(f"{label} {section}/{kind}/{key}")
+    print(f"{len(added)} added, {len(changed)} changed, {len(removed)} removed"
+          f"{' (dry run)' if dry_run else ''}")
@@ -0,0 +1,136 @@
+"""Lazy class resolution on top of the compiled pygments cache.
+
+Looking a lexer up through ``pygments.lexers.get_lexer_for_filename`` loads
+pygments' whole lexer mapping and, on a miss, every installed plugin.  Here a
+lookup goes through the compiled cache index instead and imports only the one
+module the entry points at.  Resolved classes are kept in a bounded LRU for
+the life of the process, and a configured set of common languages can be
+resolved ahead of time in a background thread.
+"""
+import importlib
+import os
+import sys
+import threading
+from functools import lru_cache
+
+from cacheindex import open_index
+from regen import ensure_fresh
+
+__all__ = [
+    "RESOLVER_CACHE_SIZE",
+    "PREWARM_EXTENSIONS",
+    "get_index",
+    "lookup",
+    "load",
+    "resolve",
+    "lexer_class_for_extension",
+    "lexer_class_for_filename",
+    "lexer_for_filename",
+    "formatter_class",
+    "style_class",
+    "filter_class",
+    "prewarm",
+]
+
+RESOLVER_CACHE_SIZE = 128
+PREWARM_EXTENSIONS = tuple(
+    os.environ.get("PYGMENTS_CACHE_PREWARM", ".py,.sh,.json,.toml,.yaml,.md,.txt").split(",")
+)
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index():
+    """Return the process-wide compiled cache index, opening it on first use.
+
+    Opening also checks the cache against the installed pygments; a stale
+    cache keeps serving lookups while a separate process rebuilds it.
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = open_index()
+                ensure_fresh(on_rebuilt=_reset)
+    return _index
+
+
+def _reset(diff=None):
+    global _index
+    with _index_lock:
+        _index = None
+    _load.cache_clear()
+
+
+@lru_cache(maxsize=RESOLVER_CACHE_SIZE)
+def _load(module, name):
+    return getattr(importlib.import_module(module), name)
+
+
+def lookup(section, kind, key):
+    """Return the ``(module, class)`` entry under ``section/kind/key``, or None."""
+    return get_index().get(section, kind, key)
+
+
+def load(entry):
+    """Import and return the class for a ``(module, class)`` entry."""
+    return _load(*entry) if entry is not None else None
+
+
+def resolve(section, kind, key):
+    """Return the class cached under ``section/kind/key``, or None."""
+    return load(lookup(section, kind, key))
+
+
+def lexer_class_for_extension(ext):
+    return resolve("lexers", "exts", ext)
+
+
+def lexer_class_for_filename(filename):
+    return lexer_class_for_extension(os.path.splitext(filename)[1])
+
+
+def lexer_for_filename(filename, **options):
+    """Return a lexer instance for ``filename``, or None if it isn't cached."""
+    cls = lexer_class_for_filename(filename)
+    return cls(**options) if cls is not None else None
+
+
+def formatter_class(name):
+    return resolve("formatters", "names", name)
+
+
+def style_class(name):
+    return resolve("styles", "names", name)
+
+
+def filter_class(name):
+    return resolve("filters", "names", name)
+
+
+def prewarm(extensions=PREWARM_EXTENSIONS, background=True):
+    """Resolve the lexers for ``extensions`` so first use doesn't pay the import.
+
+    Runs in a daemon thread unless ``background`` is False; returns the thread
+    (or None when run inline).
+    """
+    def warm():
+        for ext in extensions:
+            try:
+                lexer_class_for_extension(ext)
+            except (ImportError, AttributeError):
+                pass
+
+    if not background:
+        warm()
+        return None
+    thread = threading.Thread(target=warm, name="pygments-cache-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+if __name__ == "__main__":
+    for filename in sys.argv[1:]:
+        print(filename, lexer_class_for_filename(filename))
+    print(_load.cache_info())
@@ -0,0 +1,149 @@
+"""Streaming, chunked highlighting for very large files.
+
+``pygments.highlight`` wants the whole text as one string.  Here the file is
+mmap'ed (or read in blocks when it isn't seekable) and cut into chunks on
+line boundaries.  For line-oriented lexers (LINE_ORIENTED_LEXERS), where no
+lexer state or token crosses a newline, each chunk is tokenized on its own.
+All chunks feed one lazy token stream into a single ``formatter.format``
+call, which keeps memory flat and emits one header/footer for HTML and the
+like.  Output is flushed after every
+chunk, and the first chunk is kept small, so a pager shows the top of the
+file straight away.
+
+Lexers that carry state across lines (most programming languages) can't be
+split safely.  They get the whole text in one call, with output still
+written incrementally.
+"""
+import io
+import mmap
+import os
+import sys
+
+from guess import guess_lexer_class
+from resolver import formatter_class, lookup, load, style_class
+
+__all__ = [
+    "STREAM_FIRST_CHUNK",
+    "STREAM_CHUNK_SIZE",
+    "LINE_ORIENTED_LEXERS",
+    "is_line_oriented",
+    "iter_chunks",
+    "highlight_stream",
+]
+
+STREAM_FIRST_CHUNK = 16 * 1024
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Lexers checked by hand to have no state and no pattern that outlive a line.
+# Having a single state isn't enough: a root-only lexer can still match a
+# multi-line comment or string in one pattern (GoLexer, TypeScriptLexer).
+LINE_ORIENTED_LEXERS = {
+    "pygments.lexers.special.TextLexer",
+    "pygments.lexers.configs.IniLexer",
+    "pygments.lexers.configs.PropertiesLexer",
+    "pygments.lexers.configs.DesktopLexer",
+    "pygments.lexers.configs.PacmanConfLexer",
+    "pygments.lexers.configs.UnixConfigLexer",
+    "pygments.lexers.console.VCTreeStatusLexer",
+    "pygments.lexers.diff.DiffLexer",
+    "pygments.lexers.textfmts.GettextLexer",
+    "pygments.lexers.textfmts.IrcLogsLexer",
+    "pygments.lexers.textfmts.KernelLogLexer",
+    "pygments.lexers.textfmts.TodotxtLexer",
+    "pygments.lexers.wowtoc.WoWTocLexer",
+    "pygments.lexers.xorg.XorgLexer",
+}
+
+
+def is_line_oriented(lexer_cls):
+    """True if ``lexer_cls`` can tokenize a file one block of lines at a time."""
+    return f"{lexer_cls.__module__}.{lexer_cls.__name__}" in LINE_ORIENTED_LEXERS
+
+
+def _mmap_chunks(f, first, size):
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start, want, end = 0, first, len(mm)
+        while start < end:
+            stop = min(start + want, end)
+            if stop < end:
+                newline = mm.rfind(b"\n", start, stop)
+                stop = newline + 1 if newline >= start else (mm.find(b"\n", stop) + 1 or end)
+            yield mm[start:stop]
+            start, want = stop, size
+
+
+def _stream_chunks(f, first, size):
+    pending = b""
+    want = first
+    while True:
+        block = f.read(want)
+        if not block:
+            break
+        pending += block
+        newline = pending.rfind(b"\n")
+        if newline >= 0:
+            yield pending[:newline + 1]
+            pending = pending[newline + 1:]
+        want = size
+    if pending:
+        yield pending
+
+
+def iter_chunks(f, first=STREAM_FIRST_CHUNK, size=STREAM_CHUNK_SIZE):
+    """Yield byte chunks of binary file ``f``, each ending on a newline."""
+    try:
+        if os.fstat(f.fileno()).st_size > 0:
+            yield from _mmap_chunks(f, first, size)
+            return
+    except (OSError, ValueError, io.UnsupportedOperation):
+        pass
+    yield from _stream_chunks(f, first, size)
+
+
+def _tokens(chunks, lexer, outfile, encoding):
+    for chunk in chunks:
+        yield from lexer.get_tokens(chunk.decode(encoding, errors="replace"))
+        outfile.flush()
+
+
+def highlight_stream(infile, outfile, lexer_cls=None, formatter="terminal256", style="default",
+                     filename=None, encoding="utf-8", **options):
+    """Highlight binary file ``infile`` into text file ``outfile`` incrementally."""
+    if lexer_cls is None:
+        # pygments' own guessers score content and can pick anything for a plain log
+        lexer_cls = guess_lexer_class(filename, fallback=False) if filename else None
+        lexer_cls = lexer_cls or load(("pygments.lexers.special", "TextLexer"))
+    formatter_cls = formatter_class(formatter)
+    if formatter_cls is None:
+        raise ValueError(f"unknown formatter {formatter!r}")
+    formatter_obj = formatter_cls(style=style_class(style) or style, **options)
+    lexer = lexer_cls(stripnl=False, ensurenl=False)
+    if is_line_oriented(lexer_cls):
+        chunks = iter_chunks(infile)
+    else:
+        chunks = [infile.read()]
+    formatter_obj.format(_tokens(chunks, lexer, outfile, encoding), outfile)
+    outfile.flush()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Highlight a (large) file incrementally.")
+    parser.add_argument("file", nargs="?", help="file to highlight, stdin if omitted")
+    parser.add_argument("-l", "--lexer", help="lexer alias, guessed from the file name if omitted")
+    parser.add_argument("-f", "--formatter", default="terminal256")
+    parser.add_argument("-s", "--style", default="default")
+    args = parser.parse_args()
+    lexer_cls = load(lookup("lexers", "aliases", args.lexer)) if args.lexer else None
+    if args.lexer and lexer_cls is None:
+        parser.error(f"unknown lexer {args.lexer!r}")
+    try:
+        if args.file:
+            with open(args.file, "rb") as infile:
+                highlight_stream(infile, sys.stdout, lexer_cls, args.formatter, args.style, args.file)
+        else:
+            highlight_stream(sys.stdin.buffer, sys.stdout, lexer_cls, args.formatter, args.style)
+    except BrokenPipeError:
+        # the pager quit early; keep Python from complaining on exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())